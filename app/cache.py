@@ -0,0 +1,67 @@
+"""
+Content Intelligence Platform - In-Process Caches
+
+Small TTL cache for serialized responses that are expensive to build but
+tolerate a few seconds of staleness (dashboard aggregates, leaderboards).
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+class TTLCache:
+    """Bounded mapping whose entries expire ttl_seconds after being stored
+
+    Not thread-safe by design: it is only touched from the event loop. A miss
+    whose builder is awaited (e.g. run in a worker thread) may be computed by
+    more than one concurrent request; that costs duplicate work, never a wrong
+    or torn entry. Route such builders through a RequestCoalescer to share one.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value for key, or None if it is missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl_seconds:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value, evicting the oldest entry when the cache is full"""
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[key] = (time.monotonic(), value)
+
+    def clear(self) -> None:
+        """Drop all entries (call after writes that change the cached data)"""
+        self._entries.clear()
+
+class RequestCoalescer:
+    """Fold concurrent builds of the same key into one shared task
+
+    The first caller for a key starts build(); callers that arrive while it is
+    running await that task instead of starting their own, so N simultaneous
+    misses cost one database round trip. Keys are held only while a build is
+    in flight; results belong in a TTLCache. Event-loop only, like TTLCache.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+
+    async def run(self, key: Hashable, build: Callable[[], Awaitable[Any]]) -> Any:
+        """Return build()'s result, joining an in-flight build for key if there is one"""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(build())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded so one caller disconnecting does not cancel the build the others await
+        return await asyncio.shield(task)
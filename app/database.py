@@ -1,25 +1,86 @@
-from sqlalchemy import create_engine, MetaData
+import time
+from typing import AsyncGenerator, Generator
+from sqlalchemy import create_engine, MetaData, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import QueuePool, NullPool
 from app.config import DATABASE_CONFIG
 import structlog
 
 logger = structlog.get_logger()
 
-# Create database engine
-engine = create_engine(
-    DATABASE_CONFIG["url"],
-    poolclass=QueuePool,
-    pool_size=DATABASE_CONFIG["pool_size"],
-    max_overflow=DATABASE_CONFIG["max_overflow"],
-    pool_timeout=DATABASE_CONFIG["pool_timeout"],
-    pool_recycle=DATABASE_CONFIG["pool_recycle"],
-    echo=False,  # Set to True for SQL debugging
-)
+# Cached public table count for health checks: (monotonic timestamp, value)
+TABLE_COUNT_TTL_SECONDS = 60
+_table_count_cache = (0.0, None)
+
+def _create_engine(url: str):
+    """Create a sync engine with the configured pool"""
+    if DATABASE_CONFIG["pool_size"] > 0:
+        return create_engine(
+            url,
+            poolclass=QueuePool,
+            pool_size=DATABASE_CONFIG["pool_size"],
+            max_overflow=DATABASE_CONFIG["max_overflow"],
+            pool_timeout=DATABASE_CONFIG["pool_timeout"],
+            pool_recycle=DATABASE_CONFIG["pool_recycle"],
+            pool_pre_ping=DATABASE_CONFIG["pool_pre_ping"],  # Transparently replace connections dropped by the server
+            query_cache_size=DATABASE_CONFIG["query_cache_size"],
+            echo=False,  # Set to True for SQL debugging
+        )
+    
+    # No pooling: each checkout opens a fresh connection (serverless/FaaS deployments)
+    return create_engine(
+        url,
+        poolclass=NullPool,
+        pool_pre_ping=DATABASE_CONFIG["pool_pre_ping"],
+        query_cache_size=DATABASE_CONFIG["query_cache_size"],
+        echo=False,
+    )
+
+def _create_async_engine(url: str):
+    """Create an asyncpg engine (AsyncAdaptedQueuePool with its own share of the connection budget)"""
+    if DATABASE_CONFIG["pool_size"] > 0:
+        return create_async_engine(
+            url,
+            pool_size=DATABASE_CONFIG["async_pool_size"],
+            max_overflow=DATABASE_CONFIG["async_max_overflow"],
+            pool_timeout=DATABASE_CONFIG["pool_timeout"],
+            pool_recycle=DATABASE_CONFIG["pool_recycle"],
+            pool_pre_ping=DATABASE_CONFIG["pool_pre_ping"],
+            query_cache_size=DATABASE_CONFIG["query_cache_size"],
+            echo=False,
+        )
+    
+    return create_async_engine(
+        url,
+        poolclass=NullPool,
+        pool_pre_ping=DATABASE_CONFIG["pool_pre_ping"],
+        query_cache_size=DATABASE_CONFIG["query_cache_size"],
+        echo=False,
+    )
+
+# Create database engines
+engine = _create_engine(DATABASE_CONFIG["url"])
+# Async engine (asyncpg) for handlers that await their queries instead of blocking the loop
+async_engine = _create_async_engine(DATABASE_CONFIG["async_url"])
+
+# Read-only GET routes use a replica when one is configured, keeping analytics reads
+# out of the primary's pool; without one they fall back to the primary engines
+if DATABASE_CONFIG["replica_url"]:
+    read_engine = _create_engine(DATABASE_CONFIG["replica_url"])
+    async_read_engine = _create_async_engine(DATABASE_CONFIG["async_replica_url"])
+else:
+    read_engine = engine
+    async_read_engine = async_engine
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: committed objects keep their loaded state, so reading them
+# while building the response does not trigger a fresh SELECT per object
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=read_engine)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
 
 # Create base class for models
 Base = declarative_base()
@@ -27,45 +88,68 @@ Base = declarative_base()
 # Metadata for database operations
 metadata = MetaData()
 
-def get_db() -> Session:
-    """Get database session"""
-    db = SessionLocal()
-    try:
+def get_db() -> Generator[Session, None, None]:
+    """Get database session (rolled back on error, always closed)"""
+    with SessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            db.rollback()
+            raise
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session (rolled back on error, always closed)"""
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+
+def get_db_ro() -> Generator[Session, None, None]:
+    """Get read-only database session (replica when configured, always closed)"""
+    with ReadSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
-def init_db():
-    """Initialize database tables"""
-    try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
-    except Exception as e:
-        logger.error("Failed to create database tables", error=str(e))
-        raise
+async def get_async_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """Get read-only async database session (replica when configured, always closed)"""
+    async with AsyncReadSessionLocal() as db:
+        yield db
 
 def check_db_connection():
     """Check database connection"""
     try:
         with engine.connect() as connection:
-            connection.execute("SELECT 1")
+            connection.execute(text("SELECT 1"))
         logger.info("Database connection successful")
         return True
     except Exception as e:
         logger.error("Database connection failed", error=str(e))
         return False
 
+def _get_table_count(connection) -> int:
+    """Get the number of public tables, re-querying the catalog only after the TTL expires"""
+    global _table_count_cache
+    
+    cached_at, table_count = _table_count_cache
+    now = time.monotonic()
+    if table_count is None or now - cached_at >= TABLE_COUNT_TTL_SECONDS:
+        result = connection.execute(text("SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = 'public'"))
+        table_count = result.scalar()
+        _table_count_cache = (now, table_count)
+    
+    return table_count
+
 # Database health check
 def get_db_health():
     """Get database health status"""
     try:
         with engine.connect() as connection:
             # Check basic connectivity
-            connection.execute("SELECT 1")
+            connection.execute(text("SELECT 1"))
             
-            # Check table count
-            result = connection.execute("SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = 'public'")
-            table_count = result.scalar()
+            # Check table count (catalog scan is cached for TABLE_COUNT_TTL_SECONDS)
+            table_count = _get_table_count(connection)
             
             return {
                 "status": "healthy",
@@ -76,8 +160,8 @@ def get_db_health():
             }
     except Exception as e:
         logger.error("Database health check failed", error=str(e))
+        # Driver errors can include host and DSN details; they stay in the log
         return {
             "status": "unhealthy",
-            "connection": "disconnected",
-            "error": str(e)
+            "connection": "disconnected"
         } 
\ No newline at end of file
@@ -1,24 +1,41 @@
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+import asyncio
+import logging
+import orjson
 import structlog
 import time
 from contextlib import asynccontextmanager
-from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
 
-from app.config import settings
-from app.database import engine, Base
-from app.models import auth, content, feedback
+from app.config import get_settings
+from app.middleware.RequestLoggingMiddleware import RequestLoggingMiddleware
 from app.routers import auth_router, content_router, feedback_router, metrics_router
-from app.middleware import RequestLoggingMiddleware
 
-# Prometheus metrics
-REQUEST_COUNT = Counter('http_requests_total', 'Total HTTP requests', ['method', 'endpoint', 'status'])
-REQUEST_LATENCY = Histogram('http_request_duration_seconds', 'HTTP request latency')
+settings = get_settings()
 
-# Structured logging
+# Structured logging (JSON rendered with orjson, written as bytes)
+structlog.configure(
+    processors=[
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.processors.JSONRenderer(serializer=orjson.dumps)
+        if settings.log_format == "json"
+        else structlog.dev.ConsoleRenderer(),
+    ],
+    logger_factory=(
+        structlog.BytesLoggerFactory()
+        if settings.log_format == "json"
+        else structlog.PrintLoggerFactory()
+    ),
+    # Calls below LOG_LEVEL return before any processor or kwargs formatting runs
+    wrapper_class=structlog.make_filtering_bound_logger(logging.getLevelName(settings.log_level.upper())),
+    cache_logger_on_first_use=True,
+)
 logger = structlog.get_logger()
 
 @asynccontextmanager
@@ -27,36 +44,60 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Content Intelligence Platform")
     
-    # Create database tables
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created")
+    # Create database tables (local development only; migrations own the schema elsewhere)
+    if settings.auto_create_tables:
+        from app.database import engine, Base
+        
+        Base.metadata.create_all(bind=engine)
+        logger.info("Database tables created")
+    
+    # Seed users are bcrypt-hashed once; do it in a worker thread now rather than on
+    # the event loop inside the first authenticated request
+    from app.services.auth_service import auth_service
+    
+    await asyncio.to_thread(auth_service.load_users)
+    
+    # Background psutil sampling for /metrics/health
+    system_sampler = asyncio.create_task(metrics_router.sample_system_health())
     
     yield
     
     # Shutdown
     logger.info("Shutting down Content Intelligence Platform")
+    
+    system_sampler.cancel()
+    
+    # Close pooled asyncpg connections cleanly instead of leaving them to GC
+    from app.database import async_engine, async_read_engine
+    
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
 
 # Create FastAPI app
 app = FastAPI(
     title="Content Intelligence Platform",
     description="A comprehensive data platform for content performance and ROI analysis",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Add middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
+    allow_origins=settings.cors_origins,
+    allow_credentials=settings.cors_credentials,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-app.add_middleware(TrustedHostMiddleware, allowed_hosts=["*"])
+# A "*" allowlist makes TrustedHostMiddleware a pass-through, so only add it when restricted
+if "*" not in settings.allowed_hosts:
+    app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.allowed_hosts)
 app.add_middleware(RequestLoggingMiddleware)
 
-# Include routers
+# Include routers (at import, so re-entering the lifespan cannot register them twice)
 app.include_router(auth_router.router, prefix="/auth", tags=["Authentication"])
 app.include_router(content_router.router, prefix="/v1", tags=["Content"])
 app.include_router(feedback_router.router, prefix="/v1", tags=["Feedback"])
@@ -95,7 +136,7 @@ async def get_docs():
 async def global_exception_handler(request, exc):
     """Global exception handler"""
     logger.error("Unhandled exception", exc_info=exc, request_path=request.url.path)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -103,40 +144,6 @@ async def global_exception_handler(request, exc):
         }
     )
 
-# Request logging middleware
-@app.middleware("http")
-async def log_requests(request, call_next):
-    """Log all requests and responses"""
-    start_time = time.time()
-    
-    # Process request
-    response = await call_next(request)
-    
-    # Calculate latency
-    latency = time.time() - start_time
-    
-    # Log request
-    logger.info(
-        "HTTP request",
-        method=request.method,
-        url=str(request.url),
-        status_code=response.status_code,
-        latency=latency,
-        user_agent=request.headers.get("user-agent"),
-        client_ip=request.client.host if request.client else None
-    )
-    
-    # Update Prometheus metrics
-    REQUEST_COUNT.labels(
-        method=request.method,
-        endpoint=request.url.path,
-        status=response.status_code
-    ).inc()
-    
-    REQUEST_LATENCY.observe(latency)
-    
-    return response
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Content Intelligence Platform - Prometheus Metrics
+
+Shared Prometheus collectors used by the application and its middleware.
+"""
+
+from random import random
+from prometheus_client import Counter, Histogram
+
+from app.config import settings
+
+# HTTP request metrics
+REQUEST_COUNT = Counter('http_requests_total', 'Total HTTP requests', ['method', 'endpoint', 'status'])
+REQUEST_LATENCY = Histogram('http_request_duration_seconds', 'HTTP request latency')
+
+def log_sampled() -> bool:
+    """Whether to emit the info log for this successful request
+
+    Exact request counts come from REQUEST_COUNT, so success-path logs only
+    need to be a representative sample.
+    """
+    return random() < settings.log_sample_rate
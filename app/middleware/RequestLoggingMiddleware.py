@@ -6,14 +6,28 @@ Provides structured logging for all HTTP requests with performance metrics.
 
 import time
 import json
+import logging
 import structlog
 from typing import Callable
+from uuid import uuid4
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from app.config import settings
+from app.metrics import REQUEST_COUNT, REQUEST_LATENCY, log_sampled
+
 logger = structlog.get_logger()
 
+# Headers whose values must never be written to logs
+_SENSITIVE_HEADERS = frozenset((
+    "authorization", "cookie", "x-api-key", "x-auth-token",
+    "x-forwarded-for", "x-real-ip"
+))
+
+# The request-start log only goes out at DEBUG; skip building its fields otherwise
+_DEBUG_ENABLED = logging.getLevelName(settings.log_level.upper()) <= logging.DEBUG
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for logging HTTP requests with structured data"""
     
@@ -22,43 +36,55 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and log details"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Extract request details
-        request_id = self._generate_request_id()
+        request_id = uuid4().hex
         method = request.method
         url = str(request.url)
         client_ip = self._get_client_ip(request)
         user_agent = request.headers.get("user-agent", "")
         
-        # Log request start
-        logger.info(
-            "Request started",
-            request_id=request_id,
-            method=method,
-            url=url,
-            client_ip=client_ip,
-            user_agent=user_agent,
-            headers=self._sanitize_headers(request.headers)
-        )
+        # Log request start (debug only; the completion log carries the same fields)
+        if _DEBUG_ENABLED:
+            logger.debug(
+                "Request started",
+                request_id=request_id,
+                method=method,
+                url=url,
+                client_ip=client_ip,
+                user_agent=user_agent,
+                headers=self._sanitize_headers(request.headers)
+            )
         
         # Process request
         try:
             response = await call_next(request)
             
             # Calculate processing time
-            process_time = time.time() - start_time
+            process_time = time.perf_counter() - start_time
             
-            # Log successful response
-            logger.info(
-                "Request completed",
-                request_id=request_id,
+            # Log the response (error statuses always, successes sampled)
+            if response.status_code >= 400 or log_sampled():
+                logger.info(
+                    "Request completed",
+                    request_id=request_id,
+                    method=method,
+                    url=url,
+                    client_ip=client_ip,
+                    user_agent=user_agent,
+                    status_code=response.status_code,
+                    process_time_ms=round(process_time * 1000, 2),
+                    response_size=self._get_response_size(response)
+                )
+            
+            # Update Prometheus metrics
+            REQUEST_COUNT.labels(
                 method=method,
-                url=url,
-                status_code=response.status_code,
-                process_time_ms=round(process_time * 1000, 2),
-                response_size=self._get_response_size(response)
-            )
+                endpoint=request.url.path,
+                status=response.status_code
+            ).inc()
+            REQUEST_LATENCY.observe(process_time)
             
             # Add response headers for tracking
             response.headers["X-Request-ID"] = request_id
@@ -68,7 +94,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             
         except Exception as e:
             # Calculate processing time
-            process_time = time.time() - start_time
+            process_time = time.perf_counter() - start_time
             
             # Log error
             logger.error(
@@ -84,11 +110,6 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             # Re-raise the exception
             raise
     
-    def _generate_request_id(self) -> str:
-        """Generate unique request ID"""
-        import uuid
-        return str(uuid.uuid4())
-    
     def _get_client_ip(self, request: Request) -> str:
         """Extract client IP address from request"""
         # Check for forwarded headers first
@@ -106,29 +127,12 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     
     def _sanitize_headers(self, headers) -> dict:
         """Sanitize headers for logging (remove sensitive data)"""
-        sensitive_headers = {
-            "authorization", "cookie", "x-api-key", "x-auth-token",
-            "x-forwarded-for", "x-real-ip"
+        return {
+            key: "[REDACTED]" if key.lower() in _SENSITIVE_HEADERS else value
+            for key, value in headers.items()
         }
-        
-        sanitized = {}
-        for key, value in headers.items():
-            if key.lower() in sensitive_headers:
-                sanitized[key] = "[REDACTED]"
-            else:
-                sanitized[key] = value
-        
-        return sanitized
     
     def _get_response_size(self, response: Response) -> int:
-        """Get response size in bytes"""
-        try:
-            # Try to get content length from headers
-            content_length = response.headers.get("content-length")
-            if content_length:
-                return int(content_length)
-            
-            # For streaming responses, we can't determine size easily
-            return -1
-        except (ValueError, TypeError):
-            return -1 
\ No newline at end of file
+        """Get response size in bytes (-1 when unknown, e.g. streaming responses)"""
+        content_length = response.headers.get("content-length")
+        return int(content_length) if content_length and content_length.isdigit() else -1
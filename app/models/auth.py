@@ -1,7 +1,8 @@
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints, field_validator
+from typing import Annotated, Optional, List, FrozenSet
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 
 class UserRole(str, Enum):
     """User roles for RBAC"""
@@ -10,35 +11,55 @@ class UserRole(str, Enum):
     MARKETING_USER = "marketing_user"
     READ_ONLY = "read_only"
 
+# Constrained string types (validated by pydantic-core without per-field constraint metadata)
+Username = Annotated[str, StringConstraints(min_length=3, max_length=50)]
+FullName = Annotated[str, StringConstraints(min_length=2, max_length=100)]
+Password = Annotated[str, StringConstraints(min_length=8)]
+
+def _validate_password_strength(v: str) -> str:
+    """Validate password strength in a single pass over the string"""
+    if len(v) < 8:
+        raise ValueError('Password must be at least 8 characters long')
+    
+    has_upper = has_lower = has_digit = False
+    for c in v:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        if has_upper and has_lower and has_digit:
+            return v
+    
+    if not has_upper:
+        raise ValueError('Password must contain at least one uppercase letter')
+    if not has_lower:
+        raise ValueError('Password must contain at least one lowercase letter')
+    raise ValueError('Password must contain at least one digit')
+
 class UserBase(BaseModel):
     """Base user model"""
-    username: str = Field(..., min_length=3, max_length=50, description="Unique username")
+    username: Username = Field(..., description="Unique username")
     email: EmailStr = Field(..., description="User email address")
-    full_name: str = Field(..., min_length=2, max_length=100, description="User's full name")
+    full_name: FullName = Field(..., description="User's full name")
     role: UserRole = Field(..., description="User role for access control")
     is_active: bool = Field(True, description="Whether the user account is active")
 
 class UserCreate(UserBase):
     """User creation model"""
-    password: str = Field(..., min_length=8, description="User password (min 8 characters)")
+    password: Password = Field(..., description="User password (min 8 characters)")
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password_strength(cls, v):
         """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not any(c.isupper() for c in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not any(c.islower() for c in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        return v
+        return _validate_password_strength(v)
 
 class UserUpdate(BaseModel):
     """User update model"""
     email: Optional[EmailStr] = None
-    full_name: Optional[str] = Field(None, min_length=2, max_length=100)
+    full_name: Optional[FullName] = None
     role: Optional[UserRole] = None
     is_active: Optional[bool] = None
 
@@ -54,14 +75,13 @@ class UserInDB(UserBase):
 
 class User(UserBase):
     """User model for API responses"""
+    model_config = ConfigDict(from_attributes=True, extra='ignore', frozen=True)
+    
     id: int
     created_at: datetime
     updated_at: datetime
     last_login: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 class UserLogin(BaseModel):
     """User login model"""
     username: str = Field(..., description="Username for login")
@@ -69,6 +89,8 @@ class UserLogin(BaseModel):
 
 class Token(BaseModel):
     """JWT token model"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+    
     access_token: str = Field(..., description="JWT access token")
     token_type: str = Field("bearer", description="Token type")
     expires_in: int = Field(..., description="Token expiration time in seconds")
@@ -78,6 +100,8 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     """Token data model for JWT payload"""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+    
     username: Optional[str] = None
     user_id: Optional[int] = None
     role: Optional[UserRole] = None
@@ -86,51 +110,49 @@ class TokenData(BaseModel):
 class PasswordChange(BaseModel):
     """Password change model"""
     current_password: str = Field(..., description="Current password")
-    new_password: str = Field(..., min_length=8, description="New password")
+    new_password: Password = Field(..., description="New password")
     
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def validate_new_password_strength(cls, v):
         """Validate new password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not any(c.isupper() for c in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not any(c.islower() for c in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        return v
+        return _validate_password_strength(v)
+
+_USER_PERMISSIONS_EXAMPLE = MappingProxyType({
+    "user_id": 1,
+    "role": "finance_admin",
+    "permissions": [
+        "read:content",
+        "write:content",
+        "read:costs",
+        "write:costs",
+        "read:revenue",
+        "write:revenue",
+        "read:feedback",
+        "write:feedback",
+        "apply:feedback",
+        "read:reports",
+        "write:reports"
+    ]
+})
 
 class UserPermissions(BaseModel):
     """User permissions model"""
+    model_config = ConfigDict(
+        extra='ignore',
+        frozen=True,
+        json_schema_extra={
+            "example": _USER_PERMISSIONS_EXAMPLE
+        }
+    )
+    
     user_id: int
     role: UserRole
     permissions: List[str] = Field(..., description="List of user permissions")
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "user_id": 1,
-                "role": "finance_admin",
-                "permissions": [
-                    "read:content",
-                    "write:content",
-                    "read:costs",
-                    "write:costs",
-                    "read:revenue",
-                    "write:revenue",
-                    "read:feedback",
-                    "write:feedback",
-                    "apply:feedback",
-                    "read:reports",
-                    "write:reports"
-                ]
-            }
-        }
 
 # Permission definitions
 PERMISSIONS = {
-    UserRole.FINANCE_ADMIN: [
+    UserRole.FINANCE_ADMIN: frozenset({
         "read:content", "write:content",
         "read:costs", "write:costs",
         "read:revenue", "write:revenue",
@@ -138,31 +160,32 @@ PERMISSIONS = {
         "read:reports", "write:reports",
         "read:users", "write:users",
         "read:finance_rules", "write:finance_rules"
-    ],
-    UserRole.STRATEGY_ANALYST: [
+    }),
+    UserRole.STRATEGY_ANALYST: frozenset({
         "read:content", "write:content",
         "read:costs", "read:revenue",
         "read:feedback", "write:feedback",
         "read:reports", "write:reports",
         "read:finance_rules"
-    ],
-    UserRole.MARKETING_USER: [
+    }),
+    UserRole.MARKETING_USER: frozenset({
         "read:content", "write:content",
         "read:costs", "read:revenue",
         "read:feedback", "write:feedback",
         "read:reports"
-    ],
-    UserRole.READ_ONLY: [
+    }),
+    UserRole.READ_ONLY: frozenset({
         "read:content", "read:costs", "read:revenue",
         "read:reports"
-    ]
+    })
 }
 
-def get_user_permissions(role: UserRole) -> List[str]:
+_NO_PERMISSIONS: FrozenSet[str] = frozenset()
+
+def get_user_permissions(role: UserRole) -> FrozenSet[str]:
     """Get permissions for a given user role"""
-    return PERMISSIONS.get(role, [])
+    return PERMISSIONS.get(role, _NO_PERMISSIONS)
 
 def has_permission(user_role: UserRole, required_permission: str) -> bool:
     """Check if user has a specific permission"""
-    user_permissions = get_user_permissions(user_role)
-    return required_permission in user_permissions 
\ No newline at end of file
+    return required_permission in PERMISSIONS.get(user_role, _NO_PERMISSIONS)
@@ -1,41 +1,70 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any
-from datetime import datetime, date
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, List, Dict, Any, Final, Literal
+from datetime import datetime, date, timezone
+from functools import partial
+from types import MappingProxyType
 
-class TimeGrain(str, Enum):
+# Enumerations are plain string constants plus a matching Literal type:
+# comparisons are interned-string compares and pydantic-core validates a
+# Literal with a single set lookup instead of the generic enum validator.
+TimeGrainValue = Literal["day", "week", "month", "quarter", "year"]
+SortByValue = Literal["roi", "revenue", "engagement", "performance_score", "views", "conversions", "cost"]
+SortOrderValue = Literal["asc", "desc"]
+
+class TimeGrain:
     """Time granularity for KPI aggregation"""
-    DAY = "day"
-    WEEK = "week"
-    MONTH = "month"
-    QUARTER = "quarter"
-    YEAR = "year"
+    DAY: Final = "day"
+    WEEK: Final = "week"
+    MONTH: Final = "month"
+    QUARTER: Final = "quarter"
+    YEAR: Final = "year"
 
-class SortBy(str, Enum):
+class SortBy:
     """Sort options for leaderboard"""
-    ROI = "roi"
-    REVENUE = "revenue"
-    ENGAGEMENT = "engagement"
-    PERFORMANCE_SCORE = "performance_score"
-    VIEWS = "views"
-    CONVERSIONS = "conversions"
-    COST = "cost"
+    ROI: Final = "roi"
+    REVENUE: Final = "revenue"
+    ENGAGEMENT: Final = "engagement"
+    PERFORMANCE_SCORE: Final = "performance_score"
+    VIEWS: Final = "views"
+    CONVERSIONS: Final = "conversions"
+    COST: Final = "cost"
 
-class SortOrder(str, Enum):
+class SortOrder:
     """Sort order options"""
-    ASC = "asc"
-    DESC = "desc"
+    ASC: Final = "asc"
+    DESC: Final = "desc"
 
 class ContentKPIRequest(BaseModel):
     """Request model for content KPIs"""
     content_id: str = Field(..., description="Content ID")
-    grain: TimeGrain = Field(TimeGrain.DAY, description="Time granularity")
+    grain: TimeGrainValue = Field(TimeGrain.DAY, description="Time granularity")
     start_date: Optional[date] = Field(None, description="Start date for filtering")
     end_date: Optional[date] = Field(None, description="End date for filtering")
     include_breakdown: bool = Field(False, description="Include cost and revenue breakdown")
 
+_CONTENT_KPIS_EXAMPLE = MappingProxyType({
+    "content_id": "550e8400-e29b-41d4-a716-446655440001",
+    "title": "10 Ways to Boost Your SaaS Conversion Rate",
+    "vertical": "B2B SaaS",
+    "format": "blog",
+    "channel": "Blog",
+    "publish_date": "2024-01-15T09:00:00Z",
+    "owner_team": "Marketing",
+    "impressions": 5000,
+    "views": 1200,
+    "roi_pct": 25.5,
+    "performance_score": 78.3
+})
+
 class ContentKPIs(BaseModel):
     """Content KPIs response model"""
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": _CONTENT_KPIS_EXAMPLE
+        }
+    )
+    
     content_id: str
     title: str
     vertical: str
@@ -90,29 +119,11 @@ class ContentKPIs(BaseModel):
     # Time context
     event_date: date
     days_since_publish: int
-    
-    class Config:
-        from_attributes = True
-        schema_extra = {
-            "example": {
-                "content_id": "550e8400-e29b-41d4-a716-446655440001",
-                "title": "10 Ways to Boost Your SaaS Conversion Rate",
-                "vertical": "B2B SaaS",
-                "format": "blog",
-                "channel": "Blog",
-                "publish_date": "2024-01-15T09:00:00Z",
-                "owner_team": "Marketing",
-                "impressions": 5000,
-                "views": 1200,
-                "roi_pct": 25.5,
-                "performance_score": 78.3
-            }
-        }
 
 class LeaderboardRequest(BaseModel):
     """Request model for content leaderboard"""
-    sort_by: SortBy = Field(SortBy.ROI, description="Sort field")
-    sort_order: SortOrder = Field(SortOrder.DESC, description="Sort order")
+    sort_by: SortByValue = Field(SortBy.ROI, description="Sort field")
+    sort_order: SortOrderValue = Field(SortOrder.DESC, description="Sort order")
     limit: int = Field(50, ge=1, le=100, description="Number of results to return")
     offset: int = Field(0, ge=0, description="Number of results to skip")
     
@@ -127,6 +138,8 @@ class LeaderboardRequest(BaseModel):
 
 class LeaderboardEntry(BaseModel):
     """Leaderboard entry model"""
+    model_config = ConfigDict(from_attributes=True)
+    
     rank: int
     content_id: str
     title: str
@@ -149,9 +162,6 @@ class LeaderboardEntry(BaseModel):
     roi_tier: str
     performance_tier: str
     engagement_tier: str
-    
-    class Config:
-        from_attributes = True
 
 class LeaderboardResponse(BaseModel):
     """Leaderboard response model"""
@@ -167,7 +177,8 @@ class ROIPredictionRequest(BaseModel):
     """Request model for ROI prediction"""
     content_attributes: Dict[str, Any] = Field(..., description="Content attributes for prediction")
     
-    @validator('content_attributes')
+    @field_validator('content_attributes')
+    @classmethod
     def validate_attributes(cls, v):
         """Validate required attributes"""
         required_fields = ['channel', 'vertical', 'format', 'region']
@@ -176,12 +187,36 @@ class ROIPredictionRequest(BaseModel):
                 raise ValueError(f"Missing required field: {field}")
         return v
 
+class ROIBatchPredictionRequest(BaseModel):
+    """Request model for scoring many content variants at once"""
+    items: List[ROIPredictionRequest] = Field(..., min_length=1, max_length=1000, description="Content variants to score")
+
+_ROI_PREDICTION_EXAMPLE = MappingProxyType({
+    "predicted_roi": 35.2,
+    "confidence_score": 0.85,
+    "model_version": "v1.0",
+    "model_type": "lightgbm",
+    "feature_importance": {
+        "channel": 0.25,
+        "vertical": 0.20,
+        "format": 0.15
+    }
+})
+
 class ROIPrediction(BaseModel):
     """ROI prediction response model"""
+    # model_version/model_type are domain fields, not pydantic's reserved "model_" namespace
+    model_config = ConfigDict(
+        protected_namespaces=(),
+        json_schema_extra={
+            "example": _ROI_PREDICTION_EXAMPLE
+        }
+    )
+    
     content_id: Optional[str] = None
     predicted_roi: float = Field(..., description="Predicted ROI percentage")
     confidence_score: float = Field(..., ge=0, le=1, description="Prediction confidence (0-1)")
-    prediction_date: datetime = Field(default_factory=datetime.utcnow)
+    prediction_date: datetime = Field(default_factory=partial(datetime.now, timezone.utc))
     
     # Feature importance
     feature_importance: Dict[str, float] = Field(..., description="Feature importance scores")
@@ -193,21 +228,6 @@ class ROIPrediction(BaseModel):
     
     # Prediction context
     input_features: Dict[str, Any] = Field(..., description="Input features used for prediction")
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "predicted_roi": 35.2,
-                "confidence_score": 0.85,
-                "model_version": "v1.0",
-                "model_type": "lightgbm",
-                "feature_importance": {
-                    "channel": 0.25,
-                    "vertical": 0.20,
-                    "format": 0.15
-                }
-            }
-        }
 
 class ContentSummary(BaseModel):
     """Content summary for dashboard overview"""
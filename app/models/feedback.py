@@ -1,17 +1,24 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any, Union
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, List, Dict, Any, Union, Final, Literal
+from datetime import datetime, timezone
+from functools import partial
 from enum import Enum
+from types import MappingProxyType
 
-class FeedbackType(str, Enum):
+FeedbackTypeValue = Literal[
+    "definition_correction", "misattribution", "override", "rule_change",
+    "metric_update", "cost_allocation", "revenue_attribution",
+]
+
+class FeedbackType:
     """Types of feedback that can be submitted"""
-    DEFINITION_CORRECTION = "definition_correction"
-    MISATTRIBUTION = "misattribution"
-    OVERRIDE = "override"
-    RULE_CHANGE = "rule_change"
-    METRIC_UPDATE = "metric_update"
-    COST_ALLOCATION = "cost_allocation"
-    REVENUE_ATTRIBUTION = "revenue_attribution"
+    DEFINITION_CORRECTION: Final = "definition_correction"
+    MISATTRIBUTION: Final = "misattribution"
+    OVERRIDE: Final = "override"
+    RULE_CHANGE: Final = "rule_change"
+    METRIC_UPDATE: Final = "metric_update"
+    COST_ALLOCATION: Final = "cost_allocation"
+    REVENUE_ATTRIBUTION: Final = "revenue_attribution"
 
 class FeedbackStatus(str, Enum):
     """Status of feedback items"""
@@ -39,14 +46,23 @@ class ActorRole(str, Enum):
     DATA = "Data"
     OPERATIONS = "Operations"
 
+# Literal counterparts of the enums above for request models: pydantic-core
+# checks a Literal with one set lookup, while the enum classes stay available
+# for server-side models and logic.
+FeedbackStatusValue = Literal["pending", "approved", "rejected", "applied", "under_review"]
+FeedbackTargetTypeValue = Literal[
+    "metric", "content_id", "rule_id", "definition", "cost_allocation", "revenue_attribution",
+]
+ActorRoleValue = Literal["Finance", "Strategy", "Marketing", "SalesOps", "Data", "Operations"]
+
 class FeedbackSubmission(BaseModel):
     """Model for submitting feedback"""
     actor_id: str = Field(..., description="Unique identifier for the actor")
-    actor_role: ActorRole = Field(..., description="Role of the person submitting feedback")
-    feedback_type: FeedbackType = Field(..., description="Type of feedback being submitted")
+    actor_role: ActorRoleValue = Field(..., description="Role of the person submitting feedback")
+    feedback_type: FeedbackTypeValue = Field(..., description="Type of feedback being submitted")
     
     # Target information
-    target_type: FeedbackTargetType = Field(..., description="Type of target for the feedback")
+    target_type: FeedbackTargetTypeValue = Field(..., description="Type of target for the feedback")
     target_id: Optional[str] = Field(None, description="Specific ID of the target (if applicable)")
     
     # Feedback details
@@ -62,7 +78,8 @@ class FeedbackSubmission(BaseModel):
     evidence: Optional[List[str]] = Field(None, description="List of evidence or references")
     attachments: Optional[List[str]] = Field(None, description="List of attachment URLs or references")
     
-    @validator('payload')
+    @field_validator('payload')
+    @classmethod
     def validate_payload(cls, v):
         """Validate payload structure based on feedback type"""
         if not isinstance(v, dict):
@@ -73,10 +90,12 @@ class FeedbackSubmission(BaseModel):
 
 class FeedbackEvent(BaseModel):
     """Feedback event model for database storage"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     actor_id: str
     actor_role: ActorRole
-    feedback_type: FeedbackType
+    feedback_type: FeedbackTypeValue
     target_type: FeedbackTargetType
     target_id: Optional[str]
     payload: Dict[str, Any]
@@ -96,32 +115,32 @@ class FeedbackEvent(BaseModel):
     # Metadata
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+_FEEDBACK_RESPONSE_EXAMPLE = MappingProxyType({
+    "feedback_id": "fb_12345",
+    "status": "pending",
+    "message": "Feedback submitted successfully and is under review",
+    "estimated_review_time": "2-3 business days",
+    "next_steps": [
+        "Finance team will review the feedback",
+        "Impact analysis will be performed",
+        "You will be notified of the decision"
+    ]
+})
 
 class FeedbackResponse(BaseModel):
     """Response model for feedback submission"""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": _FEEDBACK_RESPONSE_EXAMPLE
+        }
+    )
+    
     feedback_id: str
     status: FeedbackStatus
     message: str
     estimated_review_time: Optional[str] = None
     next_steps: List[str] = []
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "feedback_id": "fb_12345",
-                "status": "pending",
-                "message": "Feedback submitted successfully and is under review",
-                "estimated_review_time": "2-3 business days",
-                "next_steps": [
-                    "Finance team will review the feedback",
-                    "Impact analysis will be performed",
-                    "You will be notified of the decision"
-                ]
-            }
-        }
 
 class FeedbackReview(BaseModel):
     """Model for reviewing feedback"""
@@ -160,11 +179,13 @@ class FeedbackApplication(BaseModel):
     rollback_triggered: bool = Field(False, description="Whether rollback was triggered")
     
     # Metadata
-    applied_at: datetime = Field(default_factory=datetime.utcnow)
+    applied_at: datetime = Field(default_factory=partial(datetime.now, timezone.utc))
     application_duration_seconds: Optional[float] = Field(None, description="Time taken to apply changes")
 
 class RuleOverride(BaseModel):
     """Model for rule overrides created from feedback"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     feedback_event_id: str
     
@@ -181,12 +202,11 @@ class RuleOverride(BaseModel):
     # Metadata
     created_at: datetime
     created_by: str
-    
-    class Config:
-        from_attributes = True
 
 class AuditTrail(BaseModel):
     """Model for audit trail entries"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     table_name: str
     record_id: str
@@ -205,9 +225,6 @@ class AuditTrail(BaseModel):
     session_id: Optional[str] = Field(None, description="Session ID when change was made")
     ip_address: Optional[str] = Field(None, description="IP address of the user")
     user_agent: Optional[str] = Field(None, description="User agent string")
-    
-    class Config:
-        from_attributes = True
 
 class FeedbackSummary(BaseModel):
     """Summary model for feedback dashboard"""
@@ -218,7 +235,7 @@ class FeedbackSummary(BaseModel):
     applied: int
     
     # By type
-    by_type: Dict[FeedbackType, int]
+    by_type: Dict[FeedbackTypeValue, int]
     
     # By status
     by_status: Dict[FeedbackStatus, int]
@@ -238,10 +255,10 @@ class FeedbackSummary(BaseModel):
 class FeedbackSearchRequest(BaseModel):
     """Request model for searching feedback"""
     query: Optional[str] = Field(None, description="Search query")
-    feedback_type: Optional[FeedbackType] = Field(None, description="Filter by feedback type")
-    status: Optional[FeedbackStatus] = Field(None, description="Filter by status")
-    actor_role: Optional[ActorRole] = Field(None, description="Filter by actor role")
-    target_type: Optional[FeedbackTargetType] = Field(None, description="Filter by target type")
+    feedback_type: Optional[FeedbackTypeValue] = Field(None, description="Filter by feedback type")
+    status: Optional[FeedbackStatusValue] = Field(None, description="Filter by status")
+    actor_role: Optional[ActorRoleValue] = Field(None, description="Filter by actor role")
+    target_type: Optional[FeedbackTargetTypeValue] = Field(None, description="Filter by target type")
     date_from: Optional[datetime] = Field(None, description="Filter from date")
     date_to: Optional[datetime] = Field(None, description="Filter to date")
     priority: Optional[str] = Field(None, description="Filter by priority")
@@ -0,0 +1,60 @@
+"""
+Content Intelligence Platform - Response Helpers
+
+Serialize high-volume response models straight to JSON bytes with pydantic-core,
+bypassing FastAPI's jsonable_encoder and response_model re-validation.
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Type, TypeVar, Union
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+def model_from_row(model: Type[ModelT], row: Any) -> ModelT:
+    """Build a model from a trusted database row without re-validating it
+
+    Column constraints were enforced on write, so the row's attributes are
+    copied as-is (JSON payloads are not deep-copied). Fields the row does not
+    carry fall back to their defaults, or are left unset and omitted from the
+    JSON. Untrusted input must still go through model_validate.
+    """
+    return model.model_construct(
+        **{field: getattr(row, field) for field in model.model_fields if hasattr(row, field)}
+    )
+
+def model_json_response(adapter: TypeAdapter, content: Any) -> Response:
+    """Build a JSON response from already-constructed models"""
+    return Response(content=adapter.dump_json(content), media_type="application/json")
+
+def _json_array_chunks(adapter: TypeAdapter, items: Iterable[Any]) -> Iterator[bytes]:
+    """Encode items one at a time as the elements of a JSON array"""
+    yield b"["
+    separator = b""
+    for item in items:
+        yield separator
+        yield adapter.dump_json(item)
+        separator = b","
+    yield b"]"
+
+async def _async_json_array_chunks(adapter: TypeAdapter, items: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+    """Async counterpart of _json_array_chunks for AsyncSession result streams"""
+    yield b"["
+    separator = b""
+    async for item in items:
+        yield separator
+        yield adapter.dump_json(item)
+        separator = b","
+    yield b"]"
+
+def stream_json_array(adapter: TypeAdapter, items: Union[Iterable[Any], AsyncIterable[Any]]) -> StreamingResponse:
+    """Stream a JSON array without materializing the whole result set
+
+    adapter encodes a single element. items may be a lazy iterator (e.g. a
+    query with yield_per), which Starlette drains in the threadpool, or an
+    async iterator (e.g. AsyncSession.stream_scalars), drained on the loop.
+    """
+    if hasattr(items, "__aiter__"):
+        return StreamingResponse(_async_json_array_chunks(adapter, items), media_type="application/json")
+    return StreamingResponse(_json_array_chunks(adapter, items), media_type="application/json")
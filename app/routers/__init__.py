@@ -1,9 +1,6 @@
 # Routers package for Content Intelligence Platform
 
-from . import auth_router
-from . import content_router
-from . import feedback_router
-from . import metrics_router
+import importlib
 
 # Export all routers
 __all__ = [
@@ -11,4 +8,11 @@ __all__ = [
     "content_router",
     "feedback_router",
     "metrics_router"
-] 
\ No newline at end of file
+]
+
+def __getattr__(name):
+    # Router modules pull in SQLAlchemy, services and their models, so they are
+    # imported on first access (PEP 562) rather than with the package.
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
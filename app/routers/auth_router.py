@@ -1,21 +1,25 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy import or_, update
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from pydantic import TypeAdapter
+from typing import List, Optional
 import structlog
 
 from app.database import get_db
+from app.dependencies import json_body, json_body_openapi
+from app.responses import model_from_row, stream_json_array
 from app.models.auth import (
     UserCreate, User, UserLogin, Token, TokenData, 
-    UserUpdate, PasswordChange, UserPermissions, UserRole
+    UserUpdate, PasswordChange, UserPermissions, UserRole,
+    get_user_permissions
 )
-from app.services.auth_service import (
-    authenticate_user, create_access_token, get_current_user,
-    get_password_hash, verify_password, create_user, update_user,
-    change_password, get_user_permissions
-)
-from app.config import SECURITY_CONFIG
+from app.services.auth_service import auth_service
+from app.services.permission_service import get_current_user
+from app.config import ACCESS_TOKEN_TTL, ACCESS_TOKEN_TTL_SECONDS
 
 logger = structlog.get_logger()
 
@@ -24,31 +28,53 @@ router = APIRouter()
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
-@router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
+# Per-row serializer for the streamed admin user list
+_USER = TypeAdapter(User)
+USERS_FETCH_BATCH_SIZE = 500
+
+# Challenge header for 401 responses (read-only, shared across requests)
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
+# Responses built from trusted sources (database rows, locally issued tokens) use
+# model_construct to skip re-validation: login, refresh and the admin user list.
+# Request bodies (register, profile update, password change) are always validated.
+
+@lru_cache(maxsize=len(UserRole))
+def _role_permissions(role: UserRole) -> List[str]:
+    """Sorted permission list for a role (static per role, shared across responses)"""
+    return sorted(get_user_permissions(role))
+
+@router.post(
+    "/register",
+    response_model=User,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(UserCreate)
+)
 async def register_user(
-    user_data: UserCreate,
+    user_data: UserCreate = Depends(json_body(UserCreate)),
     db: Session = Depends(get_db)
 ):
     """Register a new user"""
     try:
-        # Check if username already exists
-        existing_user = db.query(User).filter(User.username == user_data.username).first()
-        if existing_user:
+        # Check username and email uniqueness in one round trip (at most two matching rows)
+        existing_users = db.query(User).filter(
+            or_(User.username == user_data.username, User.email == user_data.email)
+        ).limit(2).all()
+        
+        if any(existing.username == user_data.username for existing in existing_users):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already registered"
             )
         
-        # Check if email already exists
-        existing_email = db.query(User).filter(User.email == user_data.email).first()
-        if existing_email:
+        if existing_users:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
         
-        # Create new user
-        user = create_user(db, user_data)
+        # Create new user (bcrypt hashing runs in a worker thread, off the event loop)
+        user = await asyncio.to_thread(auth_service.create_user, user_data)
         
         logger.info("New user registered", username=user_data.username, role=user_data.role)
         
@@ -68,13 +94,13 @@ async def login_for_access_token(
 ):
     """Login and get access token"""
     try:
-        # Authenticate user
-        user = authenticate_user(db, form_data.username, form_data.password)
+        # Authenticate user (bcrypt verification runs in a worker thread, off the event loop)
+        user = await asyncio.to_thread(auth_service.authenticate_user, form_data.username, form_data.password)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password",
-                headers={"WWW-Authenticate": "Bearer"},
+                headers=_BEARER_CHALLENGE,
             )
         
         # Check if user is active
@@ -84,35 +110,41 @@ async def login_for_access_token(
                 detail="User account is inactive"
             )
         
+        # One timestamp for the whole login; the users columns store naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        
         # Check if user is locked
-        if user.locked_until and user.locked_until > datetime.utcnow():
+        if user.locked_until and user.locked_until > now:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User account is temporarily locked"
             )
         
         # Create access token
-        access_token_expires = timedelta(minutes=SECURITY_CONFIG["access_token_expire_minutes"])
-        access_token = create_access_token(
+        access_token = auth_service.create_access_token(
             data={"sub": user.username, "user_id": user.id, "role": user.role},
-            expires_delta=access_token_expires
+            expires_delta=ACCESS_TOKEN_TTL
         )
         
-        # Update last login
-        user.last_login = datetime.utcnow()
-        user.failed_login_attempts = 0
+        # Update last login (single UPDATE, no ORM dirty tracking)
+        db.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(last_login=now, failed_login_attempts=0)
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
         
         logger.info("User logged in successfully", username=user.username, role=user.role)
         
-        return {
-            "access_token": access_token,
-            "token_type": "bearer",
-            "expires_in": SECURITY_CONFIG["access_token_expire_minutes"] * 60,
-            "user_id": user.id,
-            "username": user.username,
-            "role": user.role
-        }
+        return Token.model_construct(
+            access_token=access_token,
+            token_type="bearer",
+            expires_in=ACCESS_TOKEN_TTL_SECONDS,
+            user_id=user.id,
+            username=user.username,
+            role=user.role
+        )
         
     except HTTPException:
         raise
@@ -135,25 +167,22 @@ async def get_current_user_permissions(
     current_user: User = Depends(get_current_user)
 ):
     """Get current user permissions"""
-    permissions = get_user_permissions(current_user.role)
-    
-    return UserPermissions(
+    return UserPermissions.model_construct(
         user_id=current_user.id,
         role=current_user.role,
-        permissions=permissions
+        permissions=_role_permissions(current_user.role)
     )
 
 @router.put("/me", response_model=User)
 async def update_current_user(
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """Update current user information"""
     try:
-        updated_user = update_user(db, current_user.id, user_update)
+        updated_user = auth_service.update_user(current_user.username, user_update)
         
-        logger.info("User updated", user_id=current_user.id, fields_updated=list(user_update.dict(exclude_unset=True).keys()))
+        logger.info("User updated", user_id=current_user.id, fields_updated=list(user_update.model_dump(exclude_unset=True).keys()))
         
         return updated_user
         
@@ -167,21 +196,21 @@ async def update_current_user(
 @router.post("/me/change-password")
 async def change_current_user_password(
     password_change: PasswordChange,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """Change current user password"""
     try:
-        # Verify current password
-        if not verify_password(password_change.current_password, current_user.hashed_password):
+        # Verifies the current password, then stores the new hash (bcrypt, off the event loop)
+        changed = await asyncio.to_thread(
+            auth_service.change_password,
+            current_user.username, password_change.current_password, password_change.new_password
+        )
+        if not changed:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Current password is incorrect"
             )
         
-        # Change password
-        change_password(db, current_user.id, password_change.new_password)
-        
         logger.info("User password changed", user_id=current_user.id)
         
         return {"message": "Password changed successfully"}
@@ -202,22 +231,21 @@ async def refresh_access_token(
     """Refresh access token"""
     try:
         # Create new access token
-        access_token_expires = timedelta(minutes=SECURITY_CONFIG["access_token_expire_minutes"])
-        access_token = create_access_token(
+        access_token = auth_service.create_access_token(
             data={"sub": current_user.username, "user_id": current_user.id, "role": current_user.role},
-            expires_delta=access_token_expires
+            expires_delta=ACCESS_TOKEN_TTL
         )
         
         logger.info("Access token refreshed", username=current_user.username)
         
-        return {
-            "access_token": access_token,
-            "token_type": "bearer",
-            "expires_in": SECURITY_CONFIG["access_token_expire_minutes"] * 60,
-            "user_id": current_user.id,
-            "username": current_user.username,
-            "role": current_user.role
-        }
+        return Token.model_construct(
+            access_token=access_token,
+            token_type="bearer",
+            expires_in=ACCESS_TOKEN_TTL_SECONDS,
+            user_id=current_user.id,
+            username=current_user.username,
+            role=current_user.role
+        )
         
     except Exception as e:
         logger.error("Token refresh failed", username=current_user.username, error=str(e))
@@ -248,16 +276,11 @@ async def get_all_users(
             detail="Insufficient permissions"
         )
     
-    try:
-        users = db.query(User).all()
-        return users
-        
-    except Exception as e:
-        logger.error("Failed to get users", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get users"
-        )
+    # Rows are fetched in batches and encoded one by one, so memory stays flat
+    # regardless of table size. Once streaming has started a failure can only
+    # abort the response, so there is no 500 mapping here.
+    rows = db.query(User).yield_per(USERS_FETCH_BATCH_SIZE)
+    return stream_json_array(_USER, (model_from_row(User, row) for row in rows))
 
 @router.put("/users/{user_id}", response_model=User)
 async def update_user_admin(
@@ -274,12 +297,21 @@ async def update_user_admin(
         )
     
     try:
-        updated_user = update_user(db, user_id, user_update)
+        user = db.get(User, user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        
+        updated_user = auth_service.update_user(user.username, user_update)
         
         logger.info("User updated by admin", admin_id=current_user.id, user_id=user_id)
         
         return updated_user
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Admin user update failed", admin_id=current_user.id, user_id=user_id, error=str(e))
         raise HTTPException(
@@ -301,7 +333,7 @@ async def deactivate_user(
         )
     
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1,115 +1,189 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from datetime import date
+from functools import lru_cache
 from typing import Optional, List
+from pydantic import TypeAdapter
+import asyncio
+import orjson
 import structlog
 
-from app.database import get_db
-from app.models.auth import User, get_current_user
+from app.cache import RequestCoalescer, TTLCache
+from app.config import CONTENT_INTELLIGENCE_CONFIG
+from app.database import ReadSessionLocal
+from app.dependencies import json_body, json_body_openapi
+from app.metrics import log_sampled
+from app.responses import model_json_response
+from app.models.auth import User
 from app.models.content import (
     ContentKPIRequest, ContentKPIs, LeaderboardRequest, LeaderboardResponse,
-    ROIPredictionRequest, ROIPrediction, ContentSummary, MetricDefinition,
-    MetricDefinitionsResponse, TimeGrain, SortBy, SortOrder
+    ROIPredictionRequest, ROIBatchPredictionRequest, ROIPrediction, ContentSummary, MetricDefinition,
+    MetricDefinitionsResponse, TimeGrain, SortBy, SortOrder,
+    TimeGrainValue, SortByValue, SortOrderValue
 )
 from app.services.content_service import (
-    get_content_kpis, get_content_leaderboard, predict_roi,
-    get_content_summary, get_metric_definitions
+    METRIC_DEFINITIONS_UPDATED, METRIC_DEFINITIONS_VERSION, _metric_definitions,
+    content_service, get_content_kpis, get_content_summary
 )
-from app.services.permission_service import check_permission
+# Aliased: the endpoint below is also named get_content_leaderboard and would shadow it
+from app.services.content_service import get_content_leaderboard as fetch_content_leaderboard
+from app.services.permission_service import check_permission, get_current_user
 
 logger = structlog.get_logger()
 
 router = APIRouter()
 
+# Serializers for the high-volume responses (built once, encoded in Rust)
+_CONTENT_KPIS_LIST = TypeAdapter(List[ContentKPIs])
+_LEADERBOARD = TypeAdapter(LeaderboardResponse)
+_ROI_PREDICTION_LIST = TypeAdapter(List[ROIPrediction])
+_CONTENT_SUMMARY = TypeAdapter(ContentSummary)
+_METRIC_DEFINITIONS = TypeAdapter(MetricDefinitionsResponse)
+
+# Serialized response bodies. The marts behind the leaderboard and summary are rebuilt
+# by dbt, not written through the API, so a short TTL is the only invalidation needed.
+LEADERBOARD_CACHE_TTL_SECONDS = 60
+LEADERBOARD_CACHE_MAX_ENTRIES = 512
+SUMMARY_CACHE_TTL_SECONDS = 60
+KPIS_CACHE_TTL_SECONDS = 60
+KPIS_CACHE_MAX_ENTRIES = 1024
+_leaderboard_cache = TTLCache(LEADERBOARD_CACHE_TTL_SECONDS, LEADERBOARD_CACHE_MAX_ENTRIES)
+_summary_cache = TTLCache(SUMMARY_CACHE_TTL_SECONDS, maxsize=1)
+_kpis_cache = TTLCache(KPIS_CACHE_TTL_SECONDS, KPIS_CACHE_MAX_ENTRIES)
+
+# Concurrent misses for the same key (dashboards open in many tabs) share one query.
+# A shared build outlives any single waiter (one may disconnect), so it opens its own
+# read session instead of borrowing a request-scoped one.
+_leaderboard_builds = RequestCoalescer()
+_summary_builds = RequestCoalescer()
+_kpis_builds = RequestCoalescer()
+
+# Leaderboard filter names, in the order the endpoint collects their values
+_LEADERBOARD_FILTER_KEYS = ("channel", "vertical", "format", "date_from", "date_to", "roi_min", "roi_max")
+
+# Catalog and tier payloads are fixed at startup, so they are serialized once at import
+_CHANNELS = sorted(CONTENT_INTELLIGENCE_CONFIG["supported_channels"])
+_VERTICALS = sorted(CONTENT_INTELLIGENCE_CONFIG["supported_verticals"])
+_FORMATS = sorted(CONTENT_INTELLIGENCE_CONFIG["supported_formats"])
+_PERFORMANCE_TIERS = {
+    "roi_tiers": {
+        "exceptional": {"min": 100, "description": "ROI >= 100%"},
+        "excellent": {"min": 50, "max": 99, "description": "ROI 50-99%"},
+        "good": {"min": 20, "max": 49, "description": "ROI 20-49%"},
+        "positive": {"min": 0, "max": 19, "description": "ROI 0-19%"},
+        "neutral": {"min": -20, "max": -1, "description": "ROI -20% to -1%"},
+        "negative": {"max": -20, "description": "ROI < -20%"}
+    },
+    "performance_tiers": {
+        "high_performing": {"min": 0.1, "description": "View rate >= 10%"},
+        "medium_performing": {"min": 0.05, "max": 0.099, "description": "View rate 5-9.9%"},
+        "low_performing": {"max": 0.049, "description": "View rate < 5%"}
+    },
+    "engagement_tiers": {
+        "high_engagement": {"min": 0.15, "description": "Engagement rate >= 15%"},
+        "medium_engagement": {"min": 0.08, "max": 0.149, "description": "Engagement rate 8-14.9%"},
+        "low_engagement": {"max": 0.079, "description": "Engagement rate < 8%"}
+    }
+}
+
+_CHANNELS_JSON = orjson.dumps({"channels": _CHANNELS, "total_count": len(_CHANNELS)})
+_VERTICALS_JSON = orjson.dumps({"verticals": _VERTICALS, "total_count": len(_VERTICALS)})
+_FORMATS_JSON = orjson.dumps({"formats": _FORMATS, "total_count": len(_FORMATS)})
+_PERFORMANCE_TIERS_JSON = orjson.dumps(_PERFORMANCE_TIERS)
+_CATALOG_JSON = orjson.dumps({
+    "channels": _CHANNELS,
+    "verticals": _VERTICALS,
+    "formats": _FORMATS,
+    "performance_tiers": _PERFORMANCE_TIERS
+})
+
+@lru_cache(maxsize=1)
+def _metric_definitions_json() -> bytes:
+    """Serialized canonical metric definitions, built on first use (they only change with a deploy)"""
+    definitions = _metric_definitions()
+    return _METRIC_DEFINITIONS.dump_json(MetricDefinitionsResponse(
+        definitions=list(definitions),
+        total_count=len(definitions),
+        last_updated=METRIC_DEFINITIONS_UPDATED,
+        version=METRIC_DEFINITIONS_VERSION
+    ))
+
 @router.get("/definitions", response_model=MetricDefinitionsResponse)
 async def get_canonical_metric_definitions(
     current_user: User = Depends(get_current_user)
 ):
     """Get canonical metric definitions and formulas"""
-    try:
-        check_permission(current_user, "read:reports")
-        
-        definitions = get_metric_definitions()
-        
-        logger.info("Metric definitions retrieved", user_id=current_user.id, count=len(definitions))
-        
-        return MetricDefinitionsResponse(
-            definitions=definitions,
-            total_count=len(definitions),
-            last_updated=definitions[0].last_updated if definitions else None,
-            version="1.0"
-        )
-        
-    except Exception as e:
-        logger.error("Failed to get metric definitions", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve metric definitions"
-        )
+    check_permission(current_user, "read:reports")
+    
+    if log_sampled():
+        logger.info("Metric definitions retrieved", user_id=current_user.id)
+    
+    return Response(content=_metric_definitions_json(), media_type="application/json")
+
+def _fetch_kpis(cache_key: tuple) -> List[ContentKPIs]:
+    """get_content_kpis on a session owned by the build (runs in a worker thread)"""
+    # cache_key holds get_content_kpis' arguments in call order
+    with ReadSessionLocal() as db:
+        return get_content_kpis(db, *cache_key)
+
+async def _build_kpis_body(cache_key: tuple) -> Optional[bytes]:
+    """Query, encode and cache one KPI response (None when there are no KPIs)"""
+    kpis = await asyncio.to_thread(_fetch_kpis, cache_key)
+    
+    # Misses are not cached, so content that lands with the next dbt run shows up at once
+    if not kpis:
+        return None
+    
+    body = _CONTENT_KPIS_LIST.dump_json(kpis)
+    _kpis_cache.set(cache_key, body)
+    return body
 
 @router.get("/content/{content_id}/kpis", response_model=List[ContentKPIs])
 async def get_content_kpis_endpoint(
     content_id: str,
-    grain: TimeGrain = Query(TimeGrain.DAY, description="Time granularity"),
-    start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
-    end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    grain: TimeGrainValue = Query(TimeGrain.DAY, description="Time granularity"),
+    start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
     include_breakdown: bool = Query(False, description="Include cost and revenue breakdown"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """Get content KPIs for a specific content piece"""
-    try:
-        check_permission(current_user, "read:content")
-        
-        # Parse dates if provided
-        from datetime import datetime
-        parsed_start_date = None
-        parsed_end_date = None
-        
-        if start_date:
-            try:
-                parsed_start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid start_date format. Use YYYY-MM-DD"
-                )
-        
-        if end_date:
-            try:
-                parsed_end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid end_date format. Use YYYY-MM-DD"
-                )
-        
-        kpis = get_content_kpis(
-            db, content_id, grain, parsed_start_date, parsed_end_date, include_breakdown
-        )
-        
-        if not kpis:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"No KPIs found for content ID: {content_id}"
-            )
-        
-        logger.info("Content KPIs retrieved", user_id=current_user.id, content_id=content_id, count=len(kpis))
-        
-        return kpis
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to get content KPIs", user_id=current_user.id, content_id=content_id, error=str(e))
+    check_permission(current_user, "read:content")
+    
+    cache_key = (content_id, grain, start_date, end_date, include_breakdown)
+    body = _kpis_cache.get(cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers={"X-Cache": "HIT"})
+    
+    body = await _kpis_builds.run(cache_key, lambda: _build_kpis_body(cache_key))
+    if body is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve content KPIs"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No KPIs found for content ID: {content_id}"
         )
+    
+    if log_sampled():
+        logger.info("Content KPIs retrieved", user_id=current_user.id, content_id=content_id)
+    
+    return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
+
+def _fetch_leaderboard(cache_key: tuple, filters: dict) -> LeaderboardResponse:
+    """Leaderboard page on a session owned by the build (runs in a worker thread)"""
+    sort_by, sort_order, limit, offset = cache_key[:4]
+    with ReadSessionLocal() as db:
+        return fetch_content_leaderboard(db, sort_by, sort_order, limit, offset, **filters)
+
+async def _build_leaderboard_body(cache_key: tuple, filters: dict) -> bytes:
+    """Query, encode and cache one leaderboard page"""
+    leaderboard = await asyncio.to_thread(_fetch_leaderboard, cache_key, filters)
+    
+    body = _LEADERBOARD.dump_json(leaderboard)
+    _leaderboard_cache.set(cache_key, body)
+    return body
 
 @router.get("/leaderboard", response_model=LeaderboardResponse)
 async def get_content_leaderboard(
-    sort_by: SortBy = Query(SortBy.ROI, description="Sort field"),
-    sort_order: SortOrder = Query(SortOrder.DESC, description="Sort order"),
+    sort_by: SortByValue = Query(SortBy.ROI, description="Sort field"),
+    sort_order: SortOrderValue = Query(SortOrder.DESC, description="Sort order"),
     limit: int = Query(50, ge=1, le=100, description="Number of results to return"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
     
@@ -117,215 +191,139 @@ async def get_content_leaderboard(
     channel: Optional[str] = Query(None, description="Filter by channel"),
     vertical: Optional[str] = Query(None, description="Filter by vertical"),
     format: Optional[str] = Query(None, description="Filter by format"),
-    date_from: Optional[str] = Query(None, description="Filter from date (YYYY-MM-DD)"),
-    date_to: Optional[str] = Query(None, description="Filter to date (YYYY-MM-DD)"),
+    date_from: Optional[date] = Query(None, description="Filter from date (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="Filter to date (YYYY-MM-DD)"),
     roi_min: Optional[float] = Query(None, description="Minimum ROI percentage"),
     roi_max: Optional[float] = Query(None, description="Maximum ROI percentage"),
     
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """Get content leaderboard with filtering and sorting"""
-    try:
-        check_permission(current_user, "read:reports")
-        
-        # Parse dates if provided
-        from datetime import datetime
-        parsed_date_from = None
-        parsed_date_to = None
-        
-        if date_from:
-            try:
-                parsed_date_from = datetime.strptime(date_from, "%Y-%m-%d").date()
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid date_from format. Use YYYY-MM-DD"
-                )
-        
-        if date_to:
-            try:
-                parsed_date_to = datetime.strptime(date_to, "%Y-%m-%d").date()
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid date_to format. Use YYYY-MM-DD"
-                )
-        
-        # Build filter dict
-        filters = {
-            "channel": channel,
-            "vertical": vertical,
-            "format": format,
-            "date_from": parsed_date_from,
-            "date_to": parsed_date_to,
-            "roi_min": roi_min,
-            "roi_max": roi_max
-        }
-        
-        # Remove None values
-        filters = {k: v for k, v in filters.items() if v is not None}
-        
-        leaderboard = get_content_leaderboard(
-            db, sort_by, sort_order, limit, offset, filters
-        )
-        
-        logger.info("Content leaderboard retrieved", user_id=current_user.id, filters=filters, count=len(leaderboard.entries))
-        
-        return leaderboard
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to get content leaderboard", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve content leaderboard"
-        )
+    check_permission(current_user, "read:reports")
+    
+    filter_values = (channel, vertical, format, date_from, date_to, roi_min, roi_max)
+    cache_key = (sort_by, sort_order, limit, offset, *filter_values)
+    body = _leaderboard_cache.get(cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers={"X-Cache": "HIT"})
+    
+    # Only the filters that were actually supplied
+    filters = {k: v for k, v in zip(_LEADERBOARD_FILTER_KEYS, filter_values) if v is not None}
+    
+    body = await _leaderboard_builds.run(cache_key, lambda: _build_leaderboard_body(cache_key, filters))
+    
+    if log_sampled():
+        logger.info("Content leaderboard retrieved", user_id=current_user.id, filters=filters)
+    
+    return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
 
-@router.post("/roi/predict", response_model=ROIPrediction)
+@router.post("/roi/predict", response_model=ROIPrediction, openapi_extra=json_body_openapi(ROIPredictionRequest))
 async def predict_content_roi(
-    prediction_request: ROIPredictionRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    prediction_request: ROIPredictionRequest = Depends(json_body(ROIPredictionRequest)),
+    current_user: User = Depends(get_current_user)
 ):
     """Predict ROI for content based on attributes"""
-    try:
-        check_permission(current_user, "read:reports")
-        
-        prediction = predict_roi(db, prediction_request.content_attributes)
-        
+    check_permission(current_user, "read:reports")
+    
+    prediction = await content_service.predict_roi(prediction_request)
+    
+    if log_sampled():
         logger.info("ROI prediction generated", user_id=current_user.id, predicted_roi=prediction.predicted_roi)
-        
-        return prediction
-        
-    except Exception as e:
-        logger.error("Failed to predict ROI", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to generate ROI prediction"
-        )
+    
+    return prediction
+
+@router.post(
+    "/roi/predict/batch",
+    response_model=List[ROIPrediction],
+    openapi_extra=json_body_openapi(ROIBatchPredictionRequest)
+)
+async def predict_content_roi_batch(
+    batch: ROIBatchPredictionRequest = Depends(json_body(ROIBatchPredictionRequest)),
+    current_user: User = Depends(get_current_user)
+):
+    """Predict ROI for many content variants in one vectorized pass"""
+    check_permission(current_user, "read:reports")
+    
+    predictions = await asyncio.to_thread(content_service.predict_roi_batch, batch.items)
+    
+    if log_sampled():
+        logger.info("ROI batch prediction generated", user_id=current_user.id, count=len(predictions))
+    
+    return model_json_response(_ROI_PREDICTION_LIST, predictions)
+
+def _fetch_summary() -> ContentSummary:
+    """Content summary on a session owned by the build (runs in a worker thread)"""
+    with ReadSessionLocal() as db:
+        return get_content_summary(db)
+
+async def _build_summary_body() -> bytes:
+    """Query, encode and cache the content summary"""
+    body = _CONTENT_SUMMARY.dump_json(await asyncio.to_thread(_fetch_summary))
+    _summary_cache.set(None, body)
+    return body
 
 @router.get("/summary", response_model=ContentSummary)
 async def get_content_summary_endpoint(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """Get content performance summary for dashboard"""
-    try:
-        check_permission(current_user, "read:reports")
-        
-        summary = get_content_summary(db)
-        
+    check_permission(current_user, "read:reports")
+    
+    body = _summary_cache.get(None)
+    if body is None:
+        body = await _summary_builds.run(None, _build_summary_body)
+    
+    if log_sampled():
         logger.info("Content summary retrieved", user_id=current_user.id)
-        
-        return summary
-        
-    except Exception as e:
-        logger.error("Failed to get content summary", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve content summary"
-        )
+    
+    return Response(content=body, media_type="application/json")
+
+@router.get("/catalog")
+async def get_catalog(
+    current_user: User = Depends(get_current_user)
+):
+    """Get channels, verticals, formats and performance tiers in one call
+
+    Preferred way to bootstrap filter dropdowns; the individual endpoints
+    below return the same data one list at a time.
+    """
+    check_permission(current_user, "read:content")
+    check_permission(current_user, "read:reports")
+    
+    return Response(content=_CATALOG_JSON, media_type="application/json")
 
 @router.get("/channels")
 async def get_supported_channels(
     current_user: User = Depends(get_current_user)
 ):
     """Get list of supported content channels"""
-    try:
-        check_permission(current_user, "read:content")
-        
-        from app.config import CONTENT_INTELLIGENCE_CONFIG
-        
-        return {
-            "channels": CONTENT_INTELLIGENCE_CONFIG["supported_channels"],
-            "total_count": len(CONTENT_INTELLIGENCE_CONFIG["supported_channels"])
-        }
-        
-    except Exception as e:
-        logger.error("Failed to get supported channels", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve supported channels"
-        )
+    check_permission(current_user, "read:content")
+    
+    return Response(content=_CHANNELS_JSON, media_type="application/json")
 
 @router.get("/verticals")
 async def get_supported_verticals(
     current_user: User = Depends(get_current_user)
 ):
     """Get list of supported business verticals"""
-    try:
-        check_permission(current_user, "read:content")
-        
-        from app.config import CONTENT_INTELLIGENCE_CONFIG
-        
-        return {
-            "verticals": CONTENT_INTELLIGENCE_CONFIG["supported_verticals"],
-            "total_count": len(CONTENT_INTELLIGENCE_CONFIG["supported_verticals"])
-        }
-        
-    except Exception as e:
-        logger.error("Failed to get supported verticals", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve supported verticals"
-        )
+    check_permission(current_user, "read:content")
+    
+    return Response(content=_VERTICALS_JSON, media_type="application/json")
 
 @router.get("/formats")
 async def get_supported_formats(
     current_user: User = Depends(get_current_user)
 ):
     """Get list of supported content formats"""
-    try:
-        check_permission(current_user, "read:content")
-        
-        from app.config import CONTENT_INTELLIGENCE_CONFIG
-        
-        return {
-            "formats": CONTENT_INTELLIGENCE_CONFIG["supported_formats"],
-            "total_count": len(CONTENT_INTELLIGENCE_CONFIG["supported_formats"])
-        }
-        
-    except Exception as e:
-        logger.error("Failed to get supported formats", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve supported formats"
-        )
+    check_permission(current_user, "read:content")
+    
+    return Response(content=_FORMATS_JSON, media_type="application/json")
 
 @router.get("/performance-tiers")
 async def get_performance_tiers(
     current_user: User = Depends(get_current_user)
 ):
     """Get performance tier definitions"""
-    try:
-        check_permission(current_user, "read:reports")
-        
-        return {
-            "roi_tiers": {
-                "exceptional": {"min": 100, "description": "ROI >= 100%"},
-                "excellent": {"min": 50, "max": 99, "description": "ROI 50-99%"},
-                "good": {"min": 20, "max": 49, "description": "ROI 20-49%"},
-                "positive": {"min": 0, "max": 19, "description": "ROI 0-19%"},
-                "neutral": {"min": -20, "max": -1, "description": "ROI -20% to -1%"},
-                "negative": {"max": -20, "description": "ROI < -20%"}
-            },
-            "performance_tiers": {
-                "high_performing": {"min": 0.1, "description": "View rate >= 10%"},
-                "medium_performing": {"min": 0.05, "max": 0.099, "description": "View rate 5-9.9%"},
-                "low_performing": {"max": 0.049, "description": "View rate < 5%"}
-            },
-            "engagement_tiers": {
-                "high_engagement": {"min": 0.15, "description": "Engagement rate >= 15%"},
-                "medium_engagement": {"min": 0.08, "max": 0.149, "description": "Engagement rate 8-14.9%"},
-                "low_engagement": {"max": 0.079, "description": "Engagement rate < 8%"}
-            }
-        }
-        
-    except Exception as e:
-        logger.error("Failed to get performance tiers", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve performance tiers"
-        ) 
\ No newline at end of file
+    check_permission(current_user, "read:reports")
+    
+    return Response(content=_PERFORMANCE_TIERS_JSON, media_type="application/json")
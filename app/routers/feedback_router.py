@@ -1,10 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy import Integer, bindparam, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from datetime import date, datetime, timezone
+import asyncio
 from typing import Optional, List
+from pydantic import TypeAdapter
 import structlog
 
-from app.database import get_db
-from app.models.auth import User, get_current_user, UserRole
+from app.cache import TTLCache
+from app.database import get_async_db, get_async_db_ro, get_db, get_db_ro
+from app.dependencies import json_body, json_body_openapi
+from app.metrics import log_sampled
+from app.responses import model_from_row, model_json_response, stream_json_array
+from app.models.auth import User, UserRole
 from app.models.feedback import (
     FeedbackSubmission, FeedbackResponse, FeedbackEvent, FeedbackReview,
     FeedbackApplication, RuleOverride, AuditTrail, FeedbackSummary,
@@ -12,38 +21,80 @@ from app.models.feedback import (
 )
 from app.services.feedback_service import (
     submit_feedback, review_feedback, apply_feedback, search_feedback,
-    get_feedback_summary, get_audit_trail
+    get_feedback_summary, audit_trail_query
 )
-from app.services.permission_service import check_permission
+from app.services.permission_service import check_permission, get_current_user
+# ORM tables; the unsuffixed names above are the API's pydantic models
+from app.sql_models import FeedbackEvent as FeedbackEventRow, RuleOverride as RuleOverrideRow
 
 logger = structlog.get_logger()
 
 router = APIRouter()
 
-@router.post("/feedback", response_model=FeedbackResponse, status_code=status.HTTP_201_CREATED)
+# Serializers for the high-volume responses (built once, encoded in Rust)
+_AUDIT_TRAIL = TypeAdapter(AuditTrail)
+_FEEDBACK_EVENT = TypeAdapter(FeedbackEvent)
+_RULE_OVERRIDE_LIST = TypeAdapter(List[RuleOverride])
+_FEEDBACK_SEARCH = TypeAdapter(FeedbackSearchResponse)
+_FEEDBACK_SUMMARY = TypeAdapter(FeedbackSummary)
+
+# Serialized dashboard summary; cleared by every endpoint that changes feedback state
+FEEDBACK_SUMMARY_CACHE_TTL_SECONDS = 60
+_summary_cache = TTLCache(FEEDBACK_SUMMARY_CACHE_TTL_SECONDS, maxsize=1)
+
+# Rows buffered per round trip when streaming the audit trail
+AUDIT_TRAIL_FETCH_BATCH_SIZE = 200
+
+# Read statements are built once; per request only the bound values change, so
+# SQLAlchemy's compiled cache is hit without rebuilding the Select first
+_FEEDBACK_BY_STATUS_STMT = (
+    select(FeedbackEventRow)
+    .where(FeedbackEventRow.status == bindparam("status"))
+    .order_by(FeedbackEventRow.created_at.desc())
+    .limit(bindparam("limit", type_=Integer))
+)
+
+def _rule_overrides_stmt(by_type: bool, by_active: bool):
+    """Rule override listing with only the requested filters in the WHERE clause"""
+    stmt = select(RuleOverrideRow)
+    if by_type:
+        stmt = stmt.where(RuleOverrideRow.override_type == bindparam("override_type"))
+    if by_active:
+        stmt = stmt.where(RuleOverrideRow.is_active == bindparam("is_active"))
+    return stmt.order_by(RuleOverrideRow.created_at.desc())
+
+# Keyed by (filter by type, filter by active flag)
+_RULE_OVERRIDES_STMTS = {
+    (by_type, by_active): _rule_overrides_stmt(by_type, by_active)
+    for by_type in (False, True)
+    for by_active in (False, True)
+}
+
+# Statuses from which the submitter may still withdraw feedback
+_WITHDRAWABLE_STATUSES = (FeedbackStatus.PENDING.value, FeedbackStatus.UNDER_REVIEW.value)
+
+@router.post(
+    "/feedback",
+    response_model=FeedbackResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(FeedbackSubmission)
+)
 async def submit_feedback_endpoint(
-    feedback_data: FeedbackSubmission,
+    feedback_data: FeedbackSubmission = Depends(json_body(FeedbackSubmission)),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Submit stakeholder feedback for review"""
-    try:
-        # Check if user has permission to submit feedback
-        check_permission(current_user, "write:feedback")
-        
-        # Submit feedback
-        response = submit_feedback(db, feedback_data, current_user)
-        
-        logger.info("Feedback submitted", user_id=current_user.id, feedback_id=response.feedback_id, type=feedback_data.feedback_type)
-        
-        return response
-        
-    except Exception as e:
-        logger.error("Failed to submit feedback", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to submit feedback"
-        )
+    # Check if user has permission to submit feedback
+    check_permission(current_user, "write:feedback")
+    
+    # Submit feedback
+    response = await asyncio.to_thread(submit_feedback, db, feedback_data, current_user)
+    _summary_cache.clear()
+    
+    logger.info("Feedback submitted", user_id=current_user.id, feedback_id=response.feedback_id, type=feedback_data.feedback_type)
+    
+    return response
 
 @router.get("/feedback", response_model=FeedbackSearchResponse)
 async def search_feedback_endpoint(
@@ -52,102 +103,61 @@ async def search_feedback_endpoint(
     status: Optional[str] = Query(None, description="Filter by status"),
     actor_role: Optional[str] = Query(None, description="Filter by actor role"),
     target_type: Optional[str] = Query(None, description="Filter by target type"),
-    date_from: Optional[str] = Query(None, description="Filter from date (YYYY-MM-DD)"),
-    date_to: Optional[str] = Query(None, description="Filter to date (YYYY-MM-DD)"),
+    date_from: Optional[date] = Query(None, description="Filter from date (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="Filter to date (YYYY-MM-DD)"),
     priority: Optional[str] = Query(None, description="Filter by priority"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Page size"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db_ro)
 ):
     """Search and filter feedback items"""
-    try:
-        check_permission(current_user, "read:feedback")
-        
-        # Parse dates if provided
-        from datetime import datetime
-        parsed_date_from = None
-        parsed_date_to = None
-        
-        if date_from:
-            try:
-                parsed_date_from = datetime.strptime(date_from, "%Y-%m-%D").date()
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid date_from format. Use YYYY-MM-DD"
-                )
-        
-        if date_to:
-            try:
-                parsed_date_to = datetime.strptime(date_to, "%Y-%m-%D").date()
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid date_to format. Use YYYY-MM-DD"
-                )
-        
-        # Build search request
-        search_request = FeedbackSearchRequest(
-            query=query,
-            feedback_type=feedback_type,
-            status=status,
-            actor_role=actor_role,
-            target_type=target_type,
-            date_from=parsed_date_from,
-            date_to=parsed_date_to,
-            priority=priority,
-            page=page,
-            page_size=page_size
-        )
-        
-        # Search feedback
-        search_response = search_feedback(db, search_request, current_user)
-        
+    check_permission(current_user, "read:feedback")
+    
+    # Build search request
+    search_request = FeedbackSearchRequest(
+        query=query,
+        feedback_type=feedback_type,
+        status=status,
+        actor_role=actor_role,
+        target_type=target_type,
+        date_from=date_from,
+        date_to=date_to,
+        priority=priority,
+        page=page,
+        page_size=page_size
+    )
+    
+    # Search feedback
+    search_response = await asyncio.to_thread(search_feedback, db, search_request, current_user)
+    
+    if log_sampled():
         logger.info("Feedback search completed", user_id=current_user.id, results_count=len(search_response.results))
-        
-        return search_response
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to search feedback", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to search feedback"
-        )
+    
+    return model_json_response(_FEEDBACK_SEARCH, search_response)
 
 @router.get("/feedback/{feedback_id}", response_model=FeedbackEvent)
 async def get_feedback_details(
     feedback_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db_ro)
 ):
     """Get detailed information about a specific feedback item"""
-    try:
-        check_permission(current_user, "read:feedback")
-        
-        # Get feedback details
-        feedback = db.query(FeedbackEvent).filter(FeedbackEvent.id == feedback_id).first()
-        
-        if not feedback:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Feedback not found: {feedback_id}"
-            )
-        
-        logger.info("Feedback details retrieved", user_id=current_user.id, feedback_id=feedback_id)
-        
-        return feedback
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to get feedback details", user_id=current_user.id, feedback_id=feedback_id, error=str(e))
+    check_permission(current_user, "read:feedback")
+    
+    # Get feedback details
+    feedback = await db.get(FeedbackEventRow, feedback_id)
+    
+    if not feedback:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve feedback details"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Feedback not found: {feedback_id}"
         )
+    
+    if log_sampled():
+        logger.info("Feedback details retrieved", user_id=current_user.id, feedback_id=feedback_id)
+    
+    return model_from_row(FeedbackEvent, feedback)
 
 @router.post("/feedback/{feedback_id}/review", response_model=FeedbackEvent)
 async def review_feedback_endpoint(
@@ -157,29 +167,20 @@ async def review_feedback_endpoint(
     db: Session = Depends(get_db)
 ):
     """Review and approve/reject feedback (admin only)"""
-    try:
-        # Only finance_admin and strategy_analyst can review feedback
-        if current_user.role not in [UserRole.FINANCE_ADMIN, UserRole.STRATEGY_ANALYST]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Insufficient permissions to review feedback"
-            )
-        
-        # Review feedback
-        updated_feedback = review_feedback(db, feedback_id, review_data, current_user)
-        
-        logger.info("Feedback reviewed", reviewer_id=current_user.id, feedback_id=feedback_id, decision=review_data.decision)
-        
-        return updated_feedback
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to review feedback", reviewer_id=current_user.id, feedback_id=feedback_id, error=str(e))
+    # Only finance_admin and strategy_analyst can review feedback
+    if current_user.role not in [UserRole.FINANCE_ADMIN, UserRole.STRATEGY_ANALYST]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to review feedback"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to review feedback"
         )
+    
+    # Review feedback
+    updated_feedback = await asyncio.to_thread(review_feedback, db, feedback_id, review_data, current_user)
+    _summary_cache.clear()
+    
+    logger.info("Feedback reviewed", reviewer_id=current_user.id, feedback_id=feedback_id, decision=review_data.decision)
+    
+    return model_json_response(_FEEDBACK_EVENT, updated_feedback)
 
 @router.post("/feedback/{feedback_id}/apply", response_model=FeedbackApplication)
 async def apply_feedback_endpoint(
@@ -188,49 +189,38 @@ async def apply_feedback_endpoint(
     db: Session = Depends(get_db)
 ):
     """Apply approved feedback (admin only)"""
-    try:
-        # Only finance_admin can apply feedback
-        if current_user.role != UserRole.FINANCE_ADMIN:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only finance administrators can apply feedback"
-            )
-        
-        # Apply feedback
-        application = apply_feedback(db, feedback_id, current_user)
-        
-        logger.info("Feedback applied", applier_id=current_user.id, feedback_id=feedback_id)
-        
-        return application
-        
-    except Exception as e:
-        logger.error("Failed to apply feedback", applier_id=current_user.id, feedback_id=feedback_id, error=str(e))
+    # Only finance_admin can apply feedback
+    if current_user.role != UserRole.FINANCE_ADMIN:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to apply feedback"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only finance administrators can apply feedback"
         )
+    
+    # Apply feedback
+    application = await asyncio.to_thread(apply_feedback, db, feedback_id, current_user)
+    _summary_cache.clear()
+    
+    logger.info("Feedback applied", applier_id=current_user.id, feedback_id=feedback_id)
+    
+    return application
 
 @router.get("/feedback/summary", response_model=FeedbackSummary)
 async def get_feedback_summary_endpoint(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db_ro)
 ):
     """Get feedback summary for dashboard"""
-    try:
-        check_permission(current_user, "read:feedback")
-        
-        summary = get_feedback_summary(db)
-        
+    check_permission(current_user, "read:feedback")
+    
+    body = _summary_cache.get(None)
+    if body is None:
+        body = _FEEDBACK_SUMMARY.dump_json(await asyncio.to_thread(get_feedback_summary, db))
+        _summary_cache.set(None, body)
+    
+    if log_sampled():
         logger.info("Feedback summary retrieved", user_id=current_user.id)
-        
-        return summary
-        
-    except Exception as e:
-        logger.error("Failed to get feedback summary", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve feedback summary"
-        )
+    
+    return Response(content=body, media_type="application/json")
 
 @router.get("/audit-trail", response_model=List[AuditTrail])
 async def get_audit_trail_endpoint(
@@ -238,182 +228,135 @@ async def get_audit_trail_endpoint(
     record_id: Optional[str] = Query(None, description="Filter by record ID"),
     action: Optional[str] = Query(None, description="Filter by action type"),
     changed_by: Optional[str] = Query(None, description="Filter by user who made changes"),
-    date_from: Optional[str] = Query(None, description="Filter from date (YYYY-MM-DD)"),
-    date_to: Optional[str] = Query(None, description="Filter to date (YYYY-MM-DD)"),
+    date_from: Optional[date] = Query(None, description="Filter from date (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="Filter to date (YYYY-MM-DD)"),
     limit: int = Query(100, ge=1, le=1000, description="Number of results to return"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db_ro)
 ):
     """Get audit trail for data changes"""
-    try:
-        # Only finance_admin and strategy_analyst can view audit trail
-        if current_user.role not in [UserRole.FINANCE_ADMIN, UserRole.STRATEGY_ANALYST]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Insufficient permissions to view audit trail"
-            )
-        
-        # Parse dates if provided
-        from datetime import datetime
-        parsed_date_from = None
-        parsed_date_to = None
-        
-        if date_from:
-            try:
-                parsed_date_from = datetime.strptime(date_from, "%Y-%m-%D").date()
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid date_from format. Use YYYY-MM-DD"
-                )
-        
-        if date_to:
-            try:
-                parsed_date_to = datetime.strptime(date_to, "%Y-%m-%D").date()
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid date_to format. Use YYYY-MM-DD"
-                )
-        
-        # Get audit trail
-        audit_trail = get_audit_trail(
-            db, table_name, record_id, action, changed_by, 
-            parsed_date_from, parsed_date_to, limit
-        )
-        
-        logger.info("Audit trail retrieved", user_id=current_user.id, count=len(audit_trail))
-        
-        return audit_trail
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to get audit trail", user_id=current_user.id, error=str(e))
+    # Only finance_admin and strategy_analyst can view audit trail
+    if current_user.role not in [UserRole.FINANCE_ADMIN, UserRole.STRATEGY_ANALYST]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve audit trail"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to view audit trail"
         )
+    
+    # audit_trail_query only builds the SELECT; with yield_per the rows come off
+    # a server-side cursor in batches and are encoded one by one while the
+    # response streams, so up to 1000 entries never sit in memory at once
+    stmt = audit_trail_query(table_name, record_id, action, changed_by, date_from, date_to, limit)
+    audit_trail = (await asyncio.to_thread(
+        db.execute, stmt.execution_options(yield_per=AUDIT_TRAIL_FETCH_BATCH_SIZE)
+    )).scalars()
+    
+    if log_sampled():
+        logger.info("Audit trail requested", user_id=current_user.id, limit=limit)
+    
+    return stream_json_array(_AUDIT_TRAIL, (model_from_row(AuditTrail, row) for row in audit_trail))
 
 @router.get("/rule-overrides", response_model=List[RuleOverride])
 async def get_rule_overrides(
     override_type: Optional[str] = Query(None, description="Filter by override type"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db_ro)
 ):
     """Get active rule overrides"""
-    try:
-        check_permission(current_user, "read:feedback")
-        
-        # Build query
-        query = db.query(RuleOverride)
-        
-        if override_type:
-            query = query.filter(RuleOverride.override_type == override_type)
-        
-        if is_active is not None:
-            query = query.filter(RuleOverride.is_active == is_active)
-        
-        # Get overrides
-        overrides = query.order_by(RuleOverride.created_at.desc()).all()
-        
+    check_permission(current_user, "read:feedback")
+    
+    # Unused bound values are ignored by the statements that omit that filter
+    overrides = (await db.execute(
+        _RULE_OVERRIDES_STMTS[bool(override_type), is_active is not None],
+        {"override_type": override_type, "is_active": is_active}
+    )).scalars().all()
+    
+    if log_sampled():
         logger.info("Rule overrides retrieved", user_id=current_user.id, count=len(overrides))
-        
-        return overrides
-        
-    except Exception as e:
-        logger.error("Failed to get rule overrides", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve rule overrides"
-        )
+    
+    return model_json_response(_RULE_OVERRIDE_LIST, [model_from_row(RuleOverride, row) for row in overrides])
 
 @router.post("/feedback/{feedback_id}/withdraw")
 async def withdraw_feedback(
     feedback_id: str,
     reason: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Withdraw submitted feedback (only by original submitter)"""
-    try:
-        check_permission(current_user, "write:feedback")
-        
-        # Get feedback
-        feedback = db.query(FeedbackEvent).filter(FeedbackEvent.id == feedback_id).first()
-        
-        if not feedback:
+    check_permission(current_user, "write:feedback")
+    
+    actor_id = str(current_user.id)
+    now = datetime.now(timezone.utc)
+    
+    # Ownership check, status check and write in one statement; the withdrawal
+    # note is merged into the JSONB payload server-side
+    withdrawn = (await db.execute(
+        update(FeedbackEventRow)
+        .where(
+            FeedbackEventRow.id == feedback_id,
+            FeedbackEventRow.actor_id == actor_id,
+            FeedbackEventRow.status.in_(_WITHDRAWABLE_STATUSES)
+        )
+        .values(
+            status=FeedbackStatus.REJECTED.value,
+            updated_at=now,
+            payload=FeedbackEventRow.payload.op("||")(
+                func.jsonb_build_object(
+                    "withdrawal_reason", reason,
+                    "withdrawn_by", actor_id,
+                    "withdrawn_at", now.isoformat()
+                )
+            )
+        )
+        .returning(FeedbackEventRow.id)
+        .execution_options(synchronize_session=False)
+    )).first()
+    
+    if withdrawn is None:
+        # Nothing updated: one lookup to tell the caller why
+        feedback = (await db.execute(
+            select(FeedbackEventRow.actor_id, FeedbackEventRow.status).where(FeedbackEventRow.id == feedback_id)
+        )).first()
+        
+        if feedback is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Feedback not found: {feedback_id}"
             )
         
-        # Check if user is the original submitter
-        if feedback.actor_id != str(current_user.id):
+        if feedback.actor_id != actor_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only the original submitter can withdraw feedback"
             )
         
-        # Check if feedback can be withdrawn
-        if feedback.status not in [FeedbackStatus.PENDING, FeedbackStatus.UNDER_REVIEW]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Feedback cannot be withdrawn in its current status"
-            )
-        
-        # Update status
-        feedback.status = FeedbackStatus.REJECTED
-        feedback.updated_at = datetime.utcnow()
-        
-        # Add withdrawal note to payload
-        if not feedback.payload:
-            feedback.payload = {}
-        feedback.payload["withdrawal_reason"] = reason
-        feedback.payload["withdrawn_by"] = str(current_user.id)
-        feedback.payload["withdrawn_at"] = datetime.utcnow().isoformat()
-        
-        db.commit()
-        
-        logger.info("Feedback withdrawn", user_id=current_user.id, feedback_id=feedback_id, reason=reason)
-        
-        return {"message": "Feedback withdrawn successfully"}
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to withdraw feedback", user_id=current_user.id, feedback_id=feedback_id, error=str(e))
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to withdraw feedback"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Feedback cannot be withdrawn in its current status"
         )
+    
+    await db.commit()
+    _summary_cache.clear()
+    
+    logger.info("Feedback withdrawn", user_id=current_user.id, feedback_id=feedback_id, reason=reason)
+    
+    return {"message": "Feedback withdrawn successfully"}
 
 @router.get("/feedback/status/{status}", response_model=List[FeedbackEvent])
 async def get_feedback_by_status(
     status: FeedbackStatus,
     limit: int = Query(50, ge=1, le=100, description="Number of results to return"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db_ro)
 ):
     """Get feedback items by status"""
-    try:
-        check_permission(current_user, "read:feedback")
-        
-        # Get feedback by status
-        feedback_items = db.query(FeedbackEvent).filter(
-            FeedbackEvent.status == status
-        ).order_by(
-            FeedbackEvent.created_at.desc()
-        ).limit(limit).all()
-        
-        logger.info("Feedback by status retrieved", user_id=current_user.id, status=status, count=len(feedback_items))
-        
-        return feedback_items
-        
-    except Exception as e:
-        logger.error("Failed to get feedback by status", user_id=current_user.id, status=status, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve feedback by status"
-        ) 
\ No newline at end of file
+    check_permission(current_user, "read:feedback")
+    
+    # Server-side cursor: rows are encoded as they arrive instead of after the fetch
+    feedback_items = await db.stream_scalars(_FEEDBACK_BY_STATUS_STMT, {"status": status, "limit": limit})
+    
+    if log_sampled():
+        logger.info("Feedback by status requested", user_id=current_user.id, status=status, limit=limit)
+    
+    return stream_json_array(_FEEDBACK_EVENT, (model_from_row(FeedbackEvent, row) async for row in feedback_items))
@@ -1,21 +1,133 @@
 from fastapi import APIRouter, Response
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from fastapi.responses import ORJSONResponse
+import asyncio
+import orjson
+import psutil
+import time
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST, REGISTRY
 import structlog
 
+from app.cache import TTLCache
 from app.database import get_db_health
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
 
 logger = structlog.get_logger()
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Exposition payload shared by scrapes that land within the TTL (e.g. HA Prometheus pairs)
+PROMETHEUS_CACHE_TTL_SECONDS = 2
+_prometheus_cache = TTLCache(PROMETHEUS_CACHE_TTL_SECONDS, maxsize=1)
+
+# /health hammering cannot turn into database round trips: the DB check runs at most
+# once per interval and is otherwise answered from the last result
+DB_HEALTH_MIN_INTERVAL_SECONDS = 5
+_db_health_cache = TTLCache(DB_HEALTH_MIN_INTERVAL_SECONDS, maxsize=1)
+
+# Placeholder metric sections (static until wired to real sources), serialized once.
+# Once they become dynamic, serve orjson.dumps(snapshot) from a TTLCache instead.
+_PERFORMANCE_METRICS = {
+    "api_latency_p95_ms": 150,
+    "api_latency_p99_ms": 300,
+    "database_query_time_avg_ms": 25,
+    "database_connections_active": 5,
+    "database_connections_pool_size": 10,
+    "requests_per_minute": 120,
+    "error_rate_percent": 0.1,
+    "uptime_percent": 99.9
+}
+_BUSINESS_METRICS = {
+    "total_content_pieces": 30,
+    "active_campaigns": 5,
+    "total_revenue_usd": 150000,
+    "total_cost_usd": 75000,
+    "overall_roi_percent": 100,
+    "content_performance_score_avg": 75.5,
+    "feedback_items_pending": 3,
+    "feedback_approval_rate_percent": 85.7
+}
+_DATA_QUALITY_METRICS = {
+    "data_freshness_hours": 2,
+    "data_completeness_percent": 98.5,
+    "data_accuracy_percent": 99.2,
+    "failed_tests_count": 0,
+    "total_tests_count": 150,
+    "test_success_rate_percent": 100,
+    "data_lineage_completeness_percent": 95.0,
+    "last_data_validation": "2024-01-01T00:00:00Z"
+}
+_ML_MODEL_METRICS = {
+    "model_version": "v1.0",
+    "model_type": "lightgbm",
+    "prediction_accuracy_mape": 18.5,
+    "prediction_accuracy_smape": 16.2,
+    "model_confidence_avg": 0.82,
+    "predictions_made_today": 45,
+    "predictions_made_total": 1250,
+    "last_model_training": "2024-01-01T00:00:00Z",
+    "feature_importance_top_3": {
+        "channel": 0.25,
+        "vertical": 0.20,
+        "format": 0.15
+    }
+}
+
+_PERFORMANCE_METRICS_JSON = orjson.dumps(_PERFORMANCE_METRICS)
+_BUSINESS_METRICS_JSON = orjson.dumps(_BUSINESS_METRICS)
+_DATA_QUALITY_METRICS_JSON = orjson.dumps(_DATA_QUALITY_METRICS)
+_ML_MODEL_METRICS_JSON = orjson.dumps(_ML_MODEL_METRICS)
+
+# Fixed error bodies: failures are logged server-side, never echoed to the caller
+_HEALTH_CHECK_FAILED = {"overall_status": "unhealthy", "error": "Health check failed"}
+_HEALTH_CHECK_FAILED_JSON = orjson.dumps(_HEALTH_CHECK_FAILED)
+_PROMETHEUS_ERROR = b"Error generating metrics"
+_SUMMARY_ERROR_JSON = orjson.dumps({"error": "Failed to generate metrics summary"})
+
+# Latest system snapshot, refreshed in the background by sample_system_health()
+SYSTEM_SAMPLE_INTERVAL_SECONDS = 5
+# Disk usage moves slowly; statvfs on every sample would be wasted work
+DISK_SAMPLE_INTERVAL_SECONDS = 60
+_system_health = {"cpu_percent": 0.0, "memory_percent": 0.0, "disk_percent": 0.0}
+
+async def sample_system_health():
+    """Refresh the system snapshot every SYSTEM_SAMPLE_INTERVAL_SECONDS (run by the lifespan)
+
+    cpu_percent(interval=None) reports usage since its previous call, so the
+    sleep between samples is the measurement window and nothing blocks the loop.
+    """
+    global _system_health
+    
+    psutil.cpu_percent(interval=None)  # Prime the counter; the first reading has no window
+    disk_percent = psutil.disk_usage('/').percent
+    disk_sampled_at = time.monotonic()
+    while True:
+        await asyncio.sleep(SYSTEM_SAMPLE_INTERVAL_SECONDS)
+        
+        now = time.monotonic()
+        if now - disk_sampled_at >= DISK_SAMPLE_INTERVAL_SECONDS:
+            disk_percent = psutil.disk_usage('/').percent
+            disk_sampled_at = now
+        
+        _system_health = {
+            "cpu_percent": psutil.cpu_percent(interval=None),
+            "memory_percent": psutil.virtual_memory().percent,
+            "disk_percent": disk_percent
+        }
 
 @router.get("/prometheus")
 async def get_prometheus_metrics():
     """Get Prometheus metrics"""
     try:
-        metrics = generate_latest()
-        
-        logger.debug("Prometheus metrics generated")
+        # Scrapes racing on an expired entry may both collect; that is duplicate work only
+        metrics = _prometheus_cache.get(None)
+        if metrics is None:
+            # Collectors may do I/O, so serialization stays off the event loop
+            metrics = await asyncio.to_thread(generate_latest, REGISTRY)
+            _prometheus_cache.set(None, metrics)
+            
+            logger.debug("Prometheus metrics generated")
         
         return Response(
             content=metrics,
@@ -24,17 +136,16 @@ async def get_prometheus_metrics():
         
     except Exception as e:
         logger.error("Failed to generate Prometheus metrics", error=str(e))
-        return Response(
-            content="Error generating metrics",
-            status_code=500
-        )
+        return Response(content=_PROMETHEUS_ERROR, status_code=503, media_type="text/plain")
 
-@router.get("/health")
-async def get_health_metrics():
-    """Get comprehensive health metrics"""
+async def _collect_health_metrics() -> dict:
+    """Build the health report (shared by /health and /summary)"""
     try:
-        # Database health
-        db_health = get_db_health()
+        # Database health (sync driver; run off the event loop)
+        db_health = _db_health_cache.get(None)
+        if db_health is None:
+            db_health = await asyncio.to_thread(get_db_health)
+            _db_health_cache.set(None, db_health)
         
         # Application health
         app_health = {
@@ -44,21 +155,15 @@ async def get_health_metrics():
             "timestamp": "2024-01-01T00:00:00Z"  # This would be current time
         }
         
-        # System health
-        import psutil
-        system_health = {
-            "cpu_percent": psutil.cpu_percent(interval=1),
-            "memory_percent": psutil.virtual_memory().percent,
-            "disk_percent": psutil.disk_usage('/').percent
-        }
+        # System health (cached snapshot; sampling here would block for the CPU window)
+        system_health = _system_health
         
         # Overall health status
-        overall_status = "healthy"
-        if db_health["status"] != "healthy":
-            overall_status = "degraded"
-        
-        if system_health["cpu_percent"] > 90 or system_health["memory_percent"] > 90:
-            overall_status = "degraded"
+        overall_status = "degraded" if (
+            db_health["status"] != "healthy"
+            or system_health["cpu_percent"] > 90
+            or system_health["memory_percent"] > 90
+        ) else "healthy"
         
         health_metrics = {
             "overall_status": overall_status,
@@ -73,152 +178,67 @@ async def get_health_metrics():
         
     except Exception as e:
         logger.error("Failed to get health metrics", error=str(e))
-        return {
-            "overall_status": "unhealthy",
-            "error": str(e)
-        }
+        return _HEALTH_CHECK_FAILED
+
+@router.get("/health")
+async def get_health_metrics():
+    """Get comprehensive health metrics"""
+    health = await _collect_health_metrics()
+    if health is _HEALTH_CHECK_FAILED:
+        return Response(content=_HEALTH_CHECK_FAILED_JSON, status_code=503, media_type="application/json")
+    
+    # Returned as a response so FastAPI skips jsonable_encoder; orjson encodes the dict
+    return ORJSONResponse(health)
 
 @router.get("/performance")
 async def get_performance_metrics():
     """Get performance metrics"""
-    try:
-        # This would include various performance indicators
-        # For now, returning placeholder data
-        performance_metrics = {
-            "api_latency_p95_ms": 150,
-            "api_latency_p99_ms": 300,
-            "database_query_time_avg_ms": 25,
-            "database_connections_active": 5,
-            "database_connections_pool_size": 10,
-            "requests_per_minute": 120,
-            "error_rate_percent": 0.1,
-            "uptime_percent": 99.9
-        }
-        
-        logger.debug("Performance metrics retrieved")
-        
-        return performance_metrics
-        
-    except Exception as e:
-        logger.error("Failed to get performance metrics", error=str(e))
-        return {
-            "error": "Failed to retrieve performance metrics"
-        }
+    logger.debug("Performance metrics retrieved")
+    
+    return Response(content=_PERFORMANCE_METRICS_JSON, media_type="application/json")
 
 @router.get("/business")
 async def get_business_metrics():
     """Get business metrics"""
-    try:
-        # This would include business KPIs
-        # For now, returning placeholder data
-        business_metrics = {
-            "total_content_pieces": 30,
-            "active_campaigns": 5,
-            "total_revenue_usd": 150000,
-            "total_cost_usd": 75000,
-            "overall_roi_percent": 100,
-            "content_performance_score_avg": 75.5,
-            "feedback_items_pending": 3,
-            "feedback_approval_rate_percent": 85.7
-        }
-        
-        logger.debug("Business metrics retrieved")
-        
-        return business_metrics
-        
-    except Exception as e:
-        logger.error("Failed to get business metrics", error=str(e))
-        return {
-            "error": "Failed to retrieve business metrics"
-        }
+    logger.debug("Business metrics retrieved")
+    
+    return Response(content=_BUSINESS_METRICS_JSON, media_type="application/json")
 
 @router.get("/data-quality")
 async def get_data_quality_metrics():
     """Get data quality metrics"""
-    try:
-        # This would include data quality indicators
-        # For now, returning placeholder data
-        data_quality_metrics = {
-            "data_freshness_hours": 2,
-            "data_completeness_percent": 98.5,
-            "data_accuracy_percent": 99.2,
-            "failed_tests_count": 0,
-            "total_tests_count": 150,
-            "test_success_rate_percent": 100,
-            "data_lineage_completeness_percent": 95.0,
-            "last_data_validation": "2024-01-01T00:00:00Z"
-        }
-        
-        logger.debug("Data quality metrics retrieved")
-        
-        return data_quality_metrics
-        
-    except Exception as e:
-        logger.error("Failed to get data quality metrics", error=str(e))
-        return {
-            "error": "Failed to retrieve data quality metrics"
-        }
+    logger.debug("Data quality metrics retrieved")
+    
+    return Response(content=_DATA_QUALITY_METRICS_JSON, media_type="application/json")
 
 @router.get("/ml-model")
 async def get_ml_model_metrics():
     """Get ML model performance metrics"""
-    try:
-        # This would include ML model performance indicators
-        # For now, returning placeholder data
-        ml_metrics = {
-            "model_version": "v1.0",
-            "model_type": "lightgbm",
-            "prediction_accuracy_mape": 18.5,
-            "prediction_accuracy_smape": 16.2,
-            "model_confidence_avg": 0.82,
-            "predictions_made_today": 45,
-            "predictions_made_total": 1250,
-            "last_model_training": "2024-01-01T00:00:00Z",
-            "feature_importance_top_3": {
-                "channel": 0.25,
-                "vertical": 0.20,
-                "format": 0.15
-            }
-        }
-        
-        logger.debug("ML model metrics retrieved")
-        
-        return ml_metrics
-        
-    except Exception as e:
-        logger.error("Failed to get ML model metrics", error=str(e))
-        return {
-            "error": "Failed to retrieve ML model metrics"
-        }
+    logger.debug("ML model metrics retrieved")
+    
+    return Response(content=_ML_MODEL_METRICS_JSON, media_type="application/json")
 
 @router.get("/summary")
 async def get_metrics_summary():
     """Get summary of all metrics"""
     try:
-        # Get all metric categories
-        health = await get_health_metrics()
-        performance = await get_performance_metrics()
-        business = await get_business_metrics()
-        data_quality = await get_data_quality_metrics()
-        ml_model = await get_ml_model_metrics()
+        # Health is the only live section; the others are the static placeholders
+        health = await _collect_health_metrics()
         
         summary = {
             "timestamp": "2024-01-01T00:00:00Z",
             "overall_status": health.get("overall_status", "unknown"),
             "health": health,
-            "performance": performance,
-            "business": business,
-            "data_quality": data_quality,
-            "ml_model": ml_model
+            "performance": _PERFORMANCE_METRICS,
+            "business": _BUSINESS_METRICS,
+            "data_quality": _DATA_QUALITY_METRICS,
+            "ml_model": _ML_MODEL_METRICS
         }
         
         logger.info("Metrics summary generated", overall_status=summary["overall_status"])
         
-        return summary
+        return ORJSONResponse(summary)
         
     except Exception as e:
         logger.error("Failed to get metrics summary", error=str(e))
-        return {
-            "error": "Failed to generate metrics summary",
-            "timestamp": "2024-01-01T00:00:00Z"
-        } 
\ No newline at end of file
+        return Response(content=_SUMMARY_ERROR_JSON, status_code=503, media_type="application/json") 
\ No newline at end of file
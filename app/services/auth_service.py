@@ -6,26 +6,47 @@ Handles user authentication, JWT token management, and user operations.
 
 import hashlib
 import secrets
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from passlib.context import CryptContext
-from jose import JWTError, jwt
+import jwt
 from sqlalchemy.orm import Session
 
 from ..models.auth import User, UserCreate, UserUpdate, UserInDB, TokenData, UserRole
+from ..cache import TTLCache
+from ..responses import model_from_row
 from ..config import SECURITY_CONFIG
 from ..database import get_db
 
+# Decoded bearer tokens kept per process; entries are also checked against the token's exp
+VERIFIED_TOKEN_CACHE_MAX_ENTRIES = 10_000
+
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash checked for unknown usernames, so they cost as much as a wrong password"""
+    return pwd_context.hash(secrets.token_urlsafe(16))
+
 class AuthService:
     """Authentication service for user management and JWT operations"""
     
     def __init__(self):
-        self.secret_key = SECURITY_CONFIG["SECRET_KEY"]
-        self.algorithm = SECURITY_CONFIG["ALGORITHM"]
-        self.access_token_expire_minutes = SECURITY_CONFIG["ACCESS_TOKEN_EXPIRE_MINUTES"]
+        self.secret_key = SECURITY_CONFIG["secret_key"]
+        self.algorithm = SECURITY_CONFIG["algorithm"]
+        self.access_token_expire_minutes = SECURITY_CONFIG["access_token_expire_minutes"]
+        self._access_ttl_seconds = self.access_token_expire_minutes * 60
+        # Accepted algorithms for decoding, built once instead of per request
+        self._decode_algorithms = (self.algorithm,)
+        # HMAC key as bytes once, so PyJWT does not re-encode the secret per token
+        self._signing_key = self.secret_key.encode()
+        # token -> (TokenData, exp epoch seconds); skips HMAC + JSON on repeat requests
+        self._verified_tokens = TTLCache(self._access_ttl_seconds, VERIFIED_TOKEN_CACHE_MAX_ENTRIES)
+        # Demo user store: built (and bcrypt-hashed) on first use, then updated in place
+        self._fake_users: Optional[Dict[str, UserInDB]] = None
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
@@ -38,26 +59,31 @@ class AuthService:
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """Create a JWT access token"""
         to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
-        
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        # exp is an epoch in the token, so compute it as one directly
+        ttl_seconds = expires_delta.total_seconds() if expires_delta else self._access_ttl_seconds
+        to_encode["exp"] = int(time.time() + ttl_seconds)
+        encoded_jwt = jwt.encode(to_encode, self._signing_key, algorithm=self.algorithm)
         return encoded_jwt
     
     def verify_token(self, token: str) -> Optional[TokenData]:
-        """Verify and decode a JWT token"""
+        """Verify and decode a JWT token (valid tokens are cached until they expire)"""
+        cached = self._verified_tokens.get(token)
+        if cached is not None and cached[1] > time.time():
+            return cached[0]
+        
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = jwt.decode(token, self._signing_key, algorithms=self._decode_algorithms)
             username: str = payload.get("sub")
             if username is None:
                 return None
             token_data = TokenData(username=username)
-            return token_data
-        except JWTError:
+        except jwt.InvalidTokenError:
             return None
+        
+        expires_at = payload.get("exp")
+        if expires_at is not None:
+            self._verified_tokens.set(token, (token_data, expires_at))
+        return token_data
     
     def authenticate_user(self, username: str, password: str) -> Optional[User]:
         """Authenticate a user with username and password"""
@@ -65,10 +91,12 @@ class AuthService:
         # For demo purposes, we'll use a simple in-memory user store
         fake_users_db = self._get_fake_users()
         
-        if username not in fake_users_db:
+        user = fake_users_db.get(username)
+        if user is None:
+            # Same bcrypt work as a real check: response time must not reveal valid usernames
+            self.verify_password(password, _dummy_password_hash())
             return None
         
-        user = fake_users_db[username]
         if not self.verify_password(password, user.hashed_password):
             return None
         
@@ -81,6 +109,7 @@ class AuthService:
         
         # Generate a unique user ID
         user_id = secrets.token_urlsafe(16)
+        now = datetime.now(timezone.utc)
         
         db_user = UserInDB(
             id=user_id,
@@ -90,21 +119,12 @@ class AuthService:
             hashed_password=hashed_password,
             role=user.role,
             is_active=True,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         )
         
-        # Convert to User model for response
-        return User(
-            id=db_user.id,
-            username=db_user.username,
-            email=db_user.email,
-            full_name=db_user.full_name,
-            role=db_user.role,
-            is_active=db_user.is_active,
-            created_at=db_user.created_at,
-            updated_at=db_user.updated_at
-        )
+        # Public view of the already-validated record (no second validation pass)
+        return model_from_row(User, db_user)
     
     def get_user_by_username(self, username: str) -> Optional[User]:
         """Get a user by username"""
@@ -130,7 +150,7 @@ class AuthService:
         if user_update.is_active is not None:
             user.is_active = user_update.is_active
         
-        user.updated_at = datetime.utcnow()
+        user.updated_at = datetime.now(timezone.utc)
         
         return user
     
@@ -149,7 +169,7 @@ class AuthService:
         
         # Hash new password
         user.hashed_password = self.get_password_hash(new_password)
-        user.updated_at = datetime.utcnow()
+        user.updated_at = datetime.now(timezone.utc)
         
         return True
     
@@ -162,13 +182,24 @@ class AuthService:
         
         user = fake_users_db[username]
         user.is_active = False
-        user.updated_at = datetime.utcnow()
+        user.updated_at = datetime.now(timezone.utc)
         
         return True
     
+    def load_users(self) -> None:
+        """Build the user store ahead of the first request (blocking: bcrypt hashes)"""
+        self._get_fake_users()
+    
     def _get_fake_users(self) -> Dict[str, UserInDB]:
         """Get fake users for demo purposes"""
         # In production, this would be replaced with database queries
+        if self._fake_users is None:
+            self._fake_users = self._build_fake_users()
+        return self._fake_users
+    
+    def _build_fake_users(self) -> Dict[str, UserInDB]:
+        """Build the seeded demo users (four bcrypt hashes, so done once per process)"""
+        now = datetime.now(timezone.utc)
         return {
             "admin": UserInDB(
                 id="admin-001",
@@ -176,10 +207,10 @@ class AuthService:
                 email="admin@company.com",
                 full_name="System Administrator",
                 hashed_password=self.get_password_hash("admin123"),
-                role=UserRole.finance_admin,
+                role=UserRole.FINANCE_ADMIN,
                 is_active=True,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=now,
+                updated_at=now
             ),
             "analyst": UserInDB(
                 id="analyst-001",
@@ -187,10 +218,10 @@ class AuthService:
                 email="analyst@company.com",
                 full_name="Strategy Analyst",
                 hashed_password=self.get_password_hash("analyst123"),
-                role=UserRole.strategy_analyst,
+                role=UserRole.STRATEGY_ANALYST,
                 is_active=True,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=now,
+                updated_at=now
             ),
             "marketing": UserInDB(
                 id="marketing-001",
@@ -198,10 +229,10 @@ class AuthService:
                 email="marketing@company.com",
                 full_name="Marketing Manager",
                 hashed_password=self.get_password_hash("marketing123"),
-                role=UserRole.marketing_user,
+                role=UserRole.MARKETING_USER,
                 is_active=True,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=now,
+                updated_at=now
             ),
             "viewer": UserInDB(
                 id="viewer-001",
@@ -209,10 +240,10 @@ class AuthService:
                 email="viewer@company.com",
                 full_name="Read Only User",
                 hashed_password=self.get_password_hash("viewer123"),
-                role=UserRole.read_only,
+                role=UserRole.READ_ONLY,
                 is_active=True,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=now,
+                updated_at=now
             )
         }
 
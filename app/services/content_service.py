@@ -4,9 +4,14 @@ Content Intelligence Platform - Content Service
 Handles content-related business logic including KPIs, leaderboards, and ROI predictions.
 """
 
+import bisect
+import heapq
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from functools import lru_cache
+from operator import itemgetter
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Dict, Optional, Any, Tuple
+import numpy as np
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
@@ -15,11 +20,525 @@ from ..models.content import (
     LeaderboardEntry, ROIPredictionRequest, ROIPrediction, ContentSummary,
     MetricDefinition, MetricDefinitionsResponse, TimeGrain, SortBy, SortOrder
 )
-from ..config import CONTENT_INTELLIGENCE_CONFIG, ML_CONFIG
+from ..config import CONTENT_INTELLIGENCE_CONFIG, ML_CONFIG, settings
 from ..database import get_db
+from ..responses import model_from_row
 
 logger = logging.getLogger(__name__)
 
+# Shared provenance of the canonical metric definitions (bump both when they change)
+METRIC_DEFINITIONS_VERSION = "v1.0"
+METRIC_DEFINITIONS_UPDATED = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_KPI_MART = "mart_content_kpis"
+
+@lru_cache(maxsize=1)
+def _metric_definitions() -> Tuple[MetricDefinition, ...]:
+    """Canonical metric definitions; static, so they are built and validated once"""
+    common = {
+        "data_source": _KPI_MART,
+        "calculation_frequency": "daily",
+        "last_updated": METRIC_DEFINITIONS_UPDATED,
+        "version": METRIC_DEFINITIONS_VERSION,
+    }
+    return (
+        MetricDefinition(
+            metric_name="roi",
+            display_name="ROI",
+            description="Return on Investment: (Revenue - Cost) / Cost * 100",
+            formula="(attributed_revenue - allocated_cost) / allocated_cost * 100",
+            unit="percentage",
+            business_owner="Finance",
+            min_value=-100.0,
+            related_metrics=["roas"],
+            business_context="Primary measure of whether content pays back its fully loaded cost",
+            use_cases=["Content investment decisions", "Leaderboard ranking"],
+            caveats=["Costs must be fully allocated", "Revenue must be properly attributed"],
+            **common
+        ),
+        MetricDefinition(
+            metric_name="cpm",
+            display_name="CPM",
+            description="Cost Per Mille: Cost per 1000 impressions",
+            formula="allocated_cost / (impressions / 1000)",
+            unit="currency per 1000 impressions",
+            business_owner="Finance",
+            min_value=0.0,
+            related_metrics=["cpc", "cpa"],
+            business_context="Cost efficiency of buying reach",
+            use_cases=["Channel cost comparison", "Media budget planning"],
+            caveats=["Impressions must be valid", "Costs must be allocated"],
+            **common
+        ),
+        MetricDefinition(
+            metric_name="cpc",
+            display_name="CPC",
+            description="Cost Per Click: Cost per click-through",
+            formula="allocated_cost / click_throughs",
+            unit="currency per click",
+            business_owner="Finance",
+            min_value=0.0,
+            related_metrics=["cpm", "ctr"],
+            business_context="Cost efficiency of driving traffic",
+            use_cases=["Channel cost comparison", "Bid strategy review"],
+            caveats=["Click-throughs must be valid", "Costs must be allocated"],
+            **common
+        ),
+        MetricDefinition(
+            metric_name="cpa",
+            display_name="CPA",
+            description="Cost Per Acquisition: Cost per conversion",
+            formula="allocated_cost / conversions",
+            unit="currency per conversion",
+            business_owner="Finance",
+            min_value=0.0,
+            related_metrics=["cpc", "cvr"],
+            business_context="Cost of each acquired customer or lead",
+            use_cases=["Acquisition budget planning", "Funnel efficiency review"],
+            caveats=["Conversions must be valid", "Costs must be allocated"],
+            **common
+        ),
+        MetricDefinition(
+            metric_name="roas",
+            display_name="ROAS",
+            description="Return on Ad Spend: Revenue / Cost",
+            formula="attributed_revenue / allocated_cost",
+            unit="ratio",
+            business_owner="Finance",
+            min_value=0.0,
+            related_metrics=["roi"],
+            business_context="Revenue returned per unit of spend",
+            use_cases=["Paid channel evaluation", "Spend reallocation"],
+            caveats=["Revenue must be attributed", "Costs must be allocated"],
+            **common
+        ),
+        MetricDefinition(
+            metric_name="engagement_rate",
+            display_name="Engagement Rate",
+            description="Engagement interactions per view",
+            formula="(likes + shares + comments) / views * 100",
+            unit="percentage",
+            business_owner="Marketing",
+            min_value=0.0,
+            related_metrics=["view_rate"],
+            business_context="How strongly viewers interact with content",
+            use_cases=["Creative quality review", "Format comparison"],
+            caveats=["Views must be valid", "All engagement types counted equally"],
+            **common
+        ),
+        MetricDefinition(
+            metric_name="view_rate",
+            display_name="View Rate",
+            description="Views per impression",
+            formula="views / impressions * 100",
+            unit="percentage",
+            business_owner="Marketing",
+            min_value=0.0,
+            max_value=100.0,
+            related_metrics=["ctr", "engagement_rate"],
+            business_context="Share of impressions that turn into views",
+            use_cases=["Thumbnail and headline testing", "Channel reach quality"],
+            caveats=["Impressions must be valid", "Views must be unique"],
+            **common
+        ),
+        MetricDefinition(
+            metric_name="ctr",
+            display_name="CTR",
+            description="Click-Through Rate: Clicks per impression",
+            formula="click_throughs / impressions * 100",
+            unit="percentage",
+            business_owner="Marketing",
+            min_value=0.0,
+            max_value=100.0,
+            related_metrics=["cpc", "cvr"],
+            business_context="Share of impressions that drive a click",
+            use_cases=["Call-to-action testing", "Channel traffic quality"],
+            caveats=["Impressions must be valid", "Clicks must be valid"],
+            **common
+        ),
+        MetricDefinition(
+            metric_name="cvr",
+            display_name="CVR",
+            description="Conversion Rate: Conversions per click",
+            formula="conversions / click_throughs * 100",
+            unit="percentage",
+            business_owner="SalesOps",
+            min_value=0.0,
+            max_value=100.0,
+            related_metrics=["ctr", "cpa"],
+            business_context="Share of clicks that convert",
+            use_cases=["Landing page optimization", "Funnel efficiency review"],
+            caveats=["Click-throughs must be valid", "Conversions must be valid"],
+            **common
+        )
+    )
+
+# ROI lower bounds for each performance tier after the first, ascending
+_TIER_THRESHOLDS = (25, 50, 75, 100)
+_TIER_LABELS = ("Underperformer", "Low Performer", "Medium Performer", "High Performer", "Top Performer")
+
+# Heuristic ROI model: base ROI (%) scaled by per-attribute multipliers (1.0 if unknown)
+_ROI_BASE = 50.0
+_CHANNEL_ROI_MULTIPLIERS = {
+    "YouTube": 1.2, "TikTok": 1.3, "Blog": 1.0,
+    "Email": 0.8, "LinkedIn": 1.1, "Twitter": 0.9
+}
+_VERTICAL_ROI_MULTIPLIERS = {
+    "B2B SaaS": 1.4, "Technology": 1.3, "Finance": 1.2,
+    "E-commerce": 1.1, "Marketing": 1.0, "Sales": 1.1
+}
+_FORMAT_ROI_MULTIPLIERS = {"video": 1.3, "blog": 1.0, "ad": 0.9, "email": 0.8}
+def _multiplier_array(multipliers: Dict[str, float]) -> Tuple[Dict[str, int], np.ndarray]:
+    """(name -> slot, multipliers) for vectorized lookups; the extra last slot is 1.0 for unknown names"""
+    return {name: i for i, name in enumerate(multipliers)}, np.array([*multipliers.values(), 1.0])
+
+_CHANNEL_ROI_SLOTS, _CHANNEL_ROI_ARRAY = _multiplier_array(_CHANNEL_ROI_MULTIPLIERS)
+_VERTICAL_ROI_SLOTS, _VERTICAL_ROI_ARRAY = _multiplier_array(_VERTICAL_ROI_MULTIPLIERS)
+_FORMAT_ROI_SLOTS, _FORMAT_ROI_ARRAY = _multiplier_array(_FORMAT_ROI_MULTIPLIERS)
+_roi_noise = np.random.default_rng()
+# Attributes the heuristic actually reads
+_ROI_HEURISTIC_FEATURES = ("channel", "vertical", "format")
+
+_MOCK_FEATURE_IMPORTANCE = {
+    "channel": 0.25,
+    "vertical": 0.30,
+    "format": 0.20,
+    "region": 0.15,
+    "publish_date": 0.10
+}
+
+# Sort keys for the mock leaderboard rows (other sort fields leave them unsorted)
+_MOCK_LEADERBOARD_SORT_KEYS = {
+    SortBy.ROI: itemgetter("roi"),
+    SortBy.ENGAGEMENT: itemgetter("engagement"),
+    SortBy.VIEWS: itemgetter("views"),
+}
+
+# Leaderboard sort fields -> mart columns. Only names from these tables are spliced
+# into the SQL; every filter value is a bound parameter.
+_LEADERBOARD_SORT_COLUMNS = {
+    SortBy.ROI: "roi_pct",
+    SortBy.REVENUE: "revenue",
+    SortBy.ENGAGEMENT: "engagement_rate_pct",
+    SortBy.PERFORMANCE_SCORE: "performance_score",
+    SortBy.VIEWS: "views",
+    SortBy.CONVERSIONS: "conversions",
+    SortBy.COST: "cost",
+}
+_LEADERBOARD_SORT_DIRECTIONS = {SortOrder.ASC: "ASC", SortOrder.DESC: "DESC"}
+_LEADERBOARD_FILTER_PREDICATES = {
+    "channel": "channel = :channel",
+    "vertical": "vertical = :vertical",
+    "format": "format = :format",
+    "roi_min": "roi_pct >= :roi_min",
+    "roi_max": "roi_pct <= :roi_max",
+}
+_LEADERBOARD_DATE_PREDICATES = {
+    "date_from": "event_date >= :date_from",
+    "date_to": "event_date <= :date_to",
+}
+_LEADERBOARD_COLUMNS = """
+    content_id, title, vertical, format, channel, publish_date, owner_team,
+    roi_pct, revenue, cost, net_profit, views, conversions, performance_score,
+    roi_tier, performance_tier, engagement_tier
+"""
+
+def _dated_leaderboard_source(date_predicates: List[str]) -> str:
+    """Per-content totals over a date range, in the shape of mart_content_leaderboard"""
+    return f"""(
+        select
+            content_id, title, vertical, format, channel, publish_date, owner_team,
+            roi_pct, revenue, cost, revenue - cost as net_profit, views, conversions,
+            engagement_rate_pct, performance_score,
+            case
+                when roi_pct >= 100 then 'exceptional'
+                when roi_pct >= 50 then 'excellent'
+                when roi_pct >= 20 then 'good'
+                when roi_pct >= 0 then 'positive'
+                when roi_pct >= -20 then 'neutral'
+                else 'negative'
+            end as roi_tier,
+            performance_tier, engagement_tier
+        from (
+            select
+                content_id,
+                max(title) as title,
+                max(vertical) as vertical,
+                max(format) as format,
+                max(channel) as channel,
+                max(publish_dt) as publish_date,
+                max(owner_team) as owner_team,
+                sum(views) as views,
+                sum(conversions) as conversions,
+                sum(total_revenue) as revenue,
+                sum(allocated_cost) as cost,
+                case
+                    when sum(impressions) > 0 then round(
+                        (sum(likes) + sum(shares) + sum(comments))::numeric / sum(impressions) * 100, 2
+                    )
+                    else 0
+                end as engagement_rate_pct,
+                case
+                    when sum(allocated_cost) > 0 then round(
+                        (sum(total_revenue) - sum(allocated_cost)) / sum(allocated_cost) * 100, 2
+                    )
+                    else 0
+                end as roi_pct,
+                round(avg(performance_score), 1) as performance_score,
+                (array_agg(performance_tier order by event_date desc))[1] as performance_tier,
+                (array_agg(engagement_tier order by event_date desc))[1] as engagement_tier
+            from {settings.marts_schema}.mart_content_kpis
+            where {" and ".join(date_predicates)}
+            group by content_id
+        ) totals
+    )"""
+
+@lru_cache(maxsize=256)
+def _leaderboard_statements(sort_by: str, sort_order: str, filter_names: Tuple[str, ...]):
+    """(page, count) statements for one sort/filter combination, built once per shape"""
+    lifetime_table = f"{settings.marts_schema}.mart_content_leaderboard"
+    sort_column = _LEADERBOARD_SORT_COLUMNS[sort_by]
+    
+    if not filter_names and sort_order == SortOrder.DESC:
+        # The common unfiltered top-N: dbt stores each row's rank per sort field, so a
+        # page of any depth is an index range seek on <field>_rank (no OFFSET scan)
+        page = text(f"""
+            select {_LEADERBOARD_COLUMNS}, {sort_column}_rank as rank
+            from {lifetime_table}
+            where {sort_column}_rank > :offset
+            order by {sort_column}_rank
+            limit :limit
+        """)
+        return page, text(f"select count(*) from {lifetime_table}")
+    
+    date_predicates = [_LEADERBOARD_DATE_PREDICATES[f] for f in filter_names if f in _LEADERBOARD_DATE_PREDICATES]
+    if date_predicates:
+        source = _dated_leaderboard_source(date_predicates)
+    else:
+        # Lifetime totals: precomputed by dbt with every sort field indexed
+        source = lifetime_table
+    
+    predicates = [_LEADERBOARD_FILTER_PREDICATES[f] for f in filter_names if f in _LEADERBOARD_FILTER_PREDICATES]
+    where = f"where {' and '.join(predicates)}" if predicates else ""
+    order = f"{sort_column} {_LEADERBOARD_SORT_DIRECTIONS[sort_order]}"
+    
+    # content_id breaks ties so pages never overlap or skip rows. row_number() is
+    # evaluated before LIMIT/OFFSET, so it is the global rank, and since it shares the
+    # ORDER BY it streams off the same sorted input instead of a second sort.
+    page = text(f"""
+        select {_LEADERBOARD_COLUMNS},
+            row_number() over (order by {order}, content_id) as rank
+        from {source} lb
+        {where}
+        order by {order}, content_id
+        limit :limit offset :offset
+    """)
+    count = text(f"select count(*) from {source} lb {where}")
+    return page, count
+
+def get_content_leaderboard(db: Session, sort_by: str, sort_order: str, limit: int, offset: int,
+                            **filters) -> LeaderboardResponse:
+    """Leaderboard page, filtered, sorted and paginated by the database
+
+    Without a date range the page is an index scan of the lifetime leaderboard
+    mart; a date range aggregates the daily KPI mart for that window instead.
+    """
+    page_stmt, count_stmt = _leaderboard_statements(sort_by, sort_order, tuple(sorted(filters)))
+    
+    rows = db.execute(page_stmt, {**filters, "limit": limit, "offset": offset})
+    entries = [model_from_row(LeaderboardEntry, row) for row in rows]
+    total_count = db.execute(count_stmt, filters).scalar_one()
+    
+    return LeaderboardResponse(
+        entries=entries,
+        total_count=total_count,
+        page=offset // limit + 1,
+        page_size=limit,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        filters_applied=filters
+    )
+
+# KPI columns by how a coarser grain rolls them up. Money and rates are cast to
+# float8 so rows can go straight into model_from_row without Decimal values.
+_KPI_COUNT_COLUMNS = (
+    "impressions", "views", "unique_viewers", "likes", "shares", "comments",
+    "click_throughs", "conversions",
+)
+_KPI_AMOUNT_COLUMNS = (
+    "conversion_value", "allocated_cost", "production_cost", "media_cost",
+    "tooling_cost", "licensing_cost", "distribution_cost",
+)
+_KPI_TIER_COLUMNS = (
+    "performance_tier", "engagement_tier", "lifecycle_stage",
+    "channel_performance_tier", "business_impact_tier",
+)
+_KPI_DAILY_METRICS = ", ".join((
+    *_KPI_COUNT_COLUMNS,
+    *(f"{c}::float8 as {c}" for c in _KPI_AMOUNT_COLUMNS),
+    *(f"{c}::float8 as {c}" for c in (
+        "view_rate_pct", "ctr_pct", "cvr_pct", "engagement_rate_pct", "dwell_seconds_median",
+        "cpm", "cpc", "cpa", "roi_pct", "roas", "net_profit", "performance_score",
+    )),
+    *_KPI_TIER_COLUMNS, "roi_tier", "days_since_publish",
+))
+# Period totals with the mart's own rate and unit-economics formulas re-applied
+_KPI_PERIOD_METRICS = ", ".join((
+    *(f"sum({c})::bigint as {c}" for c in _KPI_COUNT_COLUMNS),
+    *(f"sum({c})::float8 as {c}" for c in _KPI_AMOUNT_COLUMNS),
+    "coalesce(sum(views)::float8 / nullif(sum(impressions), 0), 0) as view_rate_pct",
+    "coalesce(sum(click_throughs)::float8 / nullif(sum(views), 0), 0) as ctr_pct",
+    "coalesce(sum(conversions)::float8 / nullif(sum(click_throughs), 0), 0) as cvr_pct",
+    "coalesce((sum(likes) + sum(shares) + sum(comments))::float8 / nullif(sum(views), 0), 0) as engagement_rate_pct",
+    "avg(dwell_seconds_median)::float8 as dwell_seconds_median",
+    "coalesce(round(sum(allocated_cost) / nullif(sum(impressions), 0) * 1000, 2), 0)::float8 as cpm",
+    "coalesce(round(sum(allocated_cost) / nullif(sum(click_throughs), 0), 2), 0)::float8 as cpc",
+    "coalesce(round(sum(allocated_cost) / nullif(sum(conversions), 0), 2), 0)::float8 as cpa",
+    "coalesce(round((sum(total_revenue) - sum(allocated_cost)) / nullif(sum(allocated_cost), 0) * 100, 2), 0)::float8 as roi_pct",
+    "coalesce(round(sum(total_revenue) / nullif(sum(allocated_cost), 0), 2), 0)::float8 as roas",
+    "(case when sum(allocated_cost) > 0 then sum(total_revenue) - sum(allocated_cost) else 0 end)::float8 as net_profit",
+    "round(avg(performance_score), 1)::float8 as performance_score",
+    # Tiers and lifecycle stage describe the period's latest day
+    *(f"(array_agg({c} order by event_date desc))[1] as {c}" for c in _KPI_TIER_COLUMNS),
+    "max(days_since_publish) as days_since_publish",
+))
+_KPI_DATE_PREDICATES = {
+    "start_date": "event_date >= :start_date",
+    "end_date": "event_date <= :end_date",
+}
+
+@lru_cache(maxsize=32)
+def _content_kpis_statement(grain: str, date_filters: Tuple[str, ...]):
+    """KPI rows for one content item at one grain, built once per shape"""
+    where = " and ".join(("content_id = :content_id", *(_KPI_DATE_PREDICATES[f] for f in date_filters)))
+    metadata = "content_id, title, vertical, format, channel"
+    
+    if grain == TimeGrain.DAY:
+        # The mart is already daily
+        return text(f"""
+            select {metadata}, publish_dt as publish_date, owner_team, {_KPI_DAILY_METRICS}, event_date
+            from {settings.marts_schema}.mart_content_kpis
+            where {where}
+            order by event_date
+        """)
+    
+    # grain is one of the TimeGrainValue literals, a valid date_trunc field
+    return text(f"""
+        select *, case
+            when roi_pct >= 100 then 'exceptional'
+            when roi_pct >= 50 then 'excellent'
+            when roi_pct >= 20 then 'good'
+            when roi_pct >= 0 then 'positive'
+            when roi_pct >= -20 then 'neutral'
+            else 'negative'
+        end as roi_tier
+        from (
+            select
+                content_id, max(title) as title, max(vertical) as vertical,
+                max(format) as format, max(channel) as channel,
+                max(publish_dt) as publish_date, max(owner_team) as owner_team,
+                {_KPI_PERIOD_METRICS},
+                date_trunc('{grain}', event_date)::date as event_date
+            from {settings.marts_schema}.mart_content_kpis
+            where {where}
+            group by content_id, date_trunc('{grain}', event_date)
+        ) per_period
+        order by event_date
+    """)
+
+def get_content_kpis(db: Session, content_id: str, grain: str = TimeGrain.DAY,
+                     start_date: Optional[date] = None, end_date: Optional[date] = None,
+                     include_breakdown: bool = False) -> List[ContentKPIs]:
+    """KPI rows for one content item from the daily KPI mart, rolled up to grain
+
+    The cost breakdown columns are always returned (ContentKPIs requires them),
+    so include_breakdown does not change the query.
+    """
+    params = {"content_id": content_id, "start_date": start_date, "end_date": end_date}
+    date_filters = tuple(f for f in _KPI_DATE_PREDICATES if params[f] is not None)
+    rows = db.execute(_content_kpis_statement(grain, date_filters), params)
+    return [model_from_row(ContentKPIs, row) for row in rows]
+
+def _breakdown_json(dimension: str) -> str:
+    """json_object_agg of per-value totals for one dimension of the lifetime leaderboard"""
+    return f"""(
+        select coalesce(json_object_agg(value, stats), '{{}}')
+        from (
+            select
+                coalesce({dimension}, 'unknown') as value,
+                json_build_object(
+                    'content_count', count(*),
+                    'views', sum(views),
+                    'conversions', sum(conversions),
+                    'revenue', sum(revenue),
+                    'cost', sum(cost),
+                    'roi_pct', case
+                        when sum(cost) > 0 then round((sum(revenue) - sum(cost)) / sum(cost) * 100, 2)
+                        else 0
+                    end
+                ) as stats
+            from content
+            group by 1
+        ) per_value
+    )"""
+
+def _distribution_json(tier: str) -> str:
+    """json_object_agg of content counts per tier"""
+    return f"""(
+        select coalesce(json_object_agg(tier, n), '{{}}')
+        from (select coalesce({tier}, 'unknown') as tier, count(*) as n from content group by 1) per_tier
+    )"""
+
+def _trend_json(period: str, window: str) -> str:
+    """json_agg of daily mart totals bucketed by period over the trailing window"""
+    return f"""(
+        select coalesce(json_agg(json_build_object(
+            'period', bucket, 'views', views, 'conversions', conversions,
+            'revenue', revenue, 'cost', cost
+        ) order by bucket), '[]')
+        from (
+            select
+                date_trunc('{period}', event_date)::date as bucket,
+                sum(views) as views,
+                sum(conversions) as conversions,
+                sum(total_revenue) as revenue,
+                sum(allocated_cost) as cost
+            from {settings.marts_schema}.mart_content_kpis
+            where event_date >= current_date - interval '{window}'
+            group by 1
+        ) per_period
+    )"""
+
+# Every summary figure in one statement and one round trip: headline totals,
+# breakdowns and distributions come from the lifetime leaderboard mart (one row
+# per content item), trends from the daily mart, nested values as JSON columns.
+_CONTENT_SUMMARY_STMT = text(f"""
+    with content as (
+        select * from {settings.marts_schema}.mart_content_leaderboard
+    )
+    select
+        count(*) as total_content,
+        coalesce(sum(revenue), 0)::float8 as total_revenue,
+        coalesce(sum(cost), 0)::float8 as total_cost,
+        case
+            when sum(cost) > 0 then round((sum(revenue) - sum(cost)) / sum(cost) * 100, 2)
+            else 0
+        end::float8 as total_roi,
+        coalesce(round(avg(performance_score), 1), 0)::float8 as avg_performance_score,
+        {_breakdown_json("channel")} as by_channel,
+        {_breakdown_json("vertical")} as by_vertical,
+        {_breakdown_json("format")} as by_format,
+        {_distribution_json("roi_tier")} as roi_distribution,
+        {_distribution_json("performance_tier")} as performance_distribution,
+        {_trend_json("day", "30 days")} as daily_metrics,
+        {_trend_json("week", "12 weeks")} as weekly_metrics,
+        {_trend_json("month", "12 months")} as monthly_metrics
+    from content
+""")
+
+def get_content_summary(db: Session) -> ContentSummary:
+    """Dashboard summary, aggregated by the database in a single query"""
+    return model_from_row(ContentSummary, db.execute(_CONTENT_SUMMARY_STMT).one())
+
 class ContentService:
     """Service for content-related operations"""
     
@@ -55,14 +574,49 @@ class ContentService:
         )
     
     async def predict_roi(self, request: ROIPredictionRequest) -> ROIPrediction:
-        """Predict ROI for content attributes"""
-        logger.info("Predicting ROI for content")
+        """Predict ROI for content attributes (a batch of one)"""
+        return self.predict_roi_batch([request])[0]
+    
+    def predict_roi_batch(self, requests: List[ROIPredictionRequest]) -> List[ROIPrediction]:
+        """Predict ROI for many content variants with one vectorized pass
+
+        CPU-bound and synchronous: async callers run it with asyncio.to_thread.
+        """
+        logger.info("Predicting ROI for %d content variants", len(requests))
         
-        # In a real implementation, this would call the ML model
-        # For demo purposes, we'll return mock predictions
-        mock_prediction = self._generate_mock_roi_prediction(request)
+        n = len(requests)
+        attributes = [r.content_attributes for r in requests]
+        channels = np.fromiter(
+            (_CHANNEL_ROI_SLOTS.get(a["channel"], -1) for a in attributes), dtype=np.intp, count=n
+        )
+        verticals = np.fromiter(
+            (_VERTICAL_ROI_SLOTS.get(a["vertical"], -1) for a in attributes), dtype=np.intp, count=n
+        )
+        formats = np.fromiter(
+            (_FORMAT_ROI_SLOTS.get(a["format"], -1) for a in attributes), dtype=np.intp, count=n
+        )
         
-        return mock_prediction
+        # Heuristic model: base ROI times the attribute multipliers (slot -1 is 1.0)
+        predicted = (
+            _ROI_BASE * _CHANNEL_ROI_ARRAY[channels] * _VERTICAL_ROI_ARRAY[verticals] * _FORMAT_ROI_ARRAY[formats]
+        )
+        predicted += _roi_noise.uniform(-10, 10, size=n)
+        np.maximum(predicted, 0, out=predicted)
+        
+        prediction_date = datetime.now(timezone.utc)
+        return [
+            ROIPrediction(
+                predicted_roi=roi,
+                confidence_score=0.75,
+                prediction_date=prediction_date,
+                feature_importance=_MOCK_FEATURE_IMPORTANCE,
+                model_version="v1.0",
+                model_type="heuristic",
+                features_used=_ROI_HEURISTIC_FEATURES,
+                input_features=attrs
+            )
+            for roi, attrs in zip(predicted.round(2).tolist(), attributes)
+        ]
     
     async def get_content_summary(self) -> ContentSummary:
         """Get high-level content summary for dashboards"""
@@ -78,85 +632,14 @@ class ContentService:
         """Get canonical metric definitions"""
         logger.info("Getting metric definitions")
         
-        definitions = [
-            MetricDefinition(
-                name="ROI",
-                description="Return on Investment: (Revenue - Cost) / Cost * 100",
-                formula="(attributed_revenue - allocated_cost) / allocated_cost * 100",
-                unit="percentage",
-                category="financial",
-                caveats=["Costs must be fully allocated", "Revenue must be properly attributed"]
-            ),
-            MetricDefinition(
-                name="CPM",
-                description="Cost Per Mille: Cost per 1000 impressions",
-                formula="allocated_cost / (impressions / 1000)",
-                unit="currency per 1000 impressions",
-                category="efficiency",
-                caveats=["Impressions must be valid", "Costs must be allocated"]
-            ),
-            MetricDefinition(
-                name="CPC",
-                description="Cost Per Click: Cost per click-through",
-                formula="allocated_cost / click_throughs",
-                unit="currency per click",
-                category="efficiency",
-                caveats=["Click-throughs must be valid", "Costs must be allocated"]
-            ),
-            MetricDefinition(
-                name="CPA",
-                description="Cost Per Acquisition: Cost per conversion",
-                formula="allocated_cost / conversions",
-                unit="currency per conversion",
-                category="efficiency",
-                caveats=["Conversions must be valid", "Costs must be allocated"]
-            ),
-            MetricDefinition(
-                name="ROAS",
-                description="Return on Ad Spend: Revenue / Cost",
-                formula="attributed_revenue / allocated_cost",
-                unit="ratio",
-                category="financial",
-                caveats=["Revenue must be attributed", "Costs must be allocated"]
-            ),
-            MetricDefinition(
-                name="Engagement Rate",
-                description="Engagement interactions per view",
-                formula="(likes + shares + comments) / views * 100",
-                unit="percentage",
-                category="quality",
-                caveats=["Views must be valid", "All engagement types counted equally"]
-            ),
-            MetricDefinition(
-                name="View Rate",
-                description="Views per impression",
-                formula="views / impressions * 100",
-                unit="percentage",
-                category="reach",
-                caveats=["Impressions must be valid", "Views must be unique"]
-            ),
-            MetricDefinition(
-                name="CTR",
-                description="Click-Through Rate: Clicks per impression",
-                formula="click_throughs / impressions * 100",
-                unit="percentage",
-                category="conversion",
-                caveats=["Impressions must be valid", "Clicks must be valid"]
-            ),
-            MetricDefinition(
-                name="CVR",
-                description="Conversion Rate: Conversions per click",
-                formula="conversions / click_throughs * 100",
-                unit="percentage",
-                category="conversion",
-                caveats=["Click-throughs must be valid", "Conversions must be valid"]
-            )
-        ]
+        definitions = _metric_definitions()
         
+        # Only the wrapper is allocated per call
         return MetricDefinitionsResponse(
-            definitions=definitions,
+            definitions=list(definitions),
             total_count=len(definitions),
-            last_updated=datetime.utcnow().isoformat()
+            last_updated=METRIC_DEFINITIONS_UPDATED,
+            version=METRIC_DEFINITIONS_VERSION
         )
     
     async def get_channels(self) -> List[str]:
@@ -191,11 +674,17 @@ class ContentService:
             "conversion_value": 9000
         }
         
+        impressions = base_metrics["impressions"]
+        views = base_metrics["views"]
+        clicks = base_metrics["click_throughs"]
+        conversions = base_metrics["conversions"]
+        per_impression_pct = 100 / impressions
+        
         # Calculate derived metrics
-        view_rate = (base_metrics["views"] / base_metrics["impressions"]) * 100
-        ctr = (base_metrics["click_throughs"] / base_metrics["impressions"]) * 100
-        cvr = (base_metrics["conversions"] / base_metrics["click_throughs"]) * 100
-        engagement_rate = ((base_metrics["likes"] + base_metrics["shares"] + base_metrics["comments"]) / base_metrics["views"]) * 100
+        view_rate = views * per_impression_pct
+        ctr = clicks * per_impression_pct
+        cvr = conversions / clicks * 100
+        engagement_rate = (base_metrics["likes"] + base_metrics["shares"] + base_metrics["comments"]) / views * 100
         
         # Mock costs and revenue
         allocated_cost = 5000
@@ -204,9 +693,9 @@ class ContentService:
         # Calculate financial metrics
         roi = ((attributed_revenue - allocated_cost) / allocated_cost) * 100
         roas = attributed_revenue / allocated_cost
-        cpm = allocated_cost / (base_metrics["impressions"] / 1000)
-        cpc = allocated_cost / base_metrics["click_throughs"]
-        cpa = allocated_cost / base_metrics["conversions"]
+        cpm = allocated_cost * 1000 / impressions
+        cpc = allocated_cost / clicks
+        cpa = allocated_cost / conversions
         
         return ContentKPIs(
             content_id=content_id,
@@ -265,18 +754,19 @@ class ContentService:
         if request.filters and request.filters.get("vertical"):
             filtered_content = [c for c in filtered_content if c["vertical"] == request.filters["vertical"]]
         
-        # Sort by requested criteria
-        if request.sort_by == SortBy.roi:
-            filtered_content.sort(key=lambda x: x["roi"], reverse=(request.sort_order == SortOrder.desc))
-        elif request.sort_by == SortBy.engagement:
-            filtered_content.sort(key=lambda x: x["engagement"], reverse=(request.sort_order == SortOrder.desc))
-        elif request.sort_by == SortBy.views:
-            filtered_content.sort(key=lambda x: x["views"], reverse=(request.sort_order == SortOrder.desc))
-        
-        # Apply pagination
+        # Sort by requested criteria and paginate. Page 1 (the common case) only needs
+        # the top page_size rows: a bounded heap, O(n log k) instead of a full sort.
         start_idx = (request.page - 1) * request.page_size
         end_idx = start_idx + request.page_size
-        paginated_content = filtered_content[start_idx:end_idx]
+        sort_key = _MOCK_LEADERBOARD_SORT_KEYS.get(request.sort_by)
+        descending = request.sort_order == SortOrder.DESC
+        if sort_key is None:
+            paginated_content = filtered_content[start_idx:end_idx]
+        elif start_idx == 0:
+            top_k = heapq.nlargest if descending else heapq.nsmallest
+            paginated_content = top_k(request.page_size, filtered_content, key=sort_key)
+        else:
+            paginated_content = sorted(filtered_content, key=sort_key, reverse=descending)[start_idx:end_idx]
         
         # Convert to LeaderboardEntry objects
         for i, content in enumerate(paginated_content):
@@ -295,55 +785,6 @@ class ContentService:
         
         return mock_entries
     
-    def _generate_mock_roi_prediction(self, request: ROIPredictionRequest) -> ROIPrediction:
-        """Generate mock ROI prediction for demo purposes"""
-        # Simple heuristic-based prediction
-        base_roi = 50.0  # Base 50% ROI
-        
-        # Channel adjustments
-        channel_multipliers = {
-            "YouTube": 1.2, "TikTok": 1.3, "Blog": 1.0, 
-            "Email": 0.8, "LinkedIn": 1.1, "Twitter": 0.9
-        }
-        channel_mult = channel_multipliers.get(request.channel, 1.0)
-        
-        # Vertical adjustments
-        vertical_multipliers = {
-            "B2B SaaS": 1.4, "Technology": 1.3, "Finance": 1.2,
-            "E-commerce": 1.1, "Marketing": 1.0, "Sales": 1.1
-        }
-        vertical_mult = vertical_multipliers.get(request.vertical, 1.0)
-        
-        # Format adjustments
-        format_multipliers = {"video": 1.3, "blog": 1.0, "ad": 0.9, "email": 0.8}
-        format_mult = format_multipliers.get(request.format, 1.0)
-        
-        # Calculate predicted ROI
-        predicted_roi = base_roi * channel_mult * vertical_mult * format_mult
-        
-        # Add some randomness for demo
-        import random
-        predicted_roi += random.uniform(-10, 10)
-        predicted_roi = max(0, predicted_roi)  # Ensure non-negative
-        
-        # Mock feature importance
-        feature_importance = {
-            "channel": 0.25,
-            "vertical": 0.30,
-            "format": 0.20,
-            "region": 0.15,
-            "publish_date": 0.10
-        }
-        
-        return ROIPrediction(
-            predicted_roi=round(predicted_roi, 2),
-            confidence_score=0.75,
-            feature_importance=feature_importance,
-            model_version="v1.0",
-            model_type="heuristic",
-            prediction_timestamp=datetime.utcnow()
-        )
-    
     def _generate_mock_content_summary(self) -> ContentSummary:
         """Generate mock content summary for demo purposes"""
         return ContentSummary(
@@ -365,16 +806,8 @@ class ContentService:
     
     def _get_performance_tier(self, roi: float) -> str:
         """Get performance tier based on ROI"""
-        if roi >= 100:
-            return "Top Performer"
-        elif roi >= 75:
-            return "High Performer"
-        elif roi >= 50:
-            return "Medium Performer"
-        elif roi >= 25:
-            return "Low Performer"
-        else:
-            return "Underperformer"
+        # bisect_right puts a value equal to a threshold in the tier it opens (roi >= bound)
+        return _TIER_LABELS[bisect.bisect_right(_TIER_THRESHOLDS, roi)]
 
 # Global instance
 content_service = ContentService() 
\ No newline at end of file
@@ -7,10 +7,16 @@ Handles stakeholder feedback processing, rule overrides, and audit trail managem
 import logging
 import json
 import hashlib
-from datetime import datetime, timedelta
+import heapq
+import time
+import uuid
+from collections import Counter
+from operator import attrgetter
+from datetime import date, datetime, timedelta, timezone
 from typing import List, Dict, Optional, Any
+from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import Select, Text, cast, func, or_, select, text
 
 from ..models.feedback import (
     FeedbackSubmission, FeedbackEvent, FeedbackResponse, FeedbackReview,
@@ -20,6 +26,8 @@ from ..models.feedback import (
 )
 from ..models.auth import User, UserRole
 from ..config import CONTENT_INTELLIGENCE_CONFIG
+from ..responses import model_from_row
+from ..sql_models import AuditTrail as AuditTrailRow, FeedbackEvent as FeedbackEventRow
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +49,7 @@ class FeedbackService:
         feedback_id = self._generate_feedback_id(feedback, actor)
         
         # Create feedback event
+        now = datetime.utcnow()
         feedback_event = FeedbackEvent(
             id=feedback_id,
             actor_id=actor.id,
@@ -50,8 +59,8 @@ class FeedbackService:
             target_id=feedback.target_id,
             payload=feedback.payload,
             status=FeedbackStatus.pending,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
             metadata={
                 "actor_username": actor.username,
                 "actor_email": actor.email,
@@ -69,7 +78,7 @@ class FeedbackService:
             target_type="feedback",
             target_id=feedback_id,
             old_value=None,
-            new_value=feedback_event.dict(),
+            new_value=feedback_event.model_dump(),
             description=f"Feedback submitted by {actor.username}"
         )
         
@@ -136,8 +145,7 @@ class FeedbackService:
         feedback.status = review.status
         feedback.review_notes = review.notes
         feedback.reviewed_by = reviewer.id
-        feedback.reviewed_at = datetime.utcnow()
-        feedback.updated_at = datetime.utcnow()
+        feedback.reviewed_at = feedback.updated_at = datetime.utcnow()
         
         # Add to audit trail
         self._add_audit_entry(
@@ -169,6 +177,7 @@ class FeedbackService:
         # Create rule override
         override_id = self._generate_override_id(feedback, application)
         
+        now = datetime.utcnow()
         rule_override = RuleOverride(
             id=override_id,
             feedback_id=feedback_id,
@@ -177,12 +186,12 @@ class FeedbackService:
             old_value=application.old_value,
             new_value=application.new_value,
             applied_by=applier.id,
-            applied_at=datetime.utcnow(),
-            effective_from=application.effective_from or datetime.utcnow(),
+            applied_at=now,
+            effective_from=application.effective_from or now,
             effective_until=application.effective_until,
             description=application.description,
             metadata={
-                "feedback_type": feedback.feedback_type.value,
+                "feedback_type": feedback.feedback_type,
                 "target_type": feedback.target_type.value,
                 "target_id": feedback.target_id,
                 "applier_username": applier.username
@@ -194,8 +203,7 @@ class FeedbackService:
         
         # Update feedback status
         feedback.status = FeedbackStatus.applied
-        feedback.applied_at = datetime.utcnow()
-        feedback.updated_at = datetime.utcnow()
+        feedback.applied_at = feedback.updated_at = now
         
         # Add to audit trail
         self._add_audit_entry(
@@ -248,29 +256,23 @@ class FeedbackService:
         logger.info("Generating feedback summary")
         
         total_feedback = len(self.feedback_store)
-        pending_feedback = len([f for f in self.feedback_store.values() if f.status == FeedbackStatus.pending])
-        approved_feedback = len([f for f in self.feedback_store.values() if f.status == FeedbackStatus.approved])
-        applied_feedback = len([f for f in self.feedback_store.values() if f.status == FeedbackStatus.applied])
-        withdrawn_feedback = len([f for f in self.feedback_store.values() if f.status == FeedbackStatus.withdrawn])
         
-        # Count by type
-        type_counts = {}
+        # Status, type and role counts in one pass over the store
+        status_counts = Counter()
+        type_counts = Counter()
+        role_counts = Counter()
         for feedback in self.feedback_store.values():
-            feedback_type = feedback.feedback_type.value
-            type_counts[feedback_type] = type_counts.get(feedback_type, 0) + 1
+            status_counts[feedback.status] += 1
+            type_counts[feedback.feedback_type] += 1
+            role_counts[feedback.actor_role.value] += 1
         
-        # Count by role
-        role_counts = {}
-        for feedback in self.feedback_store.values():
-            actor_role = feedback.actor_role.value
-            role_counts[actor_role] = role_counts.get(actor_role, 0) + 1
+        pending_feedback = status_counts[FeedbackStatus.PENDING]
+        approved_feedback = status_counts[FeedbackStatus.APPROVED]
+        applied_feedback = status_counts[FeedbackStatus.APPLIED]
+        withdrawn_feedback = status_counts["withdrawn"]
         
-        # Recent activity
-        recent_feedback = sorted(
-            self.feedback_store.values(),
-            key=lambda x: x.created_at,
-            reverse=True
-        )[:10]
+        # Recent activity (top 10 without sorting the whole store)
+        recent_feedback = heapq.nlargest(10, self.feedback_store.values(), key=attrgetter("created_at"))
         
         return FeedbackSummary(
             total_feedback=total_feedback,
@@ -278,8 +280,8 @@ class FeedbackService:
             approved_count=approved_feedback,
             applied_count=applied_feedback,
             withdrawn_count=withdrawn_feedback,
-            type_distribution=type_counts,
-            role_distribution=role_counts,
+            type_distribution=dict(type_counts),
+            role_distribution=dict(role_counts),
             recent_feedback=[f.id for f in recent_feedback],
             last_updated=datetime.utcnow()
         )
@@ -344,7 +346,7 @@ class FeedbackService:
     def _generate_feedback_id(self, feedback: FeedbackSubmission, actor: User) -> str:
         """Generate unique feedback ID"""
         timestamp = datetime.utcnow().isoformat()
-        content = f"{actor.id}:{feedback.feedback_type.value}:{feedback.target_type.value}:{timestamp}"
+        content = f"{actor.id}:{feedback.feedback_type}:{feedback.target_type}:{timestamp}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
     
     def _generate_override_id(self, feedback: FeedbackEvent, application: FeedbackApplication) -> str:
@@ -380,4 +382,224 @@ class FeedbackService:
         self.audit_trail.append(audit_entry)
 
 # Global instance
-feedback_service = FeedbackService() 
\ No newline at end of file
+# Database-backed operations behind the feedback routes. They are synchronous
+# (routes run them with asyncio.to_thread) and raise HTTPException like
+# permission_service, since their callers are request handlers.
+
+# Review decision -> resulting feedback status
+_REVIEW_DECISION_STATUSES = {
+    "approve": FeedbackStatus.APPROVED.value,
+    "reject": FeedbackStatus.REJECTED.value,
+    "request_changes": FeedbackStatus.UNDER_REVIEW.value,
+}
+_REVIEWED_STATUSES = (FeedbackStatus.APPROVED.value, FeedbackStatus.REJECTED.value, FeedbackStatus.APPLIED.value)
+_RECENT_FEEDBACK_LIMIT = 10
+# Feedback actor role recorded for each user role allowed to apply feedback
+_APPLIER_ROLES = {
+    UserRole.FINANCE_ADMIN: ActorRole.FINANCE,
+    UserRole.STRATEGY_ANALYST: ActorRole.STRATEGY,
+    UserRole.MARKETING_USER: ActorRole.MARKETING,
+}
+
+def _like_pattern(query: str) -> str:
+    """Substring ILIKE pattern that matches query literally, escaping with a backslash"""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+def _feedback_row(db: Session, feedback_id: str) -> FeedbackEventRow:
+    """Load one feedback_events row or raise 404"""
+    row = db.get(FeedbackEventRow, feedback_id)
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Feedback not found: {feedback_id}"
+        )
+    return row
+
+def submit_feedback(db: Session, feedback: FeedbackSubmission, actor: User) -> FeedbackResponse:
+    """Store a new feedback event in pending status"""
+    feedback_id = str(uuid.uuid4())
+    db.add(FeedbackEventRow(
+        id=feedback_id,
+        actor_id=str(actor.id),
+        actor_role=feedback.actor_role,
+        feedback_type=feedback.feedback_type,
+        target_type=feedback.target_type,
+        target_id=feedback.target_id,
+        payload=feedback.payload,
+        description=feedback.description,
+        priority=feedback.priority,
+        business_impact=feedback.business_impact,
+        expected_outcome=feedback.expected_outcome,
+        evidence=feedback.evidence,
+        attachments=feedback.attachments
+    ))
+    db.commit()
+    
+    return FeedbackResponse(
+        feedback_id=feedback_id,
+        status=FeedbackStatus.PENDING,
+        message="Feedback submitted successfully and is under review"
+    )
+
+def review_feedback(db: Session, feedback_id: str, review: FeedbackReview, reviewer: User) -> FeedbackEvent:
+    """Record a review decision and its impact analysis"""
+    new_status = _REVIEW_DECISION_STATUSES.get(review.decision)
+    if new_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown review decision: {review.decision}"
+        )
+    
+    row = _feedback_row(db, feedback_id)
+    row.status = new_status
+    row.impact_analysis = review.impact_analysis
+    row.updated_at = datetime.now(timezone.utc)
+    db.commit()
+    
+    logger.info("Feedback %s reviewed by %s: %s", feedback_id, reviewer.username, review.decision)
+    return model_from_row(FeedbackEvent, row)
+
+def apply_feedback(db: Session, feedback_id: str, applier: User) -> FeedbackApplication:
+    """Mark approved feedback as applied"""
+    started = time.perf_counter()
+    applier_role = _APPLIER_ROLES.get(applier.role)
+    if applier_role is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Role {applier.role} cannot apply feedback"
+        )
+    
+    row = _feedback_row(db, feedback_id)
+    if row.status != FeedbackStatus.APPROVED.value:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Feedback must be approved before it can be applied"
+        )
+    
+    now = datetime.now(timezone.utc)
+    row.status = FeedbackStatus.APPLIED.value
+    row.applied_by = str(applier.id)
+    row.applied_at = row.updated_at = now
+    db.commit()
+    
+    return FeedbackApplication(
+        feedback_id=feedback_id,
+        applier_id=str(applier.id),
+        applier_role=applier_role,
+        application_method="status_update",
+        changes_made=[{"field": "status", "old_value": FeedbackStatus.APPROVED.value, "new_value": FeedbackStatus.APPLIED.value}],
+        validation_results={},
+        applied_at=now,
+        application_duration_seconds=time.perf_counter() - started
+    )
+
+def search_feedback(db: Session, request: FeedbackSearchRequest, user: User) -> FeedbackSearchResponse:
+    """Filter, count and page feedback events, newest first"""
+    started = time.perf_counter()
+    
+    stmt = select(FeedbackEventRow)
+    for column in ("feedback_type", "status", "actor_role", "target_type"):
+        value = getattr(request, column)
+        if value is not None:
+            stmt = stmt.where(getattr(FeedbackEventRow, column) == value)
+    if request.query:
+        pattern = _like_pattern(request.query)
+        stmt = stmt.where(or_(
+            FeedbackEventRow.description.ilike(pattern, escape="\\"),
+            cast(FeedbackEventRow.payload, Text).ilike(pattern, escape="\\")
+        ))
+    if request.priority:
+        stmt = stmt.where(FeedbackEventRow.priority == request.priority)
+    if request.date_from:
+        stmt = stmt.where(FeedbackEventRow.created_at >= request.date_from)
+    if request.date_to:
+        # date_to arrives as midnight of the requested day; include that whole day
+        stmt = stmt.where(FeedbackEventRow.created_at < request.date_to + timedelta(days=1))
+    
+    total_count = db.scalar(select(func.count()).select_from(stmt.subquery()))
+    rows = db.scalars(
+        stmt.order_by(FeedbackEventRow.created_at.desc())
+        .offset((request.page - 1) * request.page_size)
+        .limit(request.page_size)
+    )
+    
+    return FeedbackSearchResponse(
+        results=[model_from_row(FeedbackEvent, row) for row in rows],
+        total_count=total_count,
+        page=request.page,
+        page_size=request.page_size,
+        total_pages=-(-total_count // request.page_size),
+        query_executed=request.query or "",
+        filters_applied=request.model_dump(exclude_none=True, exclude={"query", "page", "page_size"}),
+        search_duration_ms=(time.perf_counter() - started) * 1000
+    )
+
+def get_feedback_summary(db: Session) -> FeedbackSummary:
+    """Dashboard counts, rates and the most recent feedback"""
+    # One grouped scan; status, type and role totals are folded from it
+    status_counts = Counter()
+    type_counts = Counter()
+    role_counts = Counter()
+    for feedback_status, feedback_type, actor_role, count in db.execute(
+        select(FeedbackEventRow.status, FeedbackEventRow.feedback_type, FeedbackEventRow.actor_role, func.count())
+        .group_by(FeedbackEventRow.status, FeedbackEventRow.feedback_type, FeedbackEventRow.actor_role)
+    ):
+        status_counts[feedback_status] += count
+        type_counts[feedback_type] += count
+        role_counts[actor_role] += count
+    
+    avg_review_seconds = db.scalar(
+        select(func.avg(func.extract("epoch", FeedbackEventRow.updated_at - FeedbackEventRow.created_at)))
+        .where(FeedbackEventRow.status.in_(_REVIEWED_STATUSES))
+    )
+    recent_feedback = db.scalars(
+        select(FeedbackEventRow).order_by(FeedbackEventRow.created_at.desc()).limit(_RECENT_FEEDBACK_LIMIT)
+    )
+    
+    approved = status_counts[FeedbackStatus.APPROVED.value]
+    rejected = status_counts[FeedbackStatus.REJECTED.value]
+    applied = status_counts[FeedbackStatus.APPLIED.value]
+    reviewed = approved + rejected + applied
+    
+    return FeedbackSummary(
+        total_feedback=sum(status_counts.values()),
+        pending_review=status_counts[FeedbackStatus.PENDING.value],
+        approved=approved,
+        rejected=rejected,
+        applied=applied,
+        by_type=dict(type_counts),
+        by_status=dict(status_counts),
+        by_role=dict(role_counts),
+        recent_feedback=[model_from_row(FeedbackEvent, row) for row in recent_feedback],
+        # Applications are not persisted beyond the applied_by/applied_at columns
+        recent_applications=[],
+        avg_review_time_hours=float(avg_review_seconds or 0) / 3600,
+        approval_rate=(approved + applied) / reviewed if reviewed else 0.0,
+        application_success_rate=applied / (approved + applied) if approved + applied else 0.0
+    )
+
+def audit_trail_query(table_name: Optional[str] = None,
+                      record_id: Optional[str] = None,
+                      action: Optional[str] = None,
+                      changed_by: Optional[str] = None,
+                      date_from: Optional[date] = None,
+                      date_to: Optional[date] = None,
+                      limit: int = 100) -> Select:
+    """Newest-first audit_trail select; date_to includes that whole day"""
+    stmt = select(AuditTrailRow)
+    if table_name:
+        stmt = stmt.where(AuditTrailRow.table_name == table_name)
+    if record_id:
+        stmt = stmt.where(AuditTrailRow.record_id == record_id)
+    if action:
+        stmt = stmt.where(AuditTrailRow.action == action)
+    if changed_by:
+        stmt = stmt.where(AuditTrailRow.changed_by == changed_by)
+    if date_from:
+        stmt = stmt.where(AuditTrailRow.changed_at >= date_from)
+    if date_to:
+        stmt = stmt.where(AuditTrailRow.changed_at < date_to + timedelta(days=1))
+    return stmt.order_by(AuditTrailRow.changed_at.desc()).limit(limit)
+
+feedback_service = FeedbackService()
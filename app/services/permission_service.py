@@ -4,53 +4,56 @@ Content Intelligence Platform - Permission Service
 Handles role-based access control (RBAC) and permission checks.
 """
 
-from typing import List, Optional
+from typing import FrozenSet, Optional
 from functools import wraps
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from ..models.auth import User, UserRole, get_user_permissions, has_permission
+from ..models.auth import User, UserRole, get_user_permissions, has_permission, _NO_PERMISSIONS
 from ..services.auth_service import auth_service
 
 # Security scheme
 security = HTTPBearer()
 
+# Challenge header for 401 responses (read-only, shared across requests)
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
 class PermissionService:
     """Service for handling permissions and RBAC"""
     
     def __init__(self):
+        # Frozensets: has_permission is a hash lookup, not a list scan
         self.role_permissions = {
-            UserRole.finance_admin: [
+            UserRole.FINANCE_ADMIN: frozenset({
                 "content:read", "content:write", "content:delete",
                 "feedback:read", "feedback:write", "feedback:apply",
                 "definitions:read", "definitions:write",
                 "users:read", "users:write", "users:delete",
                 "audit:read", "metrics:read", "ml:read", "ml:write"
-            ],
-            UserRole.strategy_analyst: [
+            }),
+            UserRole.STRATEGY_ANALYST: frozenset({
                 "content:read", "content:write",
                 "feedback:read", "feedback:write",
                 "definitions:read", "definitions:write",
                 "metrics:read", "ml:read", "ml:write"
-            ],
-            UserRole.marketing_user: [
+            }),
+            UserRole.MARKETING_USER: frozenset({
                 "content:read", "content:write",
                 "feedback:read", "feedback:write",
                 "definitions:read", "metrics:read", "ml:read"
-            ],
-            UserRole.read_only: [
+            }),
+            UserRole.READ_ONLY: frozenset({
                 "content:read", "definitions:read", "metrics:read"
-            ]
+            })
         }
     
-    def get_user_permissions(self, user: User) -> List[str]:
+    def get_user_permissions(self, user: User) -> FrozenSet[str]:
         """Get permissions for a user based on their role"""
-        return self.role_permissions.get(user.role, [])
+        return self.role_permissions.get(user.role, _NO_PERMISSIONS)
     
     def has_permission(self, user: User, permission: str) -> bool:
         """Check if a user has a specific permission"""
-        user_permissions = self.get_user_permissions(user)
-        return permission in user_permissions
+        return permission in self.role_permissions.get(user.role, _NO_PERMISSIONS)
     
     def require_permission(self, permission: str):
         """Decorator to require a specific permission"""
@@ -83,11 +86,11 @@ class PermissionService:
     
     def check_admin_access(self, user: User) -> bool:
         """Check if user has admin access"""
-        return self.check_role(user, UserRole.finance_admin)
+        return self.check_role(user, UserRole.FINANCE_ADMIN)
     
     def check_analyst_access(self, user: User) -> bool:
         """Check if user has analyst or admin access"""
-        if user.role in [UserRole.finance_admin, UserRole.strategy_analyst]:
+        if user.role in (UserRole.FINANCE_ADMIN, UserRole.STRATEGY_ANALYST):
             return True
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -113,6 +116,18 @@ class PermissionService:
 # Global instance
 permission_service = PermissionService()
 
+def check_permission(user: User, permission: str) -> None:
+    """Raise 403 unless the user's role grants permission (route-level "read:content" style names)
+
+    Role grants are frozensets in app.models.auth.PERMISSIONS, so this is one dict
+    lookup and one set membership test; there is nothing worth memoizing per user.
+    """
+    if not has_permission(user.role, permission):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Insufficient permissions. Required: {permission}"
+        )
+
 # Dependency functions for FastAPI
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
     """Get current authenticated user from JWT token"""
@@ -123,7 +138,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_BEARER_CHALLENGE,
         )
     
     user = auth_service.get_user_by_username(token_data.username)
@@ -131,7 +146,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_BEARER_CHALLENGE,
         )
     
     if not user.is_active:
@@ -6,10 +6,10 @@ Defines the database schema using SQLAlchemy ORM models.
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from sqlalchemy import Column, String, Integer, Float, DateTime, Boolean, Text, JSON, ForeignKey, Index
+from sqlalchemy import Column, String, Integer, Float, DateTime, Boolean, Text, JSON, ForeignKey, Index, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 import uuid
 
 Base = declarative_base()
@@ -141,58 +141,60 @@ class FinanceRule(Base):
     )
 
 class FeedbackEvent(Base):
-    """Feedback events table model"""
+    """Feedback events table model (columns as created by init/01_schema.sql)"""
     __tablename__ = "feedback_events"
     
-    id = Column(String(50), primary_key=True)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
     actor_id = Column(String(100), nullable=False)
     actor_role = Column(String(100), nullable=False)
     feedback_type = Column(String(100), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    description = Column(Text, nullable=False)
+    priority = Column(String(20), default="medium")
+    business_impact = Column(Text)
+    expected_outcome = Column(Text)
+    evidence = Column(JSONB)
+    attachments = Column(JSONB)
     target_type = Column(String(100), nullable=False)
-    target_id = Column(String(100), nullable=False)
-    payload = Column(JSON, nullable=False)
-    status = Column(String(50), nullable=False, default="pending")
-    review_notes = Column(Text)
-    reviewed_by = Column(String(100))
-    reviewed_at = Column(DateTime)
-    applied_at = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    metadata = Column(JSON)
+    target_id = Column(String(200))
+    status = Column(String(50), default="pending")
+    impact_analysis = Column(JSONB)
+    applied_by = Column(String(100))
+    applied_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Indexes
     __table_args__ = (
         Index('idx_feedback_actor', 'actor_id'),
-        Index('idx_feedback_status', 'status'),
+        # Serves "where status = ? order by created_at desc limit n" without a sort
+        Index('idx_feedback_status_created', 'status', created_at.desc()),
         Index('idx_feedback_target', 'target_type', 'target_id'),
         Index('idx_feedback_created', 'created_at'),
     )
 
 class RuleOverride(Base):
-    """Rule overrides table model"""
+    """Rule overrides table model (columns as created by init/01_schema.sql)"""
     __tablename__ = "rule_overrides"
     
-    id = Column(String(50), primary_key=True)
-    feedback_id = Column(String(50), ForeignKey("feedback_events.id"), nullable=False)
-    rule_type = Column(String(100), nullable=False)
-    rule_name = Column(String(200), nullable=False)
-    old_value = Column(JSON)
-    new_value = Column(JSON, nullable=False)
-    applied_by = Column(String(100), nullable=False)
-    applied_at = Column(DateTime, nullable=False)
-    effective_from = Column(DateTime, nullable=False)
-    effective_until = Column(DateTime)
-    description = Column(Text)
-    metadata = Column(JSON)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
+    feedback_event_id = Column(UUID(as_uuid=False), ForeignKey("feedback_events.id"), nullable=False)
+    original_value = Column(JSONB, nullable=False)
+    new_value = Column(JSONB, nullable=False)
+    override_type = Column(String(100), nullable=False)
+    effective_from = Column(DateTime(timezone=True), nullable=False)
+    effective_to = Column(DateTime(timezone=True))
+    is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     feedback = relationship("FeedbackEvent")
     
     # Indexes
     __table_args__ = (
-        Index('idx_override_rule_type', 'rule_type'),
-        Index('idx_override_effective', 'effective_from', 'effective_until'),
-        Index('idx_override_feedback', 'feedback_id'),
+        Index('idx_override_type', 'override_type'),
+        Index('idx_override_effective', 'effective_from', 'effective_to'),
+        Index('idx_override_feedback', 'feedback_event_id'),
     )
 
 class Channel(Base):
@@ -313,24 +315,22 @@ class MLPrediction(Base):
     )
 
 class AuditTrail(Base):
-    """Audit trail table model"""
+    """Audit trail table model (columns as created by init/01_schema.sql)"""
     __tablename__ = "audit_trail"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    action = Column(String(200), nullable=False)
-    actor_id = Column(String(100), nullable=False)
-    target_type = Column(String(100), nullable=False)
-    target_id = Column(String(100), nullable=False)
-    old_value = Column(JSON)
-    new_value = Column(JSON)
-    description = Column(Text)
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
-    metadata = Column(JSON)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
+    table_name = Column(String(100), nullable=False)
+    record_id = Column(String(200), nullable=False)
+    action = Column(String(50), nullable=False)
+    old_values = Column(JSONB)
+    new_values = Column(JSONB)
+    changed_by = Column(String(100), nullable=False)
+    changed_at = Column(DateTime(timezone=True), server_default=func.now())
+    change_reason = Column(Text)
     
     # Indexes
     __table_args__ = (
-        Index('idx_audit_action', 'action'),
-        Index('idx_audit_actor', 'actor_id'),
-        Index('idx_audit_target', 'target_type', 'target_id'),
-        Index('idx_audit_timestamp', 'timestamp'),
-    ) 
\ No newline at end of file
+        # Serves "where table_name = ? and record_id = ? order by changed_at desc" without a sort
+        Index('idx_audit_trail_table_record_changed', 'table_name', 'record_id', changed_at.desc()),
+        Index('idx_audit_trail_changed_at', changed_at.desc()),
+    )
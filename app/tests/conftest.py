@@ -0,0 +1,24 @@
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.content import ContentKPIs
+
+
+@pytest.fixture
+def kpi_row():
+    """Factory for mart_content_kpis rows as the database returns them"""
+    def make(**overrides):
+        values = {field: 0 for field in ContentKPIs.model_fields}
+        values.update(
+            content_id="c1", title="Title", vertical="B2B SaaS", format="video", channel="YouTube",
+            publish_date=datetime(2024, 1, 1, tzinfo=timezone.utc), owner_team="Marketing",
+            performance_tier="high_performing", engagement_tier="high_engagement", roi_tier="good",
+            lifecycle_stage="growth", channel_performance_tier="standard_performance",
+            business_impact_tier="standard_impact", event_date=date(2024, 1, 8),
+        )
+        values.update(overrides)
+        return SimpleNamespace(**values)
+
+    return make
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from app import cache
+from app.cache import RequestCoalescer, TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_ttl_cache_expires_entries(clock):
+    ttl_cache = TTLCache(ttl_seconds=60, maxsize=4)
+    ttl_cache.set("summary", b"{}")
+
+    clock[0] += 59.9
+    assert ttl_cache.get("summary") == b"{}"
+    clock[0] += 0.1
+    assert ttl_cache.get("summary") is None
+
+
+def test_ttl_cache_evicts_oldest_when_full(clock):
+    ttl_cache = TTLCache(ttl_seconds=60, maxsize=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.set("a", 10)  # overwriting a key never evicts
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("b") == 2
+    assert ttl_cache.get("c") == 3
+
+
+def test_ttl_cache_clear(clock):
+    ttl_cache = TTLCache(ttl_seconds=60, maxsize=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.clear()
+
+    assert ttl_cache.get("a") is None
+
+
+def test_coalescer_shares_one_build_between_concurrent_callers():
+    calls = []
+
+    async def build():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    async def scenario():
+        coalescer = RequestCoalescer()
+        results = await asyncio.gather(*(coalescer.run("kpis", build) for _ in range(5)))
+        # The key is released once the build finishes, so the next miss rebuilds
+        return results, await coalescer.run("kpis", build), coalescer._in_flight
+
+    results, later, in_flight = asyncio.run(scenario())
+
+    assert results == [1] * 5
+    assert later == 2
+    assert in_flight == {}
+
+
+def test_coalescer_keeps_keys_apart():
+    async def scenario():
+        coalescer = RequestCoalescer()
+        return await asyncio.gather(
+            coalescer.run("a", lambda: asyncio.sleep(0, result="a")),
+            coalescer.run("b", lambda: asyncio.sleep(0, result="b")),
+        )
+
+    assert asyncio.run(scenario()) == ["a", "b"]
+
+
+def test_coalescer_propagates_build_errors_to_every_caller():
+    async def build():
+        await asyncio.sleep(0)
+        raise RuntimeError("database unavailable")
+
+    async def scenario():
+        coalescer = RequestCoalescer()
+        results = await asyncio.gather(
+            coalescer.run("kpis", build), coalescer.run("kpis", build), return_exceptions=True
+        )
+        return results, coalescer._in_flight
+
+    results, in_flight = asyncio.run(scenario())
+
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+    assert in_flight == {}
+
+
+def test_coalescer_build_survives_a_cancelled_caller():
+    async def scenario():
+        coalescer = RequestCoalescer()
+        release = asyncio.Event()
+
+        async def build():
+            await release.wait()
+            return "body"
+
+        first = asyncio.ensure_future(coalescer.run("kpis", build))
+        second = asyncio.ensure_future(coalescer.run("kpis", build))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        return await second, first.cancelled()
+
+    assert asyncio.run(scenario()) == ("body", True)
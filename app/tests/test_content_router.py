@@ -0,0 +1,293 @@
+import asyncio
+import threading
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import CONTENT_INTELLIGENCE_CONFIG
+from app.models.auth import User, UserRole
+from app.routers import content_router
+from app.services.content_service import METRIC_DEFINITIONS_VERSION, _metric_definitions
+from app.services.permission_service import get_current_user
+
+_NOW = datetime(2024, 1, 15, tzinfo=timezone.utc)
+_ANALYST = User(
+    id=2, username="analyst", email="analyst@example.com", full_name="Strategy Analyst",
+    role=UserRole.STRATEGY_ANALYST, created_at=_NOW, updated_at=_NOW,
+)
+
+
+class _ReadSessions:
+    """Stands in for ReadSessionLocal: hands out sessions that answer with canned results
+
+    results is called with (sql, params) and returns what execute() should return.
+    Sessions opened and statements run are recorded so tests can see the queries.
+    """
+
+    def __init__(self, results, delay=0.0):
+        self.results = results
+        self.delay = delay
+        self.opened = 0
+        self.statements = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.opened += 1
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, stmt, params=None):
+        if self.delay:
+            # Keep the build in flight long enough for concurrent requests to join it
+            threading.Event().wait(self.delay)
+        with self._lock:
+            self.statements.append((str(stmt), params))
+        return self.results(str(stmt), params)
+
+
+@pytest.fixture(autouse=True)
+def _empty_caches():
+    for cache in (content_router._kpis_cache, content_router._leaderboard_cache, content_router._summary_cache):
+        cache.clear()
+
+
+@pytest.fixture
+def read_sessions(monkeypatch):
+    def install(results, delay=0.0):
+        sessions = _ReadSessions(results, delay)
+        monkeypatch.setattr(content_router, "ReadSessionLocal", sessions)
+        return sessions
+
+    return install
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+    app.include_router(content_router.router, prefix="/v1")
+    app.dependency_overrides[get_current_user] = lambda: _ANALYST
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return TestClient(app)
+
+
+def test_definitions_route_serves_the_canonical_definitions(client):
+    response = client.get("/v1/definitions")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_count"] == len(body["definitions"]) == len(_metric_definitions())
+    assert body["version"] == METRIC_DEFINITIONS_VERSION
+    assert {d["metric_name"] for d in body["definitions"]} >= {"roi", "cpa", "ctr"}
+    # Encoded once, then served from the same bytes
+    assert content_router._metric_definitions_json() is content_router._metric_definitions_json()
+
+
+def _attributes(channel="YouTube"):
+    return {"channel": channel, "vertical": "B2B SaaS", "format": "video", "region": "NA"}
+
+
+def test_roi_batch_route_scores_every_item(client):
+    items = [{"content_attributes": _attributes()}, {"content_attributes": _attributes("Email")}]
+
+    response = client.post("/v1/roi/predict/batch", json={"items": items})
+
+    assert response.status_code == 200
+    predictions = response.json()
+    assert [p["input_features"]["channel"] for p in predictions] == ["YouTube", "Email"]
+    assert all(p["predicted_roi"] >= 0 and p["features_used"] for p in predictions)
+
+
+@pytest.mark.parametrize("body", [
+    {"items": []},
+    {"items": [{"content_attributes": {"channel": "YouTube"}}]},
+])
+def test_roi_batch_route_rejects_invalid_batches(client, body):
+    response = client.post("/v1/roi/predict/batch", json=body)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][:2] == ["body", "items"]
+
+
+def test_roi_single_route_returns_one_prediction(client):
+    response = client.post("/v1/roi/predict", json={"content_attributes": _attributes()})
+
+    assert response.status_code == 200
+    assert response.json()["model_type"] == "heuristic"
+
+
+def test_kpis_route_serves_repeat_requests_from_the_cache(client, read_sessions, kpi_row):
+    sessions = read_sessions(lambda sql, params: iter([kpi_row(roi_pct=25.0)]))
+
+    first = client.get("/v1/content/c1/kpis", params={"grain": "week"})
+    second = client.get("/v1/content/c1/kpis", params={"grain": "week"})
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.content == first.content
+    assert first.json()[0]["roi_pct"] == 25.0
+    assert sessions.opened == 1
+    (sql, params), = sessions.statements
+    assert "date_trunc('week', event_date)" in sql
+    assert params["content_id"] == "c1"
+
+
+def test_kpis_route_coalesces_concurrent_misses(app, read_sessions, kpi_row):
+    sessions = read_sessions(lambda sql, params: iter([kpi_row()]), delay=0.05)
+
+    async def fetch_concurrently():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*(client.get("/v1/content/c1/kpis") for _ in range(4)))
+
+    responses = asyncio.run(fetch_concurrently())
+
+    assert [r.status_code for r in responses] == [200] * 4
+    assert all(r.headers["X-Cache"] == "MISS" for r in responses)
+    assert sessions.opened == 1
+
+
+def test_kpis_route_does_not_cache_misses(client, read_sessions):
+    sessions = read_sessions(lambda sql, params: iter(()))
+
+    assert client.get("/v1/content/missing/kpis").status_code == 404
+    assert client.get("/v1/content/missing/kpis").status_code == 404
+    assert sessions.opened == 2
+
+
+class _Result:
+    """The slice of a SQLAlchemy Result the content services use"""
+
+    def __init__(self, rows=(), scalar=None):
+        self.rows = list(rows)
+        self.scalar = scalar
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def scalar_one(self):
+        return self.scalar
+
+    def one(self):
+        (row,) = self.rows
+        return row
+
+
+def _leaderboard_row(rank, **overrides):
+    values = dict(
+        rank=rank, content_id=f"c{rank}", title=f"Content {rank}", vertical="B2B SaaS", format="video",
+        channel="YouTube", publish_date=_NOW, owner_team="Marketing", roi_pct=Decimal("42.50"),
+        revenue=Decimal("1200.00"), cost=Decimal("842.11"), net_profit=Decimal("357.89"), views=1000,
+        conversions=12, performance_score=Decimal("71.3"), roi_tier="good",
+        performance_tier="high_performing", engagement_tier="medium_engagement",
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _leaderboard_results(sql, params):
+    if sql.lstrip().startswith("select count(*)"):
+        return _Result(scalar=120)
+    return _Result([_leaderboard_row(params["offset"] + 1), _leaderboard_row(params["offset"] + 2)])
+
+
+def test_unfiltered_leaderboard_seeks_on_the_precomputed_rank(client, read_sessions):
+    sessions = read_sessions(_leaderboard_results)
+
+    response = client.get("/v1/leaderboard", params={"sort_by": "views", "limit": 2, "offset": 40})
+
+    assert response.status_code == 200
+    assert response.headers["X-Cache"] == "MISS"
+    body = response.json()
+    assert [e["rank"] for e in body["entries"]] == [41, 42]
+    assert body["entries"][0]["roi_pct"] == 42.5
+    assert (body["total_count"], body["page"], body["page_size"]) == (120, 21, 2)
+    (page_sql, page_params), (count_sql, _) = sessions.statements
+    assert "where views_rank > :offset" in page_sql and "row_number()" not in page_sql
+    assert "mart_content_leaderboard" in count_sql
+    assert page_params == {"limit": 2, "offset": 40}
+
+
+def test_filtered_leaderboard_ranks_the_dated_window(client, read_sessions):
+    sessions = read_sessions(_leaderboard_results)
+
+    response = client.get(
+        "/v1/leaderboard", params={"channel": "YouTube", "date_from": "2024-01-01", "roi_min": 10}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["filters_applied"] == {"channel": "YouTube", "date_from": "2024-01-01", "roi_min": 10.0}
+    (page_sql, page_params), (count_sql, count_params) = sessions.statements
+    assert "row_number() over (order by roi_pct DESC, content_id)" in page_sql
+    assert "event_date >= :date_from" in page_sql and "mart_content_kpis" in page_sql
+    assert "channel = :channel and roi_pct >= :roi_min" in count_sql
+    assert page_params["channel"] == "YouTube" and count_params["roi_min"] == 10.0
+
+
+def test_leaderboard_pages_are_cached_per_query(client, read_sessions):
+    sessions = read_sessions(_leaderboard_results)
+
+    client.get("/v1/leaderboard", params={"limit": 2})
+    hit = client.get("/v1/leaderboard", params={"limit": 2})
+    other_page = client.get("/v1/leaderboard", params={"limit": 2, "offset": 2})
+
+    assert hit.headers["X-Cache"] == "HIT"
+    assert other_page.headers["X-Cache"] == "MISS"
+    assert sessions.opened == 2
+
+
+def _summary_row():
+    channel_stats = {"content_count": 3, "views": 900, "conversions": 9, "revenue": 300.0, "cost": 200.0, "roi_pct": 50.0}
+    return SimpleNamespace(
+        total_content=3, total_revenue=300.0, total_cost=200.0, total_roi=50.0, avg_performance_score=61.2,
+        by_channel={"YouTube": channel_stats}, by_vertical={"B2B SaaS": channel_stats},
+        by_format={"video": channel_stats}, roi_distribution={"excellent": 3},
+        performance_distribution={"high_performing": 3},
+        daily_metrics=[{"period": "2024-01-14", "views": 900}], weekly_metrics=[], monthly_metrics=[],
+    )
+
+
+def test_summary_route_aggregates_in_one_query_and_caches(client, read_sessions):
+    sessions = read_sessions(lambda sql, params: _Result([_summary_row()]))
+
+    first = client.get("/v1/summary")
+    second = client.get("/v1/summary")
+
+    assert first.status_code == second.status_code == 200
+    body = first.json()
+    assert body["total_content"] == 3
+    assert body["by_channel"]["YouTube"]["roi_pct"] == 50.0
+    assert body["daily_metrics"] == [{"period": "2024-01-14", "views": 900}]
+    assert second.content == first.content
+    assert sessions.opened == 1
+    (sql, _), = sessions.statements
+    assert "json_object_agg" in sql and "date_trunc('week', event_date)" in sql
+
+
+def test_catalog_route_returns_every_filter_list(client):
+    response = client.get("/v1/catalog")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["channels"] == sorted(CONTENT_INTELLIGENCE_CONFIG["supported_channels"])
+    assert body["verticals"] == sorted(CONTENT_INTELLIGENCE_CONFIG["supported_verticals"])
+    assert body["formats"] == sorted(CONTENT_INTELLIGENCE_CONFIG["supported_formats"])
+    assert set(body["performance_tiers"]) == {"roi_tiers", "performance_tiers", "engagement_tiers"}
+    # The individual endpoints serve the same lists
+    assert client.get("/v1/channels").json() == {"channels": body["channels"], "total_count": len(body["channels"])}
+
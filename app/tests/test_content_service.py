@@ -0,0 +1,94 @@
+import asyncio
+from datetime import date
+
+from app.models.content import ROIPredictionRequest
+from app.services.content_service import (
+    METRIC_DEFINITIONS_UPDATED, METRIC_DEFINITIONS_VERSION, ContentService, _metric_definitions,
+    get_content_kpis
+)
+
+
+def _request(channel="YouTube", vertical="B2B SaaS", format="video"):
+    return ROIPredictionRequest(
+        content_attributes={"channel": channel, "vertical": vertical, "format": format, "region": "NA"}
+    )
+
+
+def test_predict_roi_batch_scores_every_variant():
+    requests = [_request(), _request("Email", "Sales", "email"), _request("Unknown", "Unknown", "Unknown")]
+
+    predictions = ContentService().predict_roi_batch(requests)
+
+    assert len(predictions) == len(requests)
+    for prediction, request in zip(predictions, requests):
+        assert prediction.predicted_roi >= 0
+        assert prediction.features_used == ["channel", "vertical", "format"]
+        assert prediction.input_features == request.content_attributes
+        assert prediction.prediction_date.tzinfo is not None
+
+
+def test_predict_roi_batch_ranks_by_multipliers():
+    # Noise is +-10, so a 1.2 * 1.4 * 1.3 variant always beats a 0.8 * 1.1 * 0.8 one
+    strong, weak = ContentService().predict_roi_batch([_request(), _request("Email", "Sales", "email")])
+
+    assert strong.predicted_roi > weak.predicted_roi
+
+
+
+def test_predict_roi_is_a_batch_of_one():
+    prediction = asyncio.run(ContentService().predict_roi(_request()))
+
+    assert prediction.predicted_roi >= 0
+    assert prediction.input_features == _request().content_attributes
+
+def test_metric_definitions_are_complete_and_built_once():
+    definitions = _metric_definitions()
+
+    assert _metric_definitions() is definitions
+    names = [d.metric_name for d in definitions]
+    assert len(set(names)) == len(names) == 9
+    for definition in definitions:
+        assert definition.formula and definition.use_cases and definition.caveats
+        assert set(definition.related_metrics) <= set(names)
+        assert definition.version == METRIC_DEFINITIONS_VERSION
+
+
+def test_get_metric_definitions_wraps_the_shared_definitions():
+    response = asyncio.run(ContentService().get_metric_definitions())
+
+    assert response.total_count == len(_metric_definitions())
+    assert response.last_updated == METRIC_DEFINITIONS_UPDATED
+    assert response.version == METRIC_DEFINITIONS_VERSION
+
+
+class _RecordingSession:
+    """Returns canned rows and records each statement with its parameters"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def execute(self, stmt, params=None):
+        self.calls.append((str(stmt), params))
+        return iter(self.rows)
+
+
+def test_get_content_kpis_reads_daily_rows_from_the_mart(kpi_row):
+    db = _RecordingSession([kpi_row(roi_pct=25.0)])
+
+    kpis = get_content_kpis(db, "c1", "day", start_date=date(2024, 1, 1))
+
+    assert [k.roi_pct for k in kpis] == [25.0]
+    (sql, params), = db.calls
+    assert "mart_content_kpis" in sql and "date_trunc" not in sql
+    assert "event_date >= :start_date" in sql and ":end_date" not in sql
+    assert params == {"content_id": "c1", "start_date": date(2024, 1, 1), "end_date": None}
+
+
+def test_get_content_kpis_rolls_coarser_grains_up_by_period():
+    db = _RecordingSession([])
+
+    assert get_content_kpis(db, "c1", "month", end_date=date(2024, 3, 31)) == []
+    (sql, _), = db.calls
+    assert "group by content_id, date_trunc('month', event_date)" in sql
+    assert "event_date <= :end_date" in sql and ":start_date" not in sql
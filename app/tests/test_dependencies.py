@@ -0,0 +1,52 @@
+from typing import Optional
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+from app.dependencies import json_body, json_body_openapi
+
+
+class _Item(BaseModel):
+    name: str
+    quantity: int = Field(..., ge=1)
+    note: Optional[str] = None
+
+
+app = FastAPI()
+
+
+@app.post("/items", openapi_extra=json_body_openapi(_Item))
+async def create_item(item: _Item = Depends(json_body(_Item))):
+    return item
+
+
+client = TestClient(app)
+
+
+def test_json_body_parses_a_valid_body():
+    response = client.post("/items", content=b'{"name": "widget", "quantity": 2}')
+
+    assert response.status_code == 200
+    assert response.json() == {"name": "widget", "quantity": 2, "note": None}
+
+
+def test_json_body_reports_field_errors_under_body():
+    response = client.post("/items", content=b'{"name": "widget", "quantity": 0}')
+
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [["body", "quantity"]]
+
+
+def test_json_body_rejects_malformed_json():
+    response = client.post("/items", content=b'{"name": ')
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_json_body_openapi_documents_the_request_body():
+    body = app.openapi()["paths"]["/items"]["post"]["requestBody"]
+
+    assert body["required"] is True
+    assert body["content"]["application/json"]["schema"]["required"] == ["name", "quantity"]
@@ -0,0 +1,90 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.database import get_db_ro
+from app.models.auth import User, UserRole
+from app.routers import feedback_router
+from app.services.feedback_service import audit_trail_query
+from app.services.permission_service import get_current_user
+
+_NOW = datetime(2024, 1, 15, tzinfo=timezone.utc)
+_ADMIN = User(
+    id=1, username="finance", email="finance@example.com", full_name="Finance Admin",
+    role=UserRole.FINANCE_ADMIN, created_at=_NOW, updated_at=_NOW,
+)
+
+
+class _EmptySession:
+    """Read session whose queries all come back empty; records executed statements"""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt, *args, **kwargs):
+        self.statements.append(stmt)
+        return self
+
+    def scalars(self, stmt=None, *args, **kwargs):
+        if stmt is not None:
+            self.statements.append(stmt)
+        return iter(())
+
+    def scalar(self, stmt, *args, **kwargs):
+        self.statements.append(stmt)
+        return 0
+
+
+@pytest.fixture
+def session():
+    return _EmptySession()
+
+
+@pytest.fixture
+def client(session):
+    app = FastAPI()
+    app.include_router(feedback_router.router, prefix="/v1")
+    app.dependency_overrides[get_current_user] = lambda: _ADMIN
+    app.dependency_overrides[get_db_ro] = lambda: session
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/v1/audit-trail", "/v1/feedback"])
+@pytest.mark.parametrize("bad_date", ["not-a-date", "2024-13-01", "15/01/2024"])
+def test_malformed_date_from_is_rejected(client, session, path, bad_date):
+    response = client.get(path, params={"date_from": bad_date})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query", "date_from"]
+    assert session.statements == []
+
+
+def test_audit_trail_accepts_iso_dates(client, session):
+    response = client.get("/v1/audit-trail", params={"date_from": "2024-01-01", "date_to": "2024-01-31"})
+
+    assert response.status_code == 200
+    assert response.json() == []
+    assert len(session.statements) == 1
+
+
+def test_feedback_search_accepts_iso_dates(client, session):
+    response = client.get("/v1/feedback", params={"date_from": "2024-01-01", "date_to": "2024-01-31"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["results"] == []
+    assert body["total_count"] == 0
+    assert body["filters_applied"]["date_from"] == "2024-01-01T00:00:00"
+
+
+def test_audit_trail_query_includes_the_whole_date_to_day():
+    stmt = audit_trail_query(changed_by="u1", date_from=date(2024, 1, 1), date_to=date(2024, 1, 31), limit=50)
+    params = stmt.compile(dialect=postgresql.dialect()).params
+
+    assert params["changed_by_1"] == "u1"
+    assert params["changed_at_1"] == date(2024, 1, 1)
+    assert params["changed_at_2"] == date(2024, 2, 1)
+    assert params["param_1"] == 50
@@ -0,0 +1,228 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.models.auth import User, UserRole
+from app.models.feedback import (
+    ActorRole, FeedbackReview, FeedbackSearchRequest, FeedbackStatus, FeedbackSubmission
+)
+from app.services import feedback_service
+from app.sql_models import FeedbackEvent as FeedbackEventRow
+
+_NOW = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+
+def _user(role):
+    return User(
+        id=7, username="reviewer", email="reviewer@example.com", full_name="Reviewer",
+        role=role, created_at=_NOW, updated_at=_NOW,
+    )
+
+
+def _row(**overrides):
+    values = dict(
+        id="11111111-1111-1111-1111-111111111111", actor_id="3", actor_role="Finance",
+        feedback_type="definition_correction", target_type="metric", target_id="roi",
+        payload={"field": "roi"}, description="ROI should net out platform fees",
+        priority="high", business_impact=None, expected_outcome=None, evidence=None,
+        attachments=None, status=FeedbackStatus.PENDING.value, impact_analysis=None,
+        applied_by=None, applied_at=None, created_at=_NOW, updated_at=_NOW,
+    )
+    values.update(overrides)
+    return FeedbackEventRow(**values)
+
+
+class _Session:
+    """Write session holding at most one feedback row; records statements and commits"""
+
+    def __init__(self, row=None, grouped=(), scalar=0):
+        self.row = row
+        self.grouped = grouped
+        self.scalar_value = scalar
+        self.added = []
+        self.statements = []
+        self.commits = 0
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    def commit(self):
+        self.commits += 1
+
+    def get(self, model, key):
+        return self.row if self.row is not None and self.row.id == key else None
+
+    def execute(self, stmt, *args, **kwargs):
+        self.statements.append(stmt)
+        return iter(self.grouped)
+
+    def scalars(self, stmt, *args, **kwargs):
+        self.statements.append(stmt)
+        return iter([self.row] if self.row is not None else [])
+
+    def scalar(self, stmt, *args, **kwargs):
+        self.statements.append(stmt)
+        return self.scalar_value
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_submit_feedback_stores_every_submission_field():
+    session = _Session()
+    submission = FeedbackSubmission(
+        actor_id="3", actor_role="Finance", feedback_type="definition_correction",
+        target_type="metric", target_id="roi", payload={"field": "roi"},
+        description="ROI should net out platform fees", priority="high",
+        business_impact="Overstates ROI by 4%", expected_outcome="Lower reported ROI",
+        evidence=["q3-report"], attachments=["https://example.com/fees.csv"],
+    )
+
+    response = feedback_service.submit_feedback(session, submission, _user(UserRole.FINANCE_ADMIN))
+
+    (row,) = session.added
+    assert session.commits == 1
+    assert row.id == response.feedback_id
+    assert row.actor_id == "7"
+    assert row.payload == {"field": "roi"}
+    assert row.description == "ROI should net out platform fees"
+    assert row.priority == "high"
+    assert row.business_impact == "Overstates ROI by 4%"
+    assert row.expected_outcome == "Lower reported ROI"
+    assert row.evidence == ["q3-report"]
+    assert row.attachments == ["https://example.com/fees.csv"]
+
+
+@pytest.mark.parametrize("decision,expected", [
+    ("approve", FeedbackStatus.APPROVED),
+    ("reject", FeedbackStatus.REJECTED),
+    ("request_changes", FeedbackStatus.UNDER_REVIEW),
+])
+def test_review_feedback_maps_decision_to_status(decision, expected):
+    row = _row()
+    session = _Session(row)
+    review = FeedbackReview(
+        feedback_id=row.id, reviewer_id="7", reviewer_role=ActorRole.FINANCE,
+        decision=decision, decision_reason="Checked against the Q3 fee schedule",
+        impact_analysis={"affected_content": 12}, risk_assessment="low",
+    )
+
+    feedback = feedback_service.review_feedback(session, row.id, review, _user(UserRole.FINANCE_ADMIN))
+
+    assert session.commits == 1
+    assert feedback.status == expected
+    assert feedback.impact_analysis == {"affected_content": 12}
+    assert row.status == expected.value
+
+
+def test_review_feedback_rejects_unknown_decision():
+    row = _row()
+    session = _Session(row)
+    review = FeedbackReview.model_construct(decision="escalate", impact_analysis=None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        feedback_service.review_feedback(session, row.id, review, _user(UserRole.FINANCE_ADMIN))
+
+    assert exc_info.value.status_code == 400
+    assert session.commits == 0
+    assert row.status == FeedbackStatus.PENDING.value
+
+
+def test_review_feedback_missing_row_is_404():
+    review = FeedbackReview.model_construct(decision="approve", impact_analysis=None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        feedback_service.review_feedback(_Session(), "missing", review, _user(UserRole.FINANCE_ADMIN))
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.parametrize("role,actor_role", [
+    (UserRole.FINANCE_ADMIN, ActorRole.FINANCE),
+    (UserRole.STRATEGY_ANALYST, ActorRole.STRATEGY),
+])
+def test_apply_feedback_records_the_appliers_role(role, actor_role):
+    row = _row(status=FeedbackStatus.APPROVED.value)
+    session = _Session(row)
+
+    application = feedback_service.apply_feedback(session, row.id, _user(role))
+
+    assert application.applier_role == actor_role
+    assert application.applier_id == "7"
+    assert row.status == FeedbackStatus.APPLIED.value
+    assert row.applied_by == "7"
+    assert session.commits == 1
+
+
+def test_apply_feedback_requires_approval():
+    row = _row()
+    session = _Session(row)
+
+    with pytest.raises(HTTPException) as exc_info:
+        feedback_service.apply_feedback(session, row.id, _user(UserRole.FINANCE_ADMIN))
+
+    assert exc_info.value.status_code == 400
+    assert row.status == FeedbackStatus.PENDING.value
+    assert session.commits == 0
+
+
+def test_apply_feedback_refuses_roles_without_an_actor_role():
+    row = _row(status=FeedbackStatus.APPROVED.value)
+    session = _Session(row)
+
+    with pytest.raises(HTTPException) as exc_info:
+        feedback_service.apply_feedback(session, row.id, _user(UserRole.READ_ONLY))
+
+    assert exc_info.value.status_code == 403
+    assert row.status == FeedbackStatus.APPROVED.value
+
+
+def test_search_feedback_escapes_like_wildcards():
+    session = _Session(_row(), scalar=1)
+
+    response = feedback_service.search_feedback(
+        session, FeedbackSearchRequest(query="100%_fee\\"), _user(UserRole.FINANCE_ADMIN)
+    )
+
+    compiled = session.statements[-1].compile(dialect=postgresql.dialect())
+    assert set(compiled.params.values()) >= {"%100\\%\\_fee\\\\%"}
+    assert "feedback_events.description ILIKE" in str(compiled)
+    assert str(compiled).count("ESCAPE") == 2
+    assert response.total_count == 1
+    assert response.results[0].description == "ROI should net out platform fees"
+
+
+def test_search_feedback_filters_priority_column():
+    session = _Session()
+
+    feedback_service.search_feedback(
+        session, FeedbackSearchRequest(priority="critical"), _user(UserRole.FINANCE_ADMIN)
+    )
+
+    sql = _sql(session.statements[-1])
+    assert "feedback_events.priority = 'critical'" in sql
+    assert "payload" not in sql.split("WHERE", 1)[1]
+
+
+def test_feedback_summary_folds_grouped_counts():
+    grouped = [
+        ("pending", "override", "Finance", 2),
+        ("approved", "override", "Strategy", 1),
+        ("applied", "rule_change", "Finance", 3),
+        ("rejected", "misattribution", "Marketing", 2),
+    ]
+    session = _Session(_row(), grouped=grouped, scalar=7200)
+
+    summary = feedback_service.get_feedback_summary(session)
+
+    assert summary.total_feedback == 8
+    assert summary.pending_review == 2
+    assert summary.by_type == {"override": 3, "rule_change": 3, "misattribution": 2}
+    assert summary.by_role == {"Finance": 5, "Strategy": 1, "Marketing": 2}
+    assert summary.avg_review_time_hours == 2.0
+    assert summary.approval_rate == 4 / 6
+    assert summary.application_success_rate == 3 / 4
+    assert [feedback.id for feedback in summary.recent_feedback] == [_row().id]
@@ -0,0 +1,40 @@
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.main import app
+
+
+def _health_requests() -> float:
+    labels = {"method": "GET", "endpoint": "/healthz", "status": "200"}
+    return REGISTRY.get_sample_value("http_requests_total", labels) or 0.0
+
+
+def _route_keys() -> list:
+    return [(route.path, tuple(sorted(getattr(route, "methods", None) or ()))) for route in app.routes]
+
+
+def test_request_middleware_counts_and_tags_requests():
+    before = _health_requests()
+
+    response = TestClient(app).get("/healthz")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+    assert response.headers["X-Request-ID"]
+    assert _health_requests() == before + 1
+
+
+def test_routers_are_registered_once_across_lifespans(monkeypatch):
+    from app.services.auth_service import auth_service
+
+    # Seed-user hashing is slow I/O unrelated to routing
+    monkeypatch.setattr(auth_service, "load_users", lambda: None)
+    routes = _route_keys()
+
+    for _ in range(2):
+        with TestClient(app) as client:
+            assert client.get("/healthz").status_code == 200
+
+    assert _route_keys() == routes
+    assert len(routes) == len(set(routes))
+    assert "/v1/catalog" in {path for path, _ in routes}
@@ -0,0 +1,45 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY
+
+from app.routers import metrics_router
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    metrics_router._prometheus_cache.clear()
+    yield
+    metrics_router._prometheus_cache.clear()
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(metrics_router.router, prefix="/metrics")
+    return TestClient(app)
+
+
+def test_prometheus_scrapes_within_ttl_share_one_generation(client, monkeypatch):
+    calls = []
+
+    def generate_latest(registry):
+        calls.append(registry)
+        return b"# exposition\n"
+
+    monkeypatch.setattr(metrics_router, "generate_latest", generate_latest)
+
+    first = client.get("/metrics/prometheus")
+    second = client.get("/metrics/prometheus")
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content == b"# exposition\n"
+    assert first.headers["content-type"].startswith(CONTENT_TYPE_LATEST)
+    assert calls == [REGISTRY]
+
+
+def test_prometheus_serves_the_default_registry(client):
+    response = client.get("/metrics/prometheus")
+
+    assert response.status_code == 200
+    assert b"python_info" in response.content
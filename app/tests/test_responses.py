@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from pydantic import TypeAdapter
+import orjson
+
+from app.models.feedback import AuditTrail
+from app.responses import model_from_row
+
+
+def test_model_from_row_skips_fields_the_row_lacks():
+    changed_at = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    # audit_trail has no session_id/ip_address/user_agent columns
+    row = SimpleNamespace(
+        id="a1", table_name="feedback_events", record_id="fb_1", action="UPDATE",
+        old_values=None, new_values={"status": "applied"}, changed_by="u1",
+        changed_at=changed_at, change_reason=None,
+    )
+
+    entry = model_from_row(AuditTrail, row)
+
+    assert entry.new_values == {"status": "applied"}
+    assert entry.session_id is None
+    body = orjson.loads(TypeAdapter(AuditTrail).dump_json(entry))
+    assert body["changed_at"] == "2024-01-15T00:00:00Z"
+    assert body["ip_address"] is None
@@ -5,7 +5,7 @@
     indexes=[
       {'columns': ['content_id'], 'type': 'btree'},
       {'columns': ['event_date'], 'type': 'btree'},
-      {'columns': ['channel', 'vertical'], 'type': 'btree'},
+      {'columns': ['channel', 'vertical', 'format', 'event_date'], 'type': 'btree'},
       {'columns': ['roi_tier'], 'type': 'btree'}
     ]
   )
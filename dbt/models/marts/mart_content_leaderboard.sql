@@ -0,0 +1,126 @@
+{{
+  config(
+    materialized='table',
+    schema='marts',
+    indexes=[
+      {'columns': ['roi_pct'], 'type': 'btree'},
+      {'columns': ['revenue'], 'type': 'btree'},
+      {'columns': ['engagement_rate_pct'], 'type': 'btree'},
+      {'columns': ['performance_score'], 'type': 'btree'},
+      {'columns': ['views'], 'type': 'btree'},
+      {'columns': ['conversions'], 'type': 'btree'},
+      {'columns': ['cost'], 'type': 'btree'},
+      {'columns': ['channel', 'vertical', 'format'], 'type': 'btree'},
+      {'columns': ['channel', 'roi_pct desc'], 'type': 'btree'},
+      {'columns': ['vertical', 'roi_pct desc'], 'type': 'btree'},
+      {'columns': ['roi_pct_rank'], 'type': 'btree'},
+      {'columns': ['revenue_rank'], 'type': 'btree'},
+      {'columns': ['engagement_rate_pct_rank'], 'type': 'btree'},
+      {'columns': ['performance_score_rank'], 'type': 'btree'},
+      {'columns': ['views_rank'], 'type': 'btree'},
+      {'columns': ['conversions_rank'], 'type': 'btree'},
+      {'columns': ['cost_rank'], 'type': 'btree'}
+    ]
+  )
+}}
+
+-- Lifetime, one-row-per-content leaderboard rebuilt with each dbt run.
+-- Every sort_by field has its own btree index, so "order by <field> limit k"
+-- is served by an index scan of k rows instead of aggregating and sorting
+-- mart_content_kpis per request; the (channel|vertical, roi_pct desc) indexes
+-- do the same for the default ROI sort under a single filter. Date-bounded
+-- leaderboards still need the daily mart.
+--
+-- <field>_rank is each row's position in the unfiltered descending leaderboard
+-- for that field (ties broken by content_id, as the API does), so the default
+-- top-N page of any depth is a range seek on the rank index rather than an
+-- OFFSET scan. Rebuild on a schedule with `make refresh-leaderboard`.
+
+with lifetime as (
+    select
+        content_id,
+        sum(views) as views,
+        sum(conversions) as conversions,
+        sum(total_revenue) as revenue,
+        sum(allocated_cost) as cost,
+        sum(total_revenue) - sum(allocated_cost) as net_profit,
+        case
+            when sum(impressions) > 0 then round(
+                (sum(likes) + sum(shares) + sum(comments))::numeric / sum(impressions) * 100, 2
+            )
+            else 0
+        end as engagement_rate_pct,
+        case
+            when sum(allocated_cost) > 0 then round(
+                (sum(total_revenue) - sum(allocated_cost)) / sum(allocated_cost) * 100, 2
+            )
+            else 0
+        end as roi_pct,
+        round(avg(performance_score), 1) as performance_score
+    from {{ ref('mart_content_kpis') }}
+    group by 1
+),
+
+-- Metadata and tiers as of the most recent day for each content item
+latest as (
+    select distinct on (content_id)
+        content_id,
+        title,
+        vertical,
+        format,
+        channel,
+        publish_dt as publish_date,
+        owner_team,
+        performance_tier,
+        engagement_tier
+    from {{ ref('mart_content_kpis') }}
+    order by content_id, event_date desc
+),
+
+final as (
+    select
+        l.content_id,
+        m.title,
+        m.vertical,
+        m.format,
+        m.channel,
+        m.publish_date,
+        m.owner_team,
+
+        l.roi_pct,
+        l.revenue,
+        l.cost,
+        l.net_profit,
+        l.views,
+        l.conversions,
+        l.engagement_rate_pct,
+        l.performance_score,
+
+        case
+            when l.roi_pct >= 100 then 'exceptional'
+            when l.roi_pct >= 50 then 'excellent'
+            when l.roi_pct >= 20 then 'good'
+            when l.roi_pct >= 0 then 'positive'
+            when l.roi_pct >= -20 then 'neutral'
+            else 'negative'
+        end as roi_tier,
+        m.performance_tier,
+        m.engagement_tier,
+
+        -- Precomputed descending ranks, one per sort field
+        row_number() over (order by l.roi_pct desc, l.content_id) as roi_pct_rank,
+        row_number() over (order by l.revenue desc, l.content_id) as revenue_rank,
+        row_number() over (order by l.engagement_rate_pct desc, l.content_id) as engagement_rate_pct_rank,
+        row_number() over (order by l.performance_score desc, l.content_id) as performance_score_rank,
+        row_number() over (order by l.views desc, l.content_id) as views_rank,
+        row_number() over (order by l.conversions desc, l.content_id) as conversions_rank,
+        row_number() over (order by l.cost desc, l.content_id) as cost_rank,
+
+        -- Data freshness
+        current_timestamp as calculated_at
+
+    from lifetime l
+    join latest m on l.content_id = m.content_id
+)
+
+select * from final
@@ -87,9 +87,15 @@ CREATE TABLE IF NOT EXISTS feedback_events (
     actor_role VARCHAR(100) NOT NULL CHECK (actor_role IN ('Finance', 'Strategy', 'Marketing', 'SalesOps', 'Data')),
     feedback_type VARCHAR(100) NOT NULL CHECK (feedback_type IN ('definition_correction', 'misattribution', 'override', 'rule_change')),
     payload JSONB NOT NULL,
+    description TEXT NOT NULL,
+    priority VARCHAR(20) DEFAULT 'medium',
+    business_impact TEXT,
+    expected_outcome TEXT,
+    evidence JSONB,
+    attachments JSONB,
     target_type VARCHAR(100) NOT NULL CHECK (target_type IN ('metric', 'content_id', 'rule_id', 'definition')),
     target_id VARCHAR(200),
-    status VARCHAR(50) DEFAULT 'pending' CHECK (status IN ('pending', 'approved', 'rejected', 'applied')),
+    status VARCHAR(50) DEFAULT 'pending' CHECK (status IN ('pending', 'under_review', 'approved', 'rejected', 'applied')),
     impact_analysis JSONB,
     applied_by VARCHAR(100),
     applied_at TIMESTAMP WITH TIME ZONE,
@@ -211,10 +217,11 @@ CREATE INDEX IF NOT EXISTS idx_content_vertical ON content(vertical);
 CREATE INDEX IF NOT EXISTS idx_engagement_content_dt ON engagement_events(content_id, event_dt);
 CREATE INDEX IF NOT EXISTS idx_costs_content_dt ON costs(content_id, cost_dt);
 CREATE INDEX IF NOT EXISTS idx_revenue_content_dt ON revenue(content_id, rev_dt);
-CREATE INDEX IF NOT EXISTS idx_feedback_status ON feedback_events(status);
+CREATE INDEX IF NOT EXISTS idx_feedback_status_created ON feedback_events(status, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_feedback_type ON feedback_events(feedback_type);
 CREATE INDEX IF NOT EXISTS idx_ml_predictions_content ON ml_predictions(content_id);
-CREATE INDEX IF NOT EXISTS idx_audit_trail_table_record ON audit_trail(table_name, record_id);
+CREATE INDEX IF NOT EXISTS idx_audit_trail_table_record_changed ON audit_trail(table_name, record_id, changed_at DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_trail_changed_at ON audit_trail(changed_at DESC);
 
 -- Create updated_at trigger function
 CREATE OR REPLACE FUNCTION update_updated_at_column()